@@ -0,0 +1,74 @@
+"""
+:mod: 'BookArelleWorker'
+~~~~~~~~~~~~~~~~~~~~~~~~
+
+..  py:module:: BookArelleWorker
+    :copyright: Copyright BitWorks LLC, All rights reserved.
+    :license: MIT
+    :synopsis: Long-lived Arelle process used by BookCntlr; loads Arelle once and serves commands over stdin/stdout
+    :description: Contains the following functions:
+
+        runArelle(arelle_args) - runs Arelle in this process, through CntlrCmdLine.parseAndRun, with the given command line arguments
+        main() - reads one command per line from stdin, replying 'OK' or 'ERR <message>' on stdout
+
+    Protocol (tab separated, one command per line):
+
+        VALIDATE <in_file>
+        FACTS <in_file> <out_file>
+        QUIT
+
+    Usage:
+
+    $ python BookArelleWorker.py <path to arelleCmdLine.py> <Arelle cache directory>
+
+    The cache directory is passed to Arelle as --xdgConfigHome, so downloaded taxonomies are reused by every command and every session
+"""
+
+try:
+    import contextlib, gettext, sys, os, logging
+    arelle_worker_logger = logging.getLogger()
+except Exception as err:
+    arelle_worker_logger.error("BookArelleWorker import error:{0}".format(str(err)))
+
+def runArelle(arelle_args):
+    # imported on first use, after main() has put the Arelle directory on sys.path; later calls reuse the loaded modules
+    from arelle import CntlrCmdLine
+    try:
+        CntlrCmdLine.parseAndRun(arelle_args)
+    except SystemExit as exit_status:
+        if exit_status.code not in (None, 0):
+            raise RuntimeError("Arelle exited with status {0}".format(exit_status.code))
+
+    return
+
+def main():
+    arelle_cmd_path = sys.argv[1]
+    cache_args = ["--xdgConfigHome={0}".format(sys.argv[2])]
+    # argument lists are fixed for the life of the worker; each command only appends its file names
+    validate_args = cache_args + ["-v", "-f"]
+    sys.path.insert(0, os.path.dirname(arelle_cmd_path))
+    gettext.install("arelle") #Arelle's option help strings use _()
+    reply_stream = sys.stdout
+    with open(os.devnull, "w") as arelle_output:
+        for line in sys.stdin:
+            command = line.rstrip("\n").split("\t")
+            if command[0] == "QUIT":
+                break
+            try:
+                # Arelle writes its own messages to stdout; keep them out of the reply stream
+                with contextlib.redirect_stdout(arelle_output):
+                    if command[0] == "VALIDATE":
+                        runArelle(validate_args + [command[1]])
+                    elif command[0] == "FACTS":
+                        runArelle(cache_args + ["--file=" + command[1], "--facts=" + command[2]])
+                    else:
+                        raise ValueError("unknown command {0}".format(command[0]))
+                reply_stream.write("OK\n")
+            except Exception as err:
+                reply_stream.write("ERR {0}\n".format(str(err).replace("\n", " ")))
+            reply_stream.flush()
+
+    return
+
+if __name__ == "__main__":
+    main()
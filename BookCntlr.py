@@ -9,9 +9,21 @@
     :description: Contains the following classes:
 
         BookCntlr - a QObject that uses python3 and Arelle to convert XBRL files into a single XML fact file, for parsing and import into database
+
+    Contains the following functions:
+
+        scanDir(root_dir, recursive) - generator; yields os.DirEntry objects for the non-hidden files under root_dir
+        isXbrlCandidateInstance(uri) - True when a file passes the cheap isXbrlCandidate prefilter and is an XBRL instance
+        findXbrlInstances(uri_list, instance_check) - returns the entries of uri_list for which instance_check is true, checking them on a thread pool
+        getWorkerCount() - number of concurrent Arelle jobs; read from the XBRLSTUDIO_WORKERS environment variable, defaulting to the cpu count
+        startArelleWorker(worker_cmd) - spawns a persistent BookArelleWorker process
+        stopArelleWorker(arelle_proc) - asks a BookArelleWorker process to quit and waits for it
+        sendArelleCommand(arelle_proc, command) - sends one command line to a BookArelleWorker process and waits for its reply
+        _runArelle(job) - worker function; runs Arelle validation and/or fact file generation for a single instance on a pooled BookArelleWorker; a fact file counts only when Arelle replied OK
 """
 try:
-    import subprocess, webbrowser, sys, os, datetime, logging
+    import array, subprocess, threading, webbrowser, queue, uuid, sys, os, logging
+    from concurrent.futures import ThreadPoolExecutor
     cntlr_logger = logging.getLogger()
     from PySide2 import QtCore
     # Tiered
@@ -19,7 +31,109 @@ try:
     # Flat
     import BookFilingManager, BookFilingUtility, BookModel
 except Exception as err:
-    cntlr_logger.error("{0}:BookCntlr import error:{1}".format(str(datetime.datetime.now()), str(err)))
+    cntlr_logger.error("BookCntlr import error:%s", err)
+
+#Arelle worker processes
+ARELLE_TIMEOUT = 600 #seconds allowed for a single Arelle command before its worker is killed
+SUBPROC_KW = dict(stderr = subprocess.DEVNULL, creationflags = getattr(subprocess, "CREATE_NO_WINDOW", 0)) #no console window, no stderr pipe to fill
+
+#Instance scan
+SCAN_MAX_WORKERS = 32 #threads reading file headers in findXbrlInstances
+
+def scanDir(root_dir, recursive):
+    # DirEntry.is_file()/is_dir() reuse the type returned with the directory listing, avoiding a stat per entry
+    with os.scandir(root_dir) as entries:
+        for entry in entries:
+            if entry.is_file():
+                if not entry.name.startswith("."):
+                    yield entry
+            elif recursive and entry.is_dir(follow_symlinks = False):
+                yield from scanDir(entry.path, recursive)
+
+def isXbrlCandidateInstance(uri):
+    try:
+        return BookFilingUtility.isXbrlCandidate(uri) and BookFilingUtility.isXbrlInstance(uri)
+    except Exception as err:
+        cntlr_logger.error("isXbrlCandidateInstance():%s", err)
+        return False
+
+def findXbrlInstances(uri_list, instance_check):
+    try:
+        # each check mostly waits on reading a file header; threads overlap those reads, and the order of uri_list is kept
+        with ThreadPoolExecutor(max_workers = min(SCAN_MAX_WORKERS, getWorkerCount() + 4)) as executor:
+            return [uri for uri, is_instance in zip(uri_list, executor.map(instance_check, uri_list)) if is_instance]
+    except Exception as err:
+        cntlr_logger.error("findXbrlInstances():%s", err)
+        return []
+
+def getWorkerCount():
+    try:
+        worker_count = int(os.environ.get("XBRLSTUDIO_WORKERS", 0))
+        if worker_count < 1:
+            worker_count = os.cpu_count() or 1
+        return worker_count
+    except Exception as err:
+        cntlr_logger.error("getWorkerCount():%s", err)
+        return 1
+
+def startArelleWorker(worker_cmd):
+    try:
+        return subprocess.Popen(worker_cmd, stdin = subprocess.PIPE, stdout = subprocess.PIPE, universal_newlines = True, **SUBPROC_KW)
+    except Exception as err:
+        cntlr_logger.error("startArelleWorker():%s", err)
+        return None
+
+def stopArelleWorker(arelle_proc):
+    try:
+        if arelle_proc is not None and arelle_proc.poll() is None:
+            arelle_proc.stdin.write("QUIT\n")
+            arelle_proc.stdin.flush()
+            arelle_proc.wait(timeout = ARELLE_TIMEOUT)
+    except subprocess.TimeoutExpired:
+        arelle_proc.kill()
+    except Exception as err:
+        cntlr_logger.error("stopArelleWorker():%s", err)
+
+    return
+
+def sendArelleCommand(arelle_proc, command):
+    # a filing that hangs Arelle gets its worker killed, which ends the readline below; the next job respawns the worker
+    watchdog = threading.Timer(ARELLE_TIMEOUT, arelle_proc.kill)
+    try:
+        watchdog.start()
+        arelle_proc.stdin.write("\t".join(command) + "\n")
+        arelle_proc.stdin.flush()
+        reply = arelle_proc.stdout.readline().rstrip("\n")
+        if reply != "OK":
+            cntlr_logger.error("sendArelleCommand():%s %s", " ".join(command), reply)
+            return False
+        return True
+    except Exception as err:
+        cntlr_logger.error("sendArelleCommand():%s", err)
+        return False
+    finally:
+        watchdog.cancel()
+
+def _runArelle(job):
+    arelle_workers, worker_cmd, cleanup_queue, in_file, out_file, validate, importation = job
+    arelle_proc = arelle_workers.get()
+    try:
+        if arelle_proc is None or arelle_proc.poll() is not None:
+            arelle_proc = startArelleWorker(worker_cmd)
+        if validate == True:
+            sendArelleCommand(arelle_proc, ["VALIDATE", in_file])
+        if importation == True:
+            facts_ok = sendArelleCommand(arelle_proc, ["FACTS", in_file, out_file])
+            fact_file_exists = os.path.isfile(out_file)
+            if not facts_ok and fact_file_exists:
+                cleanup_queue.put(out_file) #cut short by the watchdog or an ERR reply; not a complete fact file
+            return in_file, out_file, facts_ok and fact_file_exists
+        return in_file, out_file, False
+    except Exception as err:
+        cntlr_logger.error("_runArelle():%s", err)
+        return in_file, out_file, False
+    finally:
+        arelle_workers.put(arelle_proc)
 
 class BookCntlr(QtCore.QObject):
     """
@@ -34,10 +148,20 @@ class BookCntlr(QtCore.QObject):
     closeDb(self) - close current database using the book filing manager
     updateParentInfo(self, child_cik, parent_cik) - sets the parent_cik for the entity with child_cik using the book filing manager
     processXbrl(self, mode, validate, importation, f_list, root_dir) - slot; used for processing Xbrl with options as arguments
-    processInstances(self, f_list_instances, validate, importation) - called by processXbrl; imports fact files one by one as Filing objects
+    flushBatchResults(self) - called by processXbrl; hands fact files needing manual input or a CIK choice over to the main window, as (path_tab, indices) tuples
+    resetBatchResults(self) - starts empty path_tab, manual_import_items and multiple_cik_items for a new batch
+    internPath(self, target_path) - returns the index of target_path in path_tab, adding it if needed
+    processInstances(self, f_list_instances, validate, importation) - called by processXbrl; runs Arelle over the instances in a worker pool, checks each fact file as it is produced, then imports the accepted ones in a single transaction
+    cleanupLoop(self) - cleanup_thread target; deletes the fact files put on cleanup_queue
+    startArelleWorkers(self, worker_count) - makes room for worker_count persistent Arelle processes (spawned on first use)
+    stopArelleWorkers(self) - stops all persistent Arelle processes
     getFiling(self, target_cik, target_period) - query the current database to select a filing, given a cik and period
     getFilingInfo(self, filing) - get critical information about a particular filing
     getNameFromCik(self, target_cik) - translate cik into entity_name
+    getEntityNames(self) - returns the names of all entities in the current database, for the entity editors of the table views
+    scheduleRefresh(self) - marks the views dirty and (re)starts the debounced refresh of the main window
+    refreshViews(self) - refresh_timer slot; refreshes the main window once for any number of scheduled refreshes
+    clearCaches(self) - drops memoized entity names, the entity name list and filings; called whenever the database changes
     removeEntity(self, target_cik) - remove an entity and its children from all tables in the current database
     removeFiling(self, filing_selection) - remove a filing item and its children from all tables in the current database
     renameEntity(self, target_cik, new_name) - rename an entity in the current database
@@ -49,6 +173,22 @@ class BookCntlr(QtCore.QObject):
     warnUser_signal (signal type); implemented to warn the user whenever something goes awry with XBRL processing or importation
     book_filing_manager (BookFilingManager.BookFilingManager type); manages database connections and utilities, and filing utilities
     book_main_window (BookView.BookMainWindow type); controller's access to main window for application
+    arelle_worker_cmd (list type); command line used to spawn a persistent BookArelleWorker process
+    arelle_workers (queue.Queue type); idle BookArelleWorker processes (None until a worker is first used)
+    arelle_worker_count (int type); number of BookArelleWorker slots in arelle_workers
+    cleanup_queue (queue.Queue type); imported fact files waiting to be deleted by cleanup_thread
+    cleanup_thread (threading.Thread type); daemon thread running cleanupLoop
+    status_timer (QtCore.QElapsedTimer type); time since the last status bar update emitted by processInstances (at most one per 100 ms)
+    refresh_timer (QtCore.QTimer type); single-shot timer coalescing main window refreshes after database changes
+    refresh_dirty (bool type); True when a refresh has been scheduled but not yet performed
+    name_cache (dict type); memoized getNameFromCik results {entity_cik:entity_name}
+    filing_cache (dict type); memoized getFiling results {(entity_cik, period):Filing}, holding at most filing_cache_size filings
+    filing_cache_size (int type); maximum number of filings kept in filing_cache
+    entity_names (list type); memoized getEntityNames result (None until first requested); replaced, never modified in place
+    path_tab (list type); fact file paths referenced by manual_import_items and multiple_cik_items, each stored once
+    path_tab_map (dict type); index of each path in path_tab {path:index}
+    manual_import_items (array.array type); path_tab indices of fact files that need manual entity information
+    multiple_cik_items (array.array type); path_tab indices of fact files that contain more than one CIK
     in_file (string type); XBRL instance file for the generation of a fact file by Arelle
     out_file (string type); new (temporary) fact file generated by Arelle for parsing and import into database (full path)
     modelManager (Arelle type); XBRL model manager
@@ -70,7 +210,7 @@ class BookCntlr(QtCore.QObject):
     multiple_cik_signal = QtCore.Signal(["PyQt_PyObject"])
 
     def __init__(self, book_main_window):
-        cntlr_logger.info("{0}:Initializing BookCntlr".format(str(datetime.datetime.now())))
+        cntlr_logger.info("Initializing BookCntlr")
         QtCore.QObject.__init__(self)
         self.setObjectName("BookCntlr")
         self.book_filing_manager = BookFilingManager.BookFilingManager(book_main_window = book_main_window)
@@ -79,33 +219,57 @@ class BookCntlr(QtCore.QObject):
         self.arelle_cmd_path = os.path.join(self.book_main_window.directories.get("Global_arelle_dir"), "arelleCmdLine.py")
         # Flat
         # self.arelle_cmd_path = os.path.join(os.getcwd(), "res", "Arelle", "arelleCmdLine.py")
+        self.arelle_worker_cmd = [self.book_main_window.directories.get("Global_python_dir"), "-B",
+                                  os.path.join(self.book_main_window.directories.get("Global_app_dir"), "BookArelleWorker.py"),
+                                  self.arelle_cmd_path,
+                                  self.book_main_window.directories.get("Global_cache_dir")]
+        self.arelle_workers = queue.Queue()
+        self.arelle_worker_count = 0
+        self.cleanup_queue = queue.Queue()
+        self.cleanup_thread = threading.Thread(target = self.cleanupLoop, daemon = True)
+        self.cleanup_thread.start()
+        self.status_timer = QtCore.QElapsedTimer()
+        self.status_timer.start()
+        self.refresh_timer = QtCore.QTimer(self)
+        self.refresh_timer.setSingleShot(True)
+        self.refresh_timer.timeout.connect(self.refreshViews)
+        self.refresh_dirty = False
+        self.name_cache = {}
+        self.filing_cache = {}
+        self.filing_cache_size = 16
+        self.entity_names = None
+        self.resetBatchResults()
 
     def newDb(self):
         try:
+            self.clearCaches()
             return self.book_filing_manager.initDb()
         except Exception as err:
-            cntlr_logger.error("{0}:BookCntlr.newDb():{1}".format(str(datetime.datetime.now()), str(err)))
+            cntlr_logger.error("BookCntlr.newDb():%s", err)
             return False
 
     def openDb(self):
         try:
+            self.clearCaches()
             return self.book_filing_manager.initDb()
         except Exception as err:
-            cntlr_logger.error("{0}:BookCntlr.openDb():{1}".format(str(datetime.datetime.now()), str(err)))
+            cntlr_logger.error("BookCntlr.openDb():%s", err)
             return False
 
     def closeDb(self):
         try:
+            self.clearCaches()
+            self.stopArelleWorkers()
             return self.book_filing_manager.initDb(close = True)
         except Exception as err:
-            cntlr_logger.error("{0}:BookCntlr.closeDb():{1}".format(str(datetime.datetime.now()), str(err)))
+            cntlr_logger.error("BookCntlr.closeDb():%s", err)
             return False
 
     def updateParentInfo(self, child_cik, parent_cik):
         try:
             return self.book_filing_manager.updateParentInfo(child_cik, parent_cik)
         except Exception as err:
-            cntlr_logger.error("{0}:BookCntlr.updateParentInfo():{1}".format(str(datetime.datetime.now()), str(err)))
+            cntlr_logger.error("BookCntlr.updateParentInfo():%s", err)
             return False
 
     #Slot: self.book_main_window.cntlr_processXbrl_start_signal
@@ -116,153 +280,272 @@ class BookCntlr(QtCore.QObject):
             if mode == "File":
                 if len(f_list) == 0:
                     return
-                for entry in f_list:
-                    if BookFilingUtility.isXbrlInstance(entry):
-                        f_list_instances.append(entry)
+                f_list_instances = findXbrlInstances(f_list, BookFilingUtility.isXbrlInstance)
                 self.processInstances(f_list_instances, validate, importation)
-                if len(self.manual_import_items) > 0:
-                    self.manual_import_signal.emit(self.manual_import_items)
-                    self.manual_import_items = []
-                if len(self.multiple_cik_items) > 0:
-                    self.multiple_cik_signal.emit(self.multiple_cik_items)
-                    self.multiple_cik_items = []
+                self.flushBatchResults()
             elif mode == "Folder":
                 if len(root_dir) == 0:
                     return
                 if self.book_main_window.pref.import_dir_recursive_option == "Search top folder and sub-folders":
-                    for root, dirs, files in os.walk(root_dir):
-                        for file in files:
-                            if not file.startswith(".") and BookFilingUtility.isXbrlInstance(os.path.join(root, file)):
-                                f_list_instances.append(os.path.join(root, file))
+                    f_list_instances = findXbrlInstances([entry.path for entry in scanDir(root_dir, recursive = True)], isXbrlCandidateInstance)
                     self.processInstances(f_list_instances, validate, importation)
-                    if len(self.manual_import_items) > 0:
-                        self.manual_import_signal.emit(self.manual_import_items)
-                        self.manual_import_items = []
-                    if len(self.multiple_cik_items) > 0:
-                        self.multiple_cik_signal.emit(self.multiple_cik_items)
-                        self.multiple_cik_items = []
+                    self.flushBatchResults()
                 elif self.book_main_window.pref.import_dir_recursive_option == "Search top folder only":
-                    files_folders = os.listdir(root_dir)
-                    for item in files_folders:
-                        if os.path.isfile(os.path.join(root_dir, item)):
-                            if not item.startswith(".") and BookFilingUtility.isXbrlInstance(os.path.join(root_dir, item)):
-                                f_list_instances.append(os.path.join(root_dir, item))
-                            else:
-                                cntlr_logger.error("{0}:BookCntlr.processXbrl():{1}".format(str(datetime.datetime.now()), "invalid file ('.' and instance)"))
-                        else:
-                            cntlr_logger.error("{0}:BookCntlr.processXbrl():{1}".format(str(datetime.datetime.now()), "invalid file (isfile)"))
+                    f_list_instances = findXbrlInstances([entry.path for entry in scanDir(root_dir, recursive = False)], isXbrlCandidateInstance)
                     self.processInstances(f_list_instances, validate, importation)
-                    if len(self.manual_import_items) > 0:
-                        self.manual_import_signal.emit(self.manual_import_items)
-                        self.manual_import_items = []
-                    if len(self.multiple_cik_items) > 0:
-                        self.multiple_cik_signal.emit(self.multiple_cik_items)
-                        self.multiple_cik_items = []
+                    self.flushBatchResults()
                 else:
-                    cntlr_logger.error("{0}:BookCntlr.processXbrl():{1}".format(str(datetime.datetime.now()), "invalid import_dir_recursive_option"))
+                    cntlr_logger.error("BookCntlr.processXbrl():%s", "invalid import_dir_recursive_option")
             else:
-                cntlr_logger.error("{0}:BookCntlr.processXbrl():{1}".format(str(datetime.datetime.now()), "invalid mode"))
+                cntlr_logger.error("BookCntlr.processXbrl():%s", "invalid mode")
             self.processXbrl_finish_signal.emit(importation)
         except Exception as err:
-            cntlr_logger.error("{0}:BookCntlr.processXbrl():{1}".format(str(datetime.datetime.now()), str(err)))
+            cntlr_logger.error("BookCntlr.processXbrl():%s", err)
 
         return
 
+    def flushBatchResults(self):
+        try:
+            if len(self.manual_import_items) > 0:
+                self.manual_import_signal.emit((self.path_tab, self.manual_import_items))
+            if len(self.multiple_cik_items) > 0:
+                self.multiple_cik_signal.emit((self.path_tab, self.multiple_cik_items))
+            self.resetBatchResults()
+        except Exception as err:
+            cntlr_logger.error("BookCntlr.flushBatchResults():%s", err)
+
+        return
+
+    def resetBatchResults(self):
+        # new containers rather than clearing, the main window may still hold the emitted ones
+        self.path_tab = []
+        self.path_tab_map = {}
+        self.manual_import_items = array.array("I")
+        self.multiple_cik_items = array.array("I")
+
+        return
+
+    def internPath(self, target_path):
+        try:
+            path_index = self.path_tab_map.get(target_path)
+            if path_index is None:
+                path_index = len(self.path_tab)
+                self.path_tab.append(target_path)
+                self.path_tab_map[target_path] = path_index
+            return path_index
+        except Exception as err:
+            cntlr_logger.error("BookCntlr.internPath():%s", err)
+
     def processInstances(self, f_list_instances, validate, importation):
-        Global_python_dir = self.book_main_window.directories.get("Global_python_dir")
-        self.manual_import_items = []
-        self.multiple_cik_items = []
+        self.resetBatchResults()
         try:
             entity_cik = None
             if len(f_list_instances) > 0:
                 progress_count = 1
+                last_progress = -1
                 f_list_count = len(f_list_instances)
+                worker_count = min(getWorkerCount(), f_list_count)
+                self.startArelleWorkers(worker_count)
+                tmp_dir = self.book_main_window.directories.get("Global_tmp_dir")
+                jobs = []
                 for instance in f_list_instances:
-                    progress_count += 1
-                    self.in_file = instance
-                    self.out_file = os.path.join(self.book_main_window.directories.get("Global_tmp_dir"), os.path.split(self.in_file)[1])
-                    if validate == True:
-                        commands = [os.path.join(Global_python_dir), "-B", self.arelle_cmd_path, "-v", "-f", self.in_file]
-                        result = subprocess.run(commands)
-                    if importation == True:
-                        commands = [os.path.join(Global_python_dir), "-B", self.arelle_cmd_path, "--file={0}".format(self.in_file), "--facts={0}".format(self.out_file)]
-                        result = subprocess.run(commands)
-                        if os.path.isfile(self.out_file):
-                            filing_importable = BookFilingUtility.isImportable(self.out_file)
-                            if not filing_importable:
-                                self.manual_import_items.append(self.out_file)
-                            else:
-                                target_filing = BookFilingUtility.parseFactFile(self.out_file)
-                                target_cik_list, target_parent_cik, target_name, target_period = BookFilingUtility.getFilingInfo(target_filing)
-                                if len(target_cik_list) > 1:
-                                    self.multiple_cik_items.append(self.out_file)
-                                    self.view_status_bar_update_signal.emit("Importing {0}, {1} of {2} total XBRL filings.".format(os.path.split(self.in_file)[1], progress_count - 1, f_list_count))
+                    # a unique name per run, so concurrent workers never write to (or wait on) the same fact file
+                    out_root, out_ext = os.path.splitext(os.path.basename(instance))
+                    out_file = os.path.join(tmp_dir, "{0}.{1}{2}".format(out_root, uuid.uuid4().hex, out_ext))
+                    jobs.append((self.arelle_workers, self.arelle_worker_cmd, self.cleanup_queue, instance, out_file, validate, importation))
+                # Arelle runs concurrently; each fact file is checked here, in order, as its run completes. Only the dei
+                # facts are read at this point, and any overwrite prompt is answered before the database is written to
+                import_items = [] #(instance, fact file, cik, period) to import, in order
+                with ThreadPoolExecutor(max_workers = worker_count) as executor:
+                    arelle_runs = [executor.submit(_runArelle, job) for job in jobs]
+                    try:
+                        for arelle_run in arelle_runs:
+                            in_file, out_file, fact_file_exists = arelle_run.result()
+                            progress_count += 1
+                            self.in_file = in_file
+                            self.out_file = out_file
+                            if fact_file_exists:
+                                filing_importable, dei_filing, target_cik_list, target_parent_cik, target_name, target_period = BookFilingUtility.readFilingInfo(self.out_file)
+                                if not filing_importable:
+                                    self.manual_import_items.append(self.internPath(self.out_file))
+                                elif len(target_cik_list) > 1:
+                                    self.multiple_cik_items.append(self.internPath(self.out_file))
                                 elif len(target_cik_list) == 1:
                                     entity_cik = target_cik_list[0]
-                                    self.view_status_bar_update_signal.emit("Importing {0}, {1} of {2} total XBRL filings.".format(os.path.split(self.in_file)[1], progress_count - 1, f_list_count))
-                                    self.book_filing_manager.importFactFile(self.out_file, entity_cik)
-                                    os.remove(self.out_file)
-                    self.book_main_window.updateProgressBar(int(100 * progress_count / f_list_count))
+                                    if self.book_filing_manager.confirmImport(self.out_file, entity_cik, dei_filing):
+                                        import_items.append((self.in_file, self.out_file, entity_cik, target_period))
+                                    else:
+                                        self.cleanup_queue.put(self.out_file)
+                            # repaint the progress bar only when the integer percentage changes
+                            progress = 100 * progress_count // f_list_count
+                            if progress != last_progress:
+                                last_progress = progress
+                                self.book_main_window.updateProgressBar(progress)
+                    except Exception:
+                        # the executor's exit would otherwise wait for every queued Arelle job
+                        for arelle_run in arelle_runs:
+                            arelle_run.cancel()
+                        raise
+                # tables created inside the transaction would survive its rollback, so the missing years are made first
+                self.book_filing_manager.makeFilingsTables([import_item[3] for import_item in import_items])
+                # All imports of the batch share one transaction (committed at the end, rolled back if any import fails)
+                try:
+                    with self.book_filing_manager.bulkTransaction():
+                        for import_count, (in_file, out_file, entity_cik, target_period) in enumerate(import_items, 1):
+                            # status bar messages are rate limited
+                            if self.status_timer.elapsed() > 100:
+                                self.view_status_bar_update_signal.emit("Importing {0}, {1} of {2} XBRL filings.".format(os.path.basename(in_file), import_count, len(import_items)))
+                                self.status_timer.restart()
+                            self.book_filing_manager.importFactFile(out_file, entity_cik)
+                except Exception as err:
+                    cntlr_logger.error("BookCntlr.processInstances():%s", err)
+                    self.warnUser_signal.emit("Processing Error", "Import failed. None of the filings were imported.")
+                finally:
+                    # only once the batch is committed or rolled back; the uuid-named fact files are of no further use either way
+                    for in_file, out_file, entity_cik, target_period in import_items:
+                        self.cleanup_queue.put(out_file)
+                self.clearCaches()
             else:
-                cntlr_logger.error("{0}:BookCntlr.processInstances():{1}".format(str(datetime.datetime.now()), "Processing error - no instances found"))
+                cntlr_logger.error("BookCntlr.processInstances():%s", "Processing error - no instances found")
                 self.warnUser_signal.emit("Invalid Selection", "No instances found. Select XBRL instance file(s) to import. Each instance must have a complete DTS in the same directory.")
                 return
             self.book_main_window.resetProgressBar()
         except Exception as err:
-            cntlr_logger.error("{0}:BookCntlr.processInstances():{1}".format(str(datetime.datetime.now()), str(err)))
+            self.clearCaches()
+            self.book_main_window.resetProgressBar()
+            cntlr_logger.error("BookCntlr.processInstances():%s", err)
+
+        return
+
+    def cleanupLoop(self):
+        # deleting on this thread keeps the import loop from blocking while Arelle's handle on the file is released
+        while True:
+            target_file = self.cleanup_queue.get()
+            try:
+                os.remove(target_file)
+            except Exception as err:
+                cntlr_logger.error("BookCntlr.cleanupLoop():%s", err)
+
+    def startArelleWorkers(self, worker_count):
+        try:
+            while self.arelle_worker_count < worker_count:
+                self.arelle_workers.put(None)
+                self.arelle_worker_count += 1
+        except Exception as err:
+            cntlr_logger.error("BookCntlr.startArelleWorkers():%s", err)
+
+        return
+
+    def stopArelleWorkers(self):
+        try:
+            while not self.arelle_workers.empty():
+                stopArelleWorker(self.arelle_workers.get())
+            self.arelle_worker_count = 0
+        except Exception as err:
+            cntlr_logger.error("BookCntlr.stopArelleWorkers():%s", err)
 
         return
 
     def getFiling(self, target_cik, target_period):
         try:
-            return self.book_filing_manager.getFiling(target_cik, target_period)
+            filing_key = (int(target_cik), target_period)
+            if filing_key in self.filing_cache:
+                return self.filing_cache[filing_key]
+            filing = self.book_filing_manager.getFiling(target_cik, target_period)
+            if filing is not None:
+                if len(self.filing_cache) >= self.filing_cache_size:
+                    del self.filing_cache[next(iter(self.filing_cache))]
+                self.filing_cache[filing_key] = filing
+            return filing
         except Exception as err:
-            cntlr_logger.error("{0}:BookCntlr.getFiling():{1}".format(str(datetime.datetime.now()), str(err)))
+            cntlr_logger.error("BookCntlr.getFiling():%s", err)
             return None
 
     def getFilingInfo(self, filing):
         try:
             return self.book_filing_manager.getFilingInfo(filing)
         except Exception as err:
-            cntlr_logger.error("{0}:BookCntlr.getFilingInfo():{1}".format(str(datetime.datetime.now()), str(err)))
+            cntlr_logger.error("BookCntlr.getFilingInfo():%s", err)
             return None
 
     def getNameFromCik(self, target_cik):
         try:
-            return self.book_filing_manager.getNameFromCik(target_cik)
+            target_cik = int(target_cik)
+            if target_cik in self.name_cache:
+                return self.name_cache[target_cik]
+            entity_name = self.book_filing_manager.getNameFromCik(target_cik)
+            if entity_name is not None:
+                self.name_cache[target_cik] = entity_name
+            return entity_name
         except Exception as err:
-            cntlr_logger.error("{0}:BookCntlr.getNameFromCik():{1}".format(str(datetime.datetime.now()), str(err)))
+            cntlr_logger.error("BookCntlr.getNameFromCik():%s", err)
             return None
 
+    def getEntityNames(self):
+        try:
+            if self.entity_names is None:
+                self.entity_names = [entity_info[2] for entity_info in self.book_filing_manager.getEntityTreeInfo()]
+            return self.entity_names
+        except Exception as err:
+            cntlr_logger.error("BookCntlr.getEntityNames():%s", err)
+            return []
+
+    def scheduleRefresh(self):
+        try:
+            self.refresh_dirty = True
+            self.refresh_timer.start(50)
+        except Exception as err:
+            cntlr_logger.error("BookCntlr.scheduleRefresh():%s", err)
+
+        return
+
+    def refreshViews(self):
+        try:
+            if self.refresh_dirty:
+                self.refresh_dirty = False
+                self.book_main_window.refreshAll()
+        except Exception as err:
+            cntlr_logger.error("BookCntlr.refreshViews():%s", err)
+
+        return
+
+    def clearCaches(self):
+        try:
+            self.name_cache.clear()
+            self.filing_cache.clear()
+            self.entity_names = None
+        except Exception as err:
+            cntlr_logger.error("BookCntlr.clearCaches():%s", err)
+
+        return
+
     def removeEntity(self, target_cik):
         try:
             self.book_filing_manager.removeEntity(target_cik)
-            self.openDb()
-            self.book_main_window.refreshAll()
+            self.clearCaches()
+            self.scheduleRefresh()
         except Exception as err:
-            cntlr_logger.error("{0}:BookCntlr.removeEntity():{1}".format(str(datetime.datetime.now()), str(err)))
+            cntlr_logger.error("BookCntlr.removeEntity():%s", err)
 
         return
 
     def removeFiling(self, filing_selection):
         try:
             current_cik = filing_selection.cik
-            if len(filing_selection.period) > 4:
-                current_period = filing_selection.period.split("-")[1].lower() + filing_selection.period.split("-")[0]
-            else:
-                current_period = filing_selection.period
+            current_period = BookFilingUtility.getRawPeriod(filing_selection.period)
             self.book_filing_manager.removeFiling(current_cik, current_period)
-            self.openDb()
-            self.book_main_window.refreshAll()
+            self.filing_cache.clear()
+            self.scheduleRefresh()
         except Exception as err:
-            cntlr_logger.error("{0}:BookCntlr.removeFiling():{1}".format(str(datetime.datetime.now()), str(err)))
+            cntlr_logger.error("BookCntlr.removeFiling():%s", err)
 
         return
 
     def renameEntity(self, target_cik, new_name):
         try:
             self.book_filing_manager.renameEntity(target_cik, new_name)
-            self.openDb()
-            self.book_main_window.refreshAll()
+            self.name_cache[int(target_cik)] = str(new_name)
+            self.entity_names = None
+            self.scheduleRefresh()
         except Exception as err:
-            cntlr_logger.error("{0}:BookCntlr.renameEntity():{1}".format(str(datetime.datetime.now()), str(err)))
+            cntlr_logger.error("BookCntlr.renameEntity():%s", err)
@@ -8,149 +8,410 @@
     :synopsis: SQLAlchemy ORM engine, metadata, and utility functions for working with dynamic sqlite databases
     :description: Contains the following functions:
 
-        makeEntityTable - creates table 'entities' - columns = entity_cik, parent_cik, entity_name
-        makeFilingsTable - creates table 'filings####' - columns = entity_cik, q1, q2, q3, q4
-        getAllTables - returns a list of all SQLAlchemy Table objects
-        tableExists - determines whether a given table name exists in the database
+        buildEngine - (re)creates the module-level Engine and MetaData for a database file; pooled connections are reused between calls
+        buildStatements - builds the reusable statements on the 'entities' table; called whenever that table is loaded or created
+        setPragmas - Engine 'connect' listener; applies the sqlite PRAGMAs to every new DBAPI connection
+        getConnection - returns the open batch connection, if any, otherwise a new connection from the Engine
+        releaseConnection - closes a connection returned by getConnection, unless it is the batch connection
+        beginBatch - opens a connection and transaction shared by all db_util functions until commitBatch or rollbackBatch
+        commitBatch - commits and closes the batch transaction
+        rollbackBatch - rolls back and closes the batch transaction; re-reads the schema, in case tables created in the batch are gone
+        transaction - context manager; runs its block in the batch transaction, starting (and committing) one if none is open
+        pooledConnection - context manager; yields getConnection() and releases it on exit, also when its block raises
+        loadSchema - rebuilds the module-level MetaData from the names of the tables in the database, without reflecting their columns
+        defineEntityTable - adds the Table object for 'entities' to the module-level MetaData
+        defineFilingsTable - adds the Table object for a 'filings####' table to the module-level MetaData
+        makeEntityTable - creates table 'entities' - columns = entity_cik, parent_cik (indexed), entity_name
+        makeFilingsTable - creates table 'filings####' - columns = entity_cik, q1, q2, q3, q4; returns its Table object
+        makeFilingsTables - creates the missing 'filings####' tables for a list of periods; called before a batch, whose rollback would not undo them
+        dropTable - drops a table from the database and forgets it in the module-level MetaData
+        dropEmptyFilingsTables - drops the 'filings####' tables that have no rows, found with a single query
+        refreshFilingsTables - rebuilds Global_filings_tables from the module-level MetaData; called whenever a table is created or dropped
+        tableExists - determines whether a given table name exists in the database, from the module-level MetaData
         getEntityTreeInfo - returns list of tuples, where each tuple is a row [(entity_cik, parent_cik, entity_name)]
         getNameFromCik - uses a given cik to get an entity_name from the database
         updateEntityParent - updates the parent cik of a given child cik; used when user alters entity tree view hierarchy
         getEntityDict - returns a dict of the format {entity_name:entity_cik}, for all entities in database
         getFilingTreeInfo - returns list of strings, where each string corresponds to a filing available for viewing
+        dumpFiling - returns the stored form of a filing: pickled with the highest protocol, zlib compressed as it is pickled
+        loadFiling - returns the Filing object held in a quarter cell, also reading uncompressed cells and cells pickled twice by older versions
         selectFromDatabase - given a cik and filing period, selects a Filing object from the database
-        existsInDatabase - determines whether a given filing exists in the database
+        existsInDatabase - determines whether a given filing exists in the database; takes the Filing object when the caller has already parsed the fact file
         manualExistsInDatabase - determines whether a given filing exists in the database, with input from user
-        addToEntitiesTable - updates 'entities' table to include a given entity, if not present
-        addToFilingsTable - updates a 'filings####' table to include a given filing, if not present
-        addToDatabase - adds a given fact file to the database in the form of a pickled Filing object
-        manualAddToDatabase - adds a given fact file to the database in the form of a pickled Filing object, with input from user
-        countEntityAndChildren - determines the breadth and depth of an entity tree in the database, used for status bar updates
-        removeEntityFromDatabase - removes a given entity (and all its children) from the database; currently an expensive function
-        removeFilingFromDatabase - removes a given filing item (and all its children) from the database; currently also expensive
-        updateEntityName - updates the name of an entity to that disclosed in the latest available filing
+        addToEntitiesTable - updates 'entities' table to include a given entity, if not present (INSERT OR IGNORE); raises on failure
+        addToFilingsTable - inserts a given filing into a given 'filings####' Table, or replaces the one in its quarter (a single upsert on sqlite 3.24 and later); raises on failure
+        addToDatabase - parses a given fact file and adds it to the database in the form of a pickled Filing object; raises on failure, so an open batch is rolled back
+        manualAddToDatabase - adds a given fact file to the database in the form of a pickled Filing object, with input from user; raises on failure, so an open batch is rolled back
+        getEntityAndChildren - returns the ciks of a given entity and all its children, using a recursive query
+        getRemovalStatement - returns the cached statement deleting rows (or clearing one quarter) of a table for a list of ciks
+        removeEntityFromDatabase - removes a given entity (and all its children) from the database, with one DELETE per table
+        removeFilingFromDatabase - removes a given filing item (and all its children) from the database, for one cik or a list of ciks
+        updateEntityName - updates the name of an entity to that disclosed in the latest available filing; uses the given filing when it is the latest
+        reclaimSpace - returns the pages freed by a removal to the file system, without rewriting the whole database
+        getLastFilingPeriod - returns the period (e.g., 'q42016') of the latest filing for a particular entity, without loading any filing
         getLastFiling - returns the latest filing for a particular entity
         renameEntityInDatabase(target_cik, new_entity_name) - manual replacement of the entity name with new_entity_name in the database
 """
 
 try:
-    import pickle, sys, os, datetime, logging
+    import contextlib, pickle, sqlite3, types, zlib, sys, os, logging
     database_utility_logger = logging.getLogger()
-    from sqlalchemy import (create_engine, Table, Column, Integer, String, PickleType)
+    from sqlalchemy import (create_engine, event, select, text, bindparam, Table, Column, Integer, String, LargeBinary)
     from sqlalchemy.schema import MetaData
-    from sqlalchemy.pool import NullPool
+    from sqlalchemy.pool import QueuePool, SingletonThreadPool
     # Tiered
     # from . import (BookFilingUtility)
     # Flat
     import BookFilingUtility
 except Exception as err:
-    database_utility_logger.error("{0}:BookDatabaseUtility import error:{1}".format(str(datetime.datetime.now()), str(err)))
+    database_utility_logger.error("BookDatabaseUtility import error:%s", err)
+
+Engine = None
+Global_batch_connection = None
+Global_batch_transaction = None
+Global_filings_tables = [] #'filings####' Table objects, oldest year first
+Global_entity_statements = {} #statements on 'entities', built once per database by buildStatements; values are bound at execution
+Global_quarter_statements = {} #{(table_name, quarter):select statement}, built on first use by selectFromDatabase
+Global_upsert_statements = {} #{(table_name, quarter):statement (or (update, insert) without upsert support)}, built on first use by addToFilingsTable
+Global_removal_statements = {} #{(table_name, quarter or None):update or delete statement}, built on first use by getRemovalStatement
+Global_filing_tree_stmt = None #UNION ALL over every filings table, used by getFilingTreeInfo; rebuilt by refreshFilingsTables
+Global_last_filing_stmt = None #UNION ALL over every filings table, used by getLastFiling; rebuilt by refreshFilingsTables
+Global_last_period_stmt = None #UNION ALL over every filings table, used by getLastFilingPeriod; rebuilt by refreshFilingsTables
+
+ZLIB_LEVEL = 1 #filings are compressed once per import and read many times; higher levels cost more than they save
+ZLIB_MAGIC = b"\x78" #first byte of a zlib stream with the default window size
+SQLITE_UPSERT = sqlite3.sqlite_version_info >= (3, 24, 0) #INSERT ... ON CONFLICT DO UPDATE
+
+#cik of an entity and of all its descendants, in a single query; UNION (not UNION ALL) also stops on a parent_cik cycle
+ENTITY_TREE_STMT = text("WITH RECURSIVE entity_tree(cik) AS ("
+                        "SELECT entity_cik FROM entities WHERE entity_cik = :root "
+                        "UNION "
+                        "SELECT entities.entity_cik FROM entities JOIN entity_tree ON entities.parent_cik = entity_tree.cik) "
+                        "SELECT cik FROM entity_tree")
+
+REMOVAL_CHUNK_SIZE = 500 #ciks bound per removal statement; sqlite before 3.32 allows at most 999 parameters
+VACUUM_FREE_RATIO = 0.25 #databases without incremental auto_vacuum are only rewritten once this share of their pages is free
+
+#applied to each new sqlite connection; pooled connections keep them, so they are paid once per connection
+SQLITE_PRAGMAS = ("PRAGMA auto_vacuum=INCREMENTAL", #takes effect on new databases; existing ones switch at their next VACUUM
+                  "PRAGMA journal_mode=WAL",
+                  "PRAGMA synchronous=NORMAL",
+                  "PRAGMA temp_store=MEMORY",
+                  "PRAGMA cache_size=-64000",
+                  "PRAGMA mmap_size=268435456") #hot pages are read through a 256 MiB memory map instead of read() calls
 
 def buildEngine(db_uri):
     try:
         global Engine
         global Global_metadata
-        Engine = create_engine(os.path.join("sqlite:///{0}".format(db_uri)), poolclass = NullPool, echo = False)
-        Global_metadata = MetaData(bind = Engine, reflect = True)
+        if Engine is not None:
+            Engine.dispose() #release the pooled connections (and file handles) of the previous database
+        if db_uri:
+            Engine = create_engine(os.path.join("sqlite:///{0}".format(db_uri)), poolclass = QueuePool, pool_size = 5, max_overflow = 0,
+                                   connect_args = {"check_same_thread":False}, execution_options = {"compiled_cache":{}}, echo = False)
+        else:
+            #in-memory database; each connection would otherwise get its own empty database
+            Engine = create_engine("sqlite://", poolclass = SingletonThreadPool, execution_options = {"compiled_cache":{}}, echo = False)
+        event.listen(Engine, "connect", setPragmas)
+        loadSchema()
+        if "entities" in Global_metadata.tables:
+            #databases created before parent_cik was indexed (same name as the one makeEntityTable creates)
+            Engine.execute("CREATE INDEX IF NOT EXISTS ix_entities_parent_cik ON entities (parent_cik)")
     except Exception as err:
-        database_utility_logger.error("{0}:buildEngine():{1}".format(str(datetime.datetime.now()), str(err)))
+        database_utility_logger.error("buildEngine():%s", err)
 
-def makeEntityTable():
+def buildStatements():
+    try:
+        # the Engine's compiled_cache keeps the compiled form of each statement object, so reusing them skips SQL compilation
+        global Global_entity_statements
+        Global_entity_statements = {}
+        table = Global_metadata.tables.get("entities")
+        if table is not None:
+            Global_entity_statements["select_all"] = table.select()
+            Global_entity_statements["select_name_cik"] = select([table.columns.entity_name, table.columns.entity_cik])
+            Global_entity_statements["select_name"] = select([table.columns.entity_name]).where(table.columns.entity_cik == bindparam("cik"))
+            Global_entity_statements["insert"] = table.insert().prefix_with("OR IGNORE")
+            Global_entity_statements["update_parent"] = table.update().where(table.columns.entity_cik == bindparam("cik")).values(parent_cik = bindparam("new_parent_cik"))
+            Global_entity_statements["update_name"] = table.update().where(table.columns.entity_cik == bindparam("cik")).values(entity_name = bindparam("new_entity_name"))
+    except Exception as err:
+        database_utility_logger.error("buildStatements():%s", err)
+
+    return
+
+def setPragmas(dbapi_connection, connection_record):
+    try:
+        cursor = dbapi_connection.cursor()
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
+    except Exception as err:
+        database_utility_logger.error("setPragmas():%s", err)
+
+    return
+
+def getConnection():
+    try:
+        if Global_batch_connection is not None:
+            return Global_batch_connection
+        return Engine.connect()
+    except Exception as err:
+        database_utility_logger.error("getConnection():%s", err)
+
+def releaseConnection(connection):
+    try:
+        if connection is not Global_batch_connection:
+            connection.close()
+    except Exception as err:
+        database_utility_logger.error("releaseConnection():%s", err)
+
+    return
+
+def beginBatch():
+    try:
+        global Global_batch_connection
+        global Global_batch_transaction
+        if Global_batch_connection is None:
+            Global_batch_connection = getConnection()
+            Global_batch_transaction = Global_batch_connection.begin()
+    except Exception as err:
+        database_utility_logger.error("beginBatch():%s", err)
+
+    return
+
+def commitBatch():
+    try:
+        global Global_batch_connection
+        global Global_batch_transaction
+        if Global_batch_connection is not None:
+            try:
+                Global_batch_transaction.commit()
+            finally:
+                Global_batch_connection.close()
+                Global_batch_connection = None
+                Global_batch_transaction = None
+    except Exception as err:
+        database_utility_logger.error("commitBatch():%s", err)
+
+    return
+
+def rollbackBatch():
+    try:
+        global Global_batch_connection
+        global Global_batch_transaction
+        if Global_batch_connection is not None:
+            try:
+                Global_batch_transaction.rollback()
+            finally:
+                Global_batch_connection.close()
+                Global_batch_connection = None
+                Global_batch_transaction = None
+                loadSchema()
+    except Exception as err:
+        database_utility_logger.error("rollbackBatch():%s", err)
+
+    return
+
+@contextlib.contextmanager
+def transaction():
+    if Global_batch_connection is not None:
+        yield #already part of an open batch
+        return
+    beginBatch()
+    try:
+        yield
+    except Exception:
+        rollbackBatch()
+        raise
+    commitBatch()
+
+@contextlib.contextmanager
+def pooledConnection():
+    # checks out the batch connection or a pooled one, and always hands it back, also when the body raises
+    connection = getConnection()
+    try:
+        yield connection
+    finally:
+        releaseConnection(connection)
+
+def loadSchema():
     try:
         global Global_metadata
-        ent = Table(
+        # every table of an XBRLStudio database has a known layout, so only the table names are read (one query on
+        # sqlite_master); full reflection would also run PRAGMA table_info for each table
+        Global_metadata = MetaData(bind = Engine)
+        for table_name in Engine.table_names():
+            if table_name == "entities":
+                defineEntityTable()
+            elif table_name.startswith("filings"):
+                defineFilingsTable(table_name)
+        buildStatements()
+        refreshFilingsTables()
+    except Exception as err:
+        database_utility_logger.error("loadSchema():%s", err)
+
+    return
+
+def defineEntityTable():
+    try:
+        return Table(
             "entities",
             Global_metadata,
             Column("entity_cik", Integer, primary_key = True),
-            Column("parent_cik", Integer, nullable = True),
+            Column("parent_cik", Integer, nullable = True, index = True),
             Column("entity_name", String(60))
         )
-        Global_metadata.create_all(Engine)
     except Exception as err:
-        database_utility_logger.error("{0}:makeEntityTable():{1}".format(str(datetime.datetime.now()), str(err)))
-
-    return
+        database_utility_logger.error("defineEntityTable():%s", err)
 
-def makeFilingsTable(target_name):
+def defineFilingsTable(target_name):
     try:
-        global Global_metadata
-        fil = Table(
+        return Table(
             target_name,
             Global_metadata,
+            # an INTEGER primary key is the rowid in sqlite, so lookups by entity_cik are already b-tree searches without a separate index
             Column("entity_cik", Integer, primary_key = True),
-            Column("q1", PickleType, nullable = True),
-            Column("q2", PickleType, nullable = True),
-            Column("q3", PickleType, nullable = True),
-            Column("q4", PickleType, nullable = True)
+            # pickled Filing objects; LargeBinary has the same BLOB column type that earlier versions created, so filings are pickled exactly once
+            Column("q1", LargeBinary, nullable = True),
+            Column("q2", LargeBinary, nullable = True),
+            Column("q3", LargeBinary, nullable = True),
+            Column("q4", LargeBinary, nullable = True)
         )
-        Global_metadata.create_all(Engine)
     except Exception as err:
-        database_utility_logger.error("{0}:makeFilingsTable():{1}".format(str(datetime.datetime.now()), str(err)))
+        database_utility_logger.error("defineFilingsTable():%s", err)
+
+def makeEntityTable():
+    try:
+        ent = defineEntityTable()
+        with pooledConnection() as connection:
+            ent.create(bind = connection, checkfirst = True)
+        buildStatements()
+    except Exception as err:
+        database_utility_logger.error("makeEntityTable():%s", err)
 
     return
 
-def getAllTables():
+def makeFilingsTable(target_name):
     try:
-        local_metadata = MetaData(bind = Engine, reflect = True)
-        tables = []
+        fil = defineFilingsTable(target_name)
+        with pooledConnection() as connection:
+            fil.create(bind = connection, checkfirst = True)
+        refreshFilingsTables()
 
-        for table in local_metadata.sorted_tables:
-            tables.append(table)
+        return fil
+    except Exception as err:
+        database_utility_logger.error("makeFilingsTable():%s", err)
 
-        return tables
+def makeFilingsTables(target_periods):
+    try:
+        # pysqlite runs CREATE TABLE outside the open transaction, so a table made inside a batch would outlive its rollback
+        for filing_year in sorted(set(str(target_period)[2:6] for target_period in target_periods)):
+            if "filings" + filing_year not in Global_metadata.tables:
+                makeFilingsTable("filings" + filing_year)
+    except Exception as err:
+        database_utility_logger.error("makeFilingsTables():%s", err)
+
+    return
+
+def dropTable(target_table, connection):
+    try:
+        global Global_metadata
+        target_table.drop(bind = connection)
+        # keep Global_metadata in step with the database, so the table can later be re-created without re-opening
+        if target_table.name in Global_metadata.tables:
+            Global_metadata.remove(Global_metadata.tables[target_table.name])
+            refreshFilingsTables()
     except Exception as err:
-        database_utility_logger.error("{0}:getAllTables():{1}".format(str(datetime.datetime.now()), str(err)))
+        database_utility_logger.error("dropTable():%s", err)
+
+    return
+
+def dropEmptyFilingsTables(connection, target_tables = None):
+    try:
+        if target_tables is None:
+            target_tables = list(Global_filings_tables)
+        if len(target_tables) == 0:
+            return
+        # one round trip for all tables: SELECT <i> WHERE NOT EXISTS (SELECT 1 FROM <table i>) UNION ALL ...
+        quote = connection.dialect.identifier_preparer.quote
+        empty_stmt = " UNION ALL ".join("SELECT {0} WHERE NOT EXISTS (SELECT 1 FROM {1})".format(index, quote(table.name))
+                                        for index, table in enumerate(target_tables))
+        for row in connection.execute(text(empty_stmt)).fetchall():
+            dropTable(target_tables[row[0]], connection)
+    except Exception as err:
+        database_utility_logger.error("dropEmptyFilingsTables():%s", err)
+
+    return
+
+def refreshFilingsTables():
+    try:
+        global Global_filings_tables
+        global Global_filing_tree_stmt
+        global Global_last_filing_stmt
+        global Global_last_period_stmt
+        Global_filings_tables = [table for table in Global_metadata.sorted_tables if table.name.startswith("filings")]
+        Global_quarter_statements.clear() #may refer to Table objects that were dropped or reloaded
+        Global_upsert_statements.clear()
+        Global_removal_statements.clear()
+        Global_filing_tree_stmt = None
+        Global_last_filing_stmt = None
+        Global_last_period_stmt = None
+        if len(Global_filings_tables) > 0:
+            # one row per year holding the entity: <table index>, q1 IS NOT NULL, ..., q4 IS NOT NULL
+            quote = Engine.dialect.identifier_preparer.quote
+            Global_filing_tree_stmt = text(" UNION ALL ".join("SELECT {0}, q1 IS NOT NULL, q2 IS NOT NULL, q3 IS NOT NULL, q4 IS NOT NULL "
+                                                              "FROM {1} WHERE entity_cik = :cik".format(index, quote(table.name))
+                                                              for index, table in enumerate(Global_filings_tables)) + " ORDER BY 1")
+            # latest non-null quarter of the latest year holding one; only that pickled filing is read
+            Global_last_filing_stmt = text(" UNION ALL ".join("SELECT {0}, COALESCE(q4, q3, q2, q1) FROM {1} "
+                                                              "WHERE entity_cik = :cik AND COALESCE(q4, q3, q2, q1) IS NOT NULL".format(index, quote(table.name))
+                                                              for index, table in enumerate(Global_filings_tables)) + " ORDER BY 1 DESC LIMIT 1")
+            # the same row, but only the number of its latest non-null quarter; IS NOT NULL tests do not read the pickled filings
+            Global_last_period_stmt = text(" UNION ALL ".join("SELECT {0}, CASE WHEN q4 IS NOT NULL THEN 4 WHEN q3 IS NOT NULL THEN 3 "
+                                                              "WHEN q2 IS NOT NULL THEN 2 WHEN q1 IS NOT NULL THEN 1 END FROM {1} WHERE entity_cik = :cik "
+                                                              "AND (q1 IS NOT NULL OR q2 IS NOT NULL OR q3 IS NOT NULL OR q4 IS NOT NULL)".format(index, quote(table.name))
+                                                              for index, table in enumerate(Global_filings_tables)) + " ORDER BY 1 DESC LIMIT 1")
+    except Exception as err:
+        database_utility_logger.error("refreshFilingsTables():%s", err)
+
+    return
 
 def tableExists(target_table_name):
     try:
-        tables = getAllTables()
-        for table in tables:
-            if table.name == target_table_name:
-                return True
-        return False
+        # Global_metadata is kept in step with the database by makeEntityTable, makeFilingsTable and dropTable
+        return target_table_name in Global_metadata.tables
     except Exception as err:
-        database_utility_logger.error("{0}:tableExists():{1}".format(str(datetime.datetime.now()), str(err)))
+        database_utility_logger.error("tableExists():%s", err)
 
 def getEntityTreeInfo():
     try:
-        connection = Engine.connect()
-        table_select = []
         entity_list = []
-        tables = getAllTables()
-        for table in tables:
-            if table.name == "entities":
-                try:
-                    select_stmt = table.select()
-                    table_select = connection.execute(select_stmt).fetchall()
-                except Exception as err:
-                    pass
-
-        for entry in table_select:
-            entity_list.append(entry)
-
-        connection.close()
+        table = Global_metadata.tables.get("entities")
+        if table is not None:
+            try:
+                # one query for the whole tree; the fetched rows are returned as they are, without a second copy
+                with pooledConnection() as connection:
+                    entity_list = connection.execute(Global_entity_statements["select_all"]).fetchall()
+            except Exception as err:
+                pass
 
         return entity_list
     except Exception as err:
-        database_utility_logger.error("{0}:getEntityTreeInfo():{1}".format(str(datetime.datetime.now()), str(err)))
+        database_utility_logger.error("getEntityTreeInfo():%s", err)
 
 def getNameFromCik(target_cik):
     try:
-        connection = Engine.connect()
         entity_name = None
-        tables = getAllTables()
-        for table in tables:
-            if table.name == "entities":
-                try:
-                    select_stmt = table.select().where(table.columns.entity_cik == target_cik)
-                    table_select = connection.execute(select_stmt).fetchall()
-                    entity_name = table_select[0][2]
-                except Exception as err:
-                    pass
-        connection.close()
+        table = Global_metadata.tables.get("entities")
+        if table is not None:
+            try:
+                with pooledConnection() as connection:
+                    entity_name = connection.execute(Global_entity_statements["select_name"], cik = target_cik).scalar()
+            except Exception as err:
+                pass
 
         return entity_name
     except Exception as err:
-        database_utility_logger.error("{0}:getNameFromCik():{1}".format(str(datetime.datetime.now()), str(err)))
+        database_utility_logger.error("getNameFromCik():%s", err)
 
 def updateEntityParent(target_child_cik, target_parent_cik):
     try:
@@ -162,18 +423,13 @@ def updateEntityParent(target_child_cik, target_parent_cik):
     except Exception as err:
         pass
     try:
-        connection = Engine.connect()
-
-        tables = getAllTables()
-        for table in tables:
-            if table.name == "entities":
-                try:
-                    update_stmt = table.update().where(table.columns.entity_cik == target_child_cik).values(parent_cik = target_parent_cik)
-                    table_update = connection.execute(update_stmt)
-                except Exception as err:
-                    pass
-
-        connection.close()
+        table = Global_metadata.tables.get("entities")
+        if table is not None:
+            try:
+                with pooledConnection() as connection:
+                    table_update = connection.execute(Global_entity_statements["update_parent"], cik = target_child_cik, new_parent_cik = target_parent_cik)
+            except Exception as err:
+                pass
 
         try:
             if table_update.last_updated_params() is not None:
@@ -185,161 +441,126 @@ def updateEntityParent(target_child_cik, target_parent_cik):
 
         return return_val
     except Exception as err:
-        database_utility_logger.error("{0}:updateEntityParent() body:{1}".format(str(datetime.datetime.now()), str(err)))
+        database_utility_logger.error("updateEntityParent() body:%s", err)
 
 def getEntityDict():
     try:
-        connection = Engine.connect()
         entity_dict = {} #key = entity_name, value = entity_cik
-        tables = getAllTables()
-        for table in tables:
-            if table.name == "entities":
-                try:
-                    select_stmt = table.select()
-                    table_select = connection.execute(select_stmt).fetchall()
-                    for entry in table_select:
-                        try:
-                            entity_dict[entry[2]] = entry[0]
-                        except Exception as err:
-                            database_utility_logger.error("{0}:getEntityDict() inner:{1}".format(str(datetime.datetime.now()), str(err)))
-                except Exception as err:
-                    database_utility_logger.error("{0}:getEntityDict() middle:{1}".format(str(datetime.datetime.now()), str(err)))
-        connection.close()
+        table = Global_metadata.tables.get("entities")
+        if table is not None:
+            try:
+                with pooledConnection() as connection:
+                    table_select = connection.execute(Global_entity_statements["select_name_cik"]).fetchall()
+                entity_dict = dict(table_select)
+            except Exception as err:
+                database_utility_logger.error("getEntityDict() inner:%s", err)
 
         return entity_dict
     except Exception as err:
-        database_utility_logger.error("{0}:getEntityDict() outer:{1}".format(str(datetime.datetime.now()), str(err)))
+        database_utility_logger.error("getEntityDict() outer:%s", err)
 
 def getFilingTreeInfo(target_cik):
     try:
         target_cik = int(target_cik)
-        connection = Engine.connect()
         filings = []
-        tables = getAllTables()
-        for table in tables:
-            if table.name.startswith("filings"):
-                try:
-                    select_stmt = table.select().where(table.columns.entity_cik == target_cik)
-                    table_select = connection.execute(select_stmt).fetchall()
-                    if len(table_select) > 0:
-                        if table_select[0][1] is not None:
-                            filings.append(table.name[-4:] + "-Q1")
-                        if table_select[0][2] is not None:
-                            filings.append(table.name[-4:] + "-Q2")
-                        if table_select[0][3] is not None:
-                            filings.append(table.name[-4:] + "-Q3")
-                        if table_select[0][4] is not None:
-                            filings.append(table.name[-4:] + "-Q4")
-                except Exception as err:
-                    database_utility_logger.error("{0}:getFilingTreeInfo() inner:{1}".format(str(datetime.datetime.now()), str(err)))
-        connection.close()
+        if Global_filing_tree_stmt is not None:
+            try:
+                # a single query across all years; no pickled filings are read
+                with pooledConnection() as connection:
+                    tree_rows = connection.execute(Global_filing_tree_stmt, cik = target_cik).fetchall()
+                for table_index, q1, q2, q3, q4 in tree_rows:
+                    year = Global_filings_tables[table_index].name[-4:]
+                    if q1:
+                        filings.append(year + "-Q1")
+                    if q2:
+                        filings.append(year + "-Q2")
+                    if q3:
+                        filings.append(year + "-Q3")
+                    if q4:
+                        filings.append(year + "-Q4")
+            except Exception as err:
+                database_utility_logger.error("getFilingTreeInfo() inner:%s", err)
 
         return filings
     except Exception as err:
-        database_utility_logger.error("{0}:getFilingTreeInfo() outer:{1}".format(str(datetime.datetime.now()), str(err)))
+        database_utility_logger.error("getFilingTreeInfo() outer:%s", err)
+
+def dumpFiling(target_filing):
+    try:
+        # fact values are mostly repeated text (concept names, units, contexts); fast zlib compression shrinks them several times over
+        # the pickler hands its frames (about 64 KiB each) to the compressor as it writes them, so the uncompressed pickle of a
+        # large filing is never held in memory as a whole, only the compressed parts
+        compressor = zlib.compressobj(ZLIB_LEVEL)
+        compressed_parts = []
+        compressed_writer = types.SimpleNamespace(write = lambda data: compressed_parts.append(compressor.compress(data)))
+        pickle.Pickler(compressed_writer, protocol = pickle.HIGHEST_PROTOCOL).dump(target_filing)
+        compressed_parts.append(compressor.flush())
+
+        return b"".join(compressed_parts)
+    except Exception as err:
+        database_utility_logger.error("dumpFiling():%s", err)
+
+def loadFiling(cell):
+    try:
+        # filings written by earlier versions are plain pickles, and tables created with PickleType columns stored them
+        # pickled twice; a zlib header (0x78) is never a pickle opcode, so all formats are read without a migration
+        while isinstance(cell, bytes):
+            if cell[:1] == ZLIB_MAGIC:
+                cell = zlib.decompress(cell)
+            cell = pickle.loads(cell)
+        return cell
+    except Exception as err:
+        database_utility_logger.error("loadFiling():%s", err)
 
 def selectFromDatabase(target_cik, target_period):
     try:
-        connection = Engine.connect()
         target_cik = int(target_cik)
-        tables = getAllTables()
         select_result = None
-        for table in tables:
-            if table.name == "filings{0}".format(target_period[2:6]):
-                if target_period[0:2] == "q1":
-                    try:
-                        select_stmt = table.select().where(table.columns.entity_cik == target_cik)
-                        select_result = connection.execute(select_stmt).first() #SA RowProxy
-                        if select_result is not None:
-                            try:
-                                if select_result.items()[1][1] is not None:
-                                    select_result = pickle.loads(select_result.items()[1][1]) #1st: col #; 2nd: 0 = key, 1 = val
-                                else:
-                                    select_result = None
-                            except Exception as err:
-                                database_utility_logger.error("{0}:selectFromDatabase() q1 inner:{1}".format(str(datetime.datetime.now()), str(err)))
-                                select_result = None
-                    except Exception as err:
-                        database_utility_logger.error("{0}:selectFromDatabase() q1 outer:{1}".format(str(datetime.datetime.now()), str(err)))
-                        select_result = None
-                elif target_period[0:2] == "q2":
-                    try:
-                        select_stmt = table.select().where(table.columns.entity_cik == target_cik)
-                        select_result = connection.execute(select_stmt).first()
-                        if select_result is not None:
-                            try:
-                                if select_result.items()[2][1] is not None:
-                                    select_result = pickle.loads(select_result.items()[2][1])
-                                else:
-                                    select_result = None
-                            except Exception as err:
-                                database_utility_logger.error("{0}:selectFromDatabase() q2 inner:{1}".format(str(datetime.datetime.now()), str(err)))
-                                select_result = None
-                    except Exception as err:
-                        database_utility_logger.error("{0}:selectFromDatabase() q2 outer:{1}".format(str(datetime.datetime.now()), str(err)))
-                        select_result = None
-                elif target_period[0:2] == "q3":
-                    try:
-                        select_stmt = table.select().where(table.columns.entity_cik == target_cik)
-                        select_result = connection.execute(select_stmt).first()
-                        if select_result is not None:
-                            try:
-                                if select_result.items()[3][1] is not None:
-                                    select_result = pickle.loads(select_result.items()[3][1])
-                                else:
-                                    select_result = None
-                            except Exception as err:
-                                database_utility_logger.error("{0}:selectFromDatabase() q3 inner:{1}".format(str(datetime.datetime.now()), str(err)))
-                                select_result = None
-                    except Exception as err:
-                        database_utility_logger.error("{0}:selectFromDatabase() q3 outer:{1}".format(str(datetime.datetime.now()), str(err)))
-                        select_result = None
-                elif target_period[0:2] == "q4":
-                    try:
-                        select_stmt = table.select().where(table.columns.entity_cik == target_cik)
-                        select_result = connection.execute(select_stmt).first()
-                        if select_result is not None:
-                            try:
-                                if select_result.items()[4][1] is not None:
-                                    select_result = pickle.loads(select_result.items()[4][1])
-                                else:
-                                    select_result = None
-                            except Exception as err:
-                                database_utility_logger.error("{0}:selectFromDatabase() q4 inner:{1}".format(str(datetime.datetime.now()), str(err)))
-                                select_result = None
-                    except Exception as err:
-                        database_utility_logger.error("{0}:selectFromDatabase() q4 outer:{1}".format(str(datetime.datetime.now()), str(err)))
-                        select_result = None
-                else:
-                    select_result = None
-        connection.close()
+        table = Global_metadata.tables.get("filings{0}".format(target_period[2:6]))
+        if table is not None and target_period[0:2] in ("q1", "q2", "q3", "q4"):
+            # only the requested quarter's column is read, rather than all four pickled filings in the row
+            select_stmt = Global_quarter_statements.get((table.name, target_period[0:2]))
+            if select_stmt is None:
+                select_stmt = select([table.columns[target_period[0:2]]]).where(table.columns.entity_cik == bindparam("cik"))
+                Global_quarter_statements[(table.name, target_period[0:2])] = select_stmt
+            try:
+                with pooledConnection() as connection:
+                    select_cell = connection.execute(select_stmt, cik = target_cik).scalar()
+                if select_cell is not None:
+                    select_result = loadFiling(select_cell)
+            except Exception as err:
+                database_utility_logger.error("selectFromDatabase() inner:%s", err)
+                select_result = None
 
         return select_result
     except Exception as err:
-        database_utility_logger.error("{0}:selectFromDatabase() outer:{1}".format(str(datetime.datetime.now()), str(err)))
+        database_utility_logger.error("selectFromDatabase() outer:%s", err)
 
-def existsInDatabase(target_fact_uri, target_cik = None):
+def existsInDatabase(target_fact_uri, target_cik = None, target_filing = None):
     try:
         return_vals = []
-        filing = BookFilingUtility.parseFactFile(target_fact_uri)
+        # the fact file is only parsed when the caller has not already parsed it
+        filing = target_filing if target_filing is not None else BookFilingUtility.parseFactFile(target_fact_uri)
         entity_cik_list, entity_parent_cik, entity_name, filing_period = BookFilingUtility.getFilingInfo(filing)
-        cell_list = []
         if target_cik is not None:
             cell = selectFromDatabase(target_cik, filing_period)
             if cell is not None:
                 return_vals.append((target_cik, filing_period, cell))
-        else:
-            if len(entity_cik_list) >= 1:
+        elif len(entity_cik_list) >= 1 and filing_period is not None:
+            table = Global_metadata.tables.get("filings{0}".format(filing_period[2:6]))
+            if table is not None and filing_period[0:2] in ("q1", "q2", "q3", "q4"):
+                # every cik of the filing in one query, rather than one selectFromDatabase call per cik
+                select_stmt = select([table.columns.entity_cik, table.columns[filing_period[0:2]]]).where(table.columns.entity_cik.in_(entity_cik_list))
+                with pooledConnection() as connection:
+                    cells = {row[0]:row[1] for row in connection.execute(select_stmt).fetchall()}
                 for entity_cik in entity_cik_list:
-                    cell = selectFromDatabase(entity_cik, filing_period)
-                    cell_list.append((entity_cik, filing_period, cell))
-        for item in cell_list:
-            if item[2] is not None:
-                return_vals.append(item)
+                    cell = cells.get(entity_cik)
+                    if cell is not None:
+                        return_vals.append((entity_cik, filing_period, loadFiling(cell)))
 
         return return_vals
     except Exception as err:
-        database_utility_logger.error("{0}:existsInDatabase():{1}".format(str(datetime.datetime.now()), str(err)))
+        database_utility_logger.error("existsInDatabase():%s", err)
 
 def manualExistsInDatabase(manual_cik, manual_period):
     try:
@@ -350,110 +571,53 @@ def manualExistsInDatabase(manual_cik, manual_period):
         else:
             return True
     except Exception as err:
-        database_utility_logger.error("{0}:manualExistsInDatabase():{1}".format(str(datetime.datetime.now()), str(err)))
+        database_utility_logger.error("manualExistsInDatabase():%s", err)
 
 def addToEntitiesTable(target_entity_cik, target_parent_cik, target_entity_name):
     try:
-        connection = Engine.connect()
-        tables = getAllTables()
         present = False
-        for table in tables:
-            if table.name == "entities":
-                try:
-                    select_stmt = table.select().where(table.columns.entity_cik == target_entity_cik)
-                    select_result = connection.execute(select_stmt).first()
-                    if select_result is not None:
-                        present = True
-                    else:
-                        insert_stmt = table.insert().values(entity_cik = target_entity_cik,
-                                                            parent_cik = target_parent_cik,
-                                                            entity_name = target_entity_name)
-                        insert_result = connection.execute(insert_stmt)
-                        present = True
-                except Exception as err:
-                    database_utility_logger.error("{0}:addToEntitiesTable() inner:{1}".format(str(datetime.datetime.now()), str(err)))
-        connection.close()
+        table = Global_metadata.tables.get("entities")
+        if table is not None:
+            # an entity already in the table is left as it is
+            with pooledConnection() as connection:
+                insert_result = connection.execute(Global_entity_statements["insert"], entity_cik = target_entity_cik,
+                                                   parent_cik = target_parent_cik, entity_name = target_entity_name)
+            present = True
 
         return present
     except Exception as err:
-        database_utility_logger.error("{0}:addToEntitiesTable() outer:{1}".format(str(datetime.datetime.now()), str(err)))
+        database_utility_logger.error("addToEntitiesTable():%s", err)
+        raise #the filing must not be committed without its entity
 
-def addToFilingsTable(target_table_name, target_entity_cik, target_quarter, target_filing):
+def addToFilingsTable(table, target_entity_cik, target_quarter, target_filing):
     try:
-        target_filing = pickle.dumps(target_filing)
-        connection = Engine.connect()
-        tables = getAllTables()
+        target_filing = dumpFiling(target_filing)
         present = False
-        for table in tables:
-            if table.name == target_table_name:
-                try:
-                    select_stmt = table.select().where(table.columns.entity_cik == target_entity_cik)
-                    select_result = connection.execute(select_stmt).first()
-                except Exception as err:
-                    database_utility_logger.error("{0}:addToFilingsTable() select:{1}".format(str(datetime.datetime.now()), str(err)))
-                if select_result is not None:
-                    if target_quarter == "q1":
-                        try:
-                            update_stmt = table.update().where(table.columns.entity_cik == target_entity_cik).values(q1 = target_filing)
-                            update_result = connection.execute(update_stmt)
-                            present = True
-                        except Exception as err:
-                            database_utility_logger.error("{0}:addToFilingsTable() select_result == None q1:{1}".format(str(datetime.datetime.now()), str(err)))
-                    elif target_quarter == "q2":
-                        try:
-                            update_stmt = table.update().where(table.columns.entity_cik == target_entity_cik).values(q2 = target_filing)
-                            update_result = connection.execute(update_stmt)
-                            present = True
-                        except Exception as err:
-                            database_utility_logger.error("{0}:addToFilingsTable() select_result == None q2:{1}".format(str(datetime.datetime.now()), str(err)))
-                    elif target_quarter == "q3":
-                        try:
-                            update_stmt = table.update().where(table.columns.entity_cik == target_entity_cik).values(q3 = target_filing)
-                            update_result = connection.execute(update_stmt)
-                            present = True
-                        except Exception as err:
-                            database_utility_logger.error("{0}:addToFilingsTable() select_result == None q3:{1}".format(str(datetime.datetime.now()), str(err)))
-                    elif target_quarter == "q4":
-                        try:
-                            update_stmt = table.update().where(table.columns.entity_cik == target_entity_cik).values(q4 = target_filing)
-                            update_result = connection.execute(update_stmt)
-                            present = True
-                        except Exception as err:
-                            database_utility_logger.error("{0}:addToFilingsTable() select_result == None q4:{1}".format(str(datetime.datetime.now()), str(err)))
+        if table is not None and target_quarter in ("q1", "q2", "q3", "q4"):
+            # built once per (table, quarter) and reused, so each import executes an already compiled statement
+            upsert_stmt = Global_upsert_statements.get((table.name, target_quarter))
+            if upsert_stmt is None:
+                if SQLITE_UPSERT:
+                    upsert_stmt = text("INSERT INTO {0} (entity_cik, {1}) VALUES (:cik, :filing) "
+                                       "ON CONFLICT(entity_cik) DO UPDATE SET {1} = excluded.{1}".format(Engine.dialect.identifier_preparer.quote(table.name), target_quarter))
+                    upsert_stmt = upsert_stmt.bindparams(bindparam("filing", type_ = LargeBinary))
                 else:
-                    if target_quarter == "q1":
-                        try:
-                            insert_stmt = table.insert().values(entity_cik = target_entity_cik, q1 = target_filing)
-                            insert_result = connection.execute(insert_stmt)
-                            present = True
-                        except Exception as err:
-                            database_utility_logger.error("{0}:addToFilingsTable() select_result != None q1:{1}".format(str(datetime.datetime.now()), str(err)))
-                    elif target_quarter == "q2":
-                        try:
-                            insert_stmt = table.insert().values(entity_cik = target_entity_cik, q2 = target_filing)
-                            insert_result = connection.execute(insert_stmt)
-                            present = True
-                        except Exception as err:
-                            database_utility_logger.error("{0}:addToFilingsTable() select_result != None q2:{1}".format(str(datetime.datetime.now()), str(err)))
-                    elif target_quarter == "q3":
-                        try:
-                            insert_stmt = table.insert().values(entity_cik = target_entity_cik, q3 = target_filing)
-                            insert_result = connection.execute(insert_stmt)
-                            present = True
-                        except Exception as err:
-                            database_utility_logger.error("{0}:addToFilingsTable() select_result != None q3:{1}".format(str(datetime.datetime.now()), str(err)))
-                    elif target_quarter == "q4":
-                        try:
-                            insert_stmt = table.insert().values(entity_cik = target_entity_cik, q4 = target_filing)
-                            insert_result = connection.execute(insert_stmt)
-                            present = True
-                        except Exception as err:
-                            database_utility_logger.error("{0}:addToFilingsTable() select_result != None q4:{1}".format(str(datetime.datetime.now()), str(err)))
-        connection.close
+                    upsert_stmt = (table.update().where(table.columns.entity_cik == bindparam("cik")).values({target_quarter:bindparam("filing")}),
+                                   table.insert().values({"entity_cik":bindparam("cik"), target_quarter:bindparam("filing")}))
+                Global_upsert_statements[(table.name, target_quarter)] = upsert_stmt
+            with pooledConnection() as connection:
+                if SQLITE_UPSERT:
+                    connection.execute(upsert_stmt, cik = target_entity_cik, filing = target_filing)
+                else:
+                    update_result = connection.execute(upsert_stmt[0], cik = target_entity_cik, filing = target_filing)
+                    if update_result.rowcount == 0:
+                        connection.execute(upsert_stmt[1], cik = target_entity_cik, filing = target_filing)
+            present = True
 
         return present
     except Exception as err:
-        database_utility_logger.error("{0}:addToFilingsTable() outer:{1}".format(str(datetime.datetime.now()), str(err)))
+        database_utility_logger.error("addToFilingsTable() %s:%s", target_quarter, err)
+        raise
 
 def addToDatabase(target_fact_uri, target_cik = None):
     try:
@@ -471,26 +635,27 @@ def addToDatabase(target_fact_uri, target_cik = None):
         if target_cik == None:
             return
 
-        tables = getAllTables()
-        filings_table_found = False
-
-        for table in tables:
-            if table.name == filing_table_name:
-                filings_table_found = True
-        if not filings_table_found:
-            makeFilingsTable(filing_table_name)
+        # one transaction (and one sync to disk) per filing, rather than one per statement
+        with transaction():
+            filing_table = Global_metadata.tables.get(filing_table_name)
+            if filing_table is None:
+                filing_table = makeFilingsTable(filing_table_name)
 
-        addToEntitiesTable(target_cik, target_parent_cik, target_name)
-        addToFilingsTable(filing_table_name, target_cik, filing_quarter, filing)
-        updateEntityName(target_cik)
+            addToEntitiesTable(target_cik, target_parent_cik, target_name)
+            if not addToFilingsTable(filing_table, target_cik, filing_quarter, filing):
+                raise Exception("no filings table for period {0}".format(filing_period))
+            updateEntityName(target_cik, filing, filing_period)
     except Exception as err:
-        database_utility_logger.error("{0}:addToDatabase():{1}".format(str(datetime.datetime.now()), str(err)))
+        database_utility_logger.error("addToDatabase():%s", err)
+        raise #a batch of imports is rolled back rather than committed without this filing
 
     return
 
 def manualAddToDatabase(manual_cik, manual_name, manual_period, target_fact_uri):
     try:
         filing = BookFilingUtility.parseFactFile(target_fact_uri)
+        if filing is None:
+            raise Exception("{0} could not be parsed".format(target_fact_uri))
         target_cik = int(manual_cik)
         target_parent_cik = None
         target_name = str(manual_name)
@@ -498,232 +663,211 @@ def manualAddToDatabase(manual_cik, manual_name, manual_period, target_fact_uri)
         filing_year = manual_period[2:6]
         filing_quarter = manual_period[0:2]
         filing_table_name = "filings" + filing_year
-        tables = getAllTables()
-        filings_table_found = False
-
-        for table in tables:
-            if table.name == filing_table_name:
-                filings_table_found = True
-        if not filings_table_found:
-            makeFilingsTable(filing_table_name)
-
-        addToEntitiesTable(target_cik, target_parent_cik, target_name)
-        addToFilingsTable(filing_table_name, target_cik, filing_quarter, filing)
-        updateEntityName(target_cik)
+        with transaction():
+            filing_table = Global_metadata.tables.get(filing_table_name)
+            if filing_table is None:
+                filing_table = makeFilingsTable(filing_table_name)
+
+            addToEntitiesTable(target_cik, target_parent_cik, target_name)
+            if not addToFilingsTable(filing_table, target_cik, filing_quarter, filing):
+                raise Exception("no filings table for period {0}".format(manual_period))
+            updateEntityName(target_cik, filing, manual_period)
     except Exception as err:
-        database_utility_logger.error("{0}:manualAddToDatabase():{1}".format(str(datetime.datetime.now()), str(err)))
+        database_utility_logger.error("manualAddToDatabase():%s", err)
+        raise
 
     return
 
-def countEntityAndChildren(target_cik, count = 0):
+def getEntityAndChildren(target_cik):
     try:
-        connection = Engine.connect()
-        target_cik = int(target_cik)
-        tables = getAllTables()
-        if len(tables) > 0:
-            for table in tables:
-                if table.exists() is True:
-                    if table.name == "entities":
-                        try:
-                            entity_sel_stmt = table.select().where(table.columns.entity_cik == target_cik)
-                            entity_sel_result = connection.execute(entity_sel_stmt).fetchall()
-                            if entity_sel_result is not None:
-                                count += len(entity_sel_result)
-                            children_sel_stmt = table.select().where(table.columns.parent_cik == target_cik)
-                            children_sel_result = connection.execute(children_sel_stmt).fetchall()
-                        except Exception as err:
-                            database_utility_logger.error("{0}:countEntityAndChildren() inner:{1}".format(str(datetime.datetime.now()), str(err)))
-        if children_sel_result is not None:
-            for result in children_sel_result:
-                count += countEntityAndChildren(result.entity_cik)
-        connection.close()
+        with pooledConnection() as connection:
+            entity_cik_list = [row[0] for row in connection.execute(ENTITY_TREE_STMT, root = int(target_cik)).fetchall()]
 
-        return count
+        return entity_cik_list
     except Exception as err:
-        database_utility_logger.error("{0}:countEntityAndChildren() outer:{1}".format(str(datetime.datetime.now()), str(err)))
+        database_utility_logger.error("getEntityAndChildren():%s", err)
+        return []
+
+def getRemovalStatement(table, target_quarter):
+    try:
+        # built once per (table, quarter); the expanding "ciks" parameter takes any number of ciks, so the
+        # statement object is reused and its compiled form is found in the Engine's compiled_cache
+        del_stmt = Global_removal_statements.get((table.name, target_quarter))
+        if del_stmt is None:
+            if target_quarter is not None:
+                del_stmt = table.update().where(table.columns.entity_cik.in_(bindparam("ciks", expanding = True))).values({table.columns[target_quarter]:None})
+            else:
+                del_stmt = table.delete().where(table.columns.entity_cik.in_(bindparam("ciks", expanding = True)))
+            Global_removal_statements[(table.name, target_quarter)] = del_stmt
+
+        return del_stmt
+    except Exception as err:
+        database_utility_logger.error("getRemovalStatement():%s", err)
 
 def removeEntityFromDatabase(book_main_window, target_cik, call = 0, total_items = 0):
     try:
-        call += 1
-        if call == 1:
-            total_items = countEntityAndChildren(target_cik)
-            if total_items != 0:
-                progress = int(100 * call / total_items)
-        else:
-            if total_items != 0:
-                progress = int(100 * call / total_items)
-        book_main_window.updateProgressBar(progress)
-        children_sel_result = None
-        connection = Engine.connect()
-        target_cik = int(target_cik)
-        tables = getAllTables()
-        if len(tables) > 0:
-            for table in tables:
-                if table.exists() is True:
-                    if table.name == "entities":
-                        try:
-                            parent_del_stmt = table.delete().where(table.columns.entity_cik == target_cik)
-                            parent_del_result = connection.execute(parent_del_stmt)
-                            children_sel_stmt = table.select().where(table.columns.parent_cik == target_cik)
-                            children_sel_result = connection.execute(children_sel_stmt).fetchall()
-                        except Exception as err:
-                            pass
-                    else:
-                        try:
-                            generic_del_stmt = table.delete().where(table.columns.entity_cik == target_cik)
-                            generic_del_result = connection.execute(generic_del_stmt)
-                        except Exception as err:
-                            pass
-        if children_sel_result is not None:
-            for result in children_sel_result:
-                call = removeEntityFromDatabase(book_main_window, result.entity_cik,
-                                         call = call, total_items = total_items)
-        if len(tables) > 0:
-            for table in tables:
-                if table.exists() is True:
-                    try:
-                        generic_sel_stmt = table.select()
-                        generic_sel_result = connection.execute(generic_sel_stmt).first()
-                        if generic_sel_result is None and table.name != "entities":
-                            table.drop(bind = Engine)
-                    except Exception as err:
-                        pass
-
-        if call == total_items:
-            connection.execute("VACUUM")
+        entity_cik_list = getEntityAndChildren(target_cik)
+        total_items = len(entity_cik_list)
+        if total_items == 0:
+            return call
+        entities_table = Global_metadata.tables.get("entities")
+        filings_tables = list(Global_filings_tables)
+        total_steps = len(filings_tables) + 1
+        # ciks are bound REMOVAL_CHUNK_SIZE at a time; an entity tree rarely needs more than one statement per table
+        cik_chunks = [entity_cik_list[i:i + REMOVAL_CHUNK_SIZE] for i in range(0, total_items, REMOVAL_CHUNK_SIZE)]
+        try:
+            with pooledConnection() as connection:
+                # one DELETE per table for the whole entity tree, committed (or rolled back) together
+                trans = connection.begin()
+                try:
+                    for step, table in enumerate(filings_tables + [entities_table], 1):
+                        del_stmt = getRemovalStatement(table, None)
+                        for cik_chunk in cik_chunks:
+                            connection.execute(del_stmt, ciks = cik_chunk)
+                        book_main_window.updateProgressBar(int(100 * step / total_steps))
+                    dropEmptyFilingsTables(connection, filings_tables)
+                    trans.commit()
+                except Exception as err:
+                    trans.rollback()
+                    raise
+                reclaimSpace(connection)
+        finally:
             book_main_window.resetProgressBar()
-        connection.close()
+        call += total_items
 
         return call
     except Exception as err:
-        database_utility_logger.error("{0}:removeEntityFromDatabase():{1}".format(str(datetime.datetime.now()), str(err)))
+        database_utility_logger.error("removeEntityFromDatabase():%s", err)
 
 def removeFilingFromDatabase(book_main_window, target_cik, target_period, call = 0, total_items = 0):
     try:
-        call += 1
-        total_items = 3
-        progress = int(100 * call / total_items)
-        book_main_window.updateProgressBar(progress)
-        connection = Engine.connect()
-        target_cik = int(target_cik)
+        if isinstance(target_cik, (list, tuple, set)):
+            target_ciks = [int(cik) for cik in target_cik]
+        else:
+            target_ciks = [int(target_cik)]
         target_period = str(target_period)
+        target_quarter = None #a whole year
+        target_table_name = None
         if len(target_period) == 6:
             target_quarter = target_period[0:2]
-            target_year = target_period[2:6]
-            target_table_name = "filings" + target_year
+            target_table_name = "filings" + target_period[2:6]
         elif len(target_period) == 4:
-            target_year = target_period
-            target_table_name = "filings" + target_year
-        tables = getAllTables()
-        if len(tables) > 0:
-            for table in tables:
-                if table.exists() is True:
-                    if table.name == target_table_name:
+            target_table_name = "filings" + target_period
+        table = Global_metadata.tables.get(target_table_name) if target_table_name is not None else None
+        modified_tables = [] #only a table that lost rows can have become empty
+        try:
+            with pooledConnection() as connection:
+                # one statement for all given ciks; the delete and any table drops are committed together
+                trans = connection.begin()
+                try:
+                    if table is not None:
                         try:
-                            if len(target_period) == 6:
-                                if target_quarter == "q1":
-                                    del_stmt = table.update().where(table.columns.entity_cik == target_cik).values(q1 = None)
-                                elif target_quarter == "q2":
-                                    del_stmt = table.update().where(table.columns.entity_cik == target_cik).values(q2 = None)
-                                elif target_quarter == "q3":
-                                    del_stmt = table.update().where(table.columns.entity_cik == target_cik).values(q3 = None)
-                                elif target_quarter == "q4":
-                                    del_stmt = table.update().where(table.columns.entity_cik == target_cik).values(q4 = None)
-                            elif len(target_period) == 4:
-                                del_stmt = table.delete().where(table.columns.entity_cik == target_cik)
-                            connection.execute(del_stmt)
+                            del_stmt = getRemovalStatement(table, target_quarter)
+                            if target_quarter is None:
+                                modified_tables.append(table)
+                            for i in range(0, len(target_ciks), REMOVAL_CHUNK_SIZE):
+                                connection.execute(del_stmt, ciks = target_ciks[i:i + REMOVAL_CHUNK_SIZE])
                         except Exception as err:
-                            database_utility_logger.error("{0}:removeFilingFromDatabase() delete:{1}".format(str(datetime.datetime.now()), str(err)))
-            for table in tables:
-                if table.exists() is True:
-                    try:
-                        generic_sel_stmt = table.select()
-                        generic_sel_result = connection.execute(generic_sel_stmt).first()
-                        if generic_sel_result is None and table.name != "entities":
-                            table.drop(bind = Engine)
-                    except Exception as err:
-                        database_utility_logger.error("{0}:removeFilingFromDatabase() table_drop:{1}".format(str(datetime.datetime.now()), str(err)))
-
-        call += 1
-        progress = int(100 * call / total_items)
-        book_main_window.updateProgressBar(progress)
-        connection.execute("VACUUM")
-        call += 1
-        progress = int(100 * call / total_items)
-        book_main_window.updateProgressBar(progress)
-        book_main_window.resetProgressBar()
-        connection.close()
+                            database_utility_logger.error("removeFilingFromDatabase() delete:%s", err)
+                    dropEmptyFilingsTables(connection, modified_tables)
+                    trans.commit()
+                except Exception as err:
+                    trans.rollback()
+                    raise
+
+                # the statements above take milliseconds; the bar is only moved once, before the space is reclaimed
+                book_main_window.updateProgressBar(50)
+                reclaimSpace(connection)
+        finally:
+            book_main_window.resetProgressBar() #also after an error, so the bar is never left part-filled
 
         return True
     except Exception as err:
-        database_utility_logger.error("{0}:removeFilingFromDatabase() outer:{1}".format(str(datetime.datetime.now()), str(err)))
+        database_utility_logger.error("removeFilingFromDatabase() outer:%s", err)
 
-def updateEntityName(target_cik):
+def updateEntityName(target_cik, target_filing = None, target_period = None):
     try:
-        connection = Engine.connect()
-        last_filing = getLastFiling(target_cik)
+        if target_filing is not None and getLastFilingPeriod(target_cik) == target_period:
+            last_filing = target_filing #the filing just added is the latest; no need to load it back from the database
+        else:
+            last_filing = getLastFiling(target_cik)
         target_entity_cik_list, entity_parent_cik, new_entity_name, filing_period = BookFilingUtility.getFilingInfo(last_filing)
-        tables = getAllTables()
-        for table in tables:
-            if table.name == "entities":
-                try:
-                    update_stmt = table.update().where(table.columns.entity_cik == target_cik).values(entity_name = new_entity_name)
-                    update_result = connection.execute(update_stmt)
-                except Exception as err:
-                    database_utility_logger.error("{0}:updateEntityName() inner:{1}".format(str(datetime.datetime.now()), str(err)))
-        connection.close()
+        table = Global_metadata.tables.get("entities")
+        if table is not None:
+            try:
+                # the connection is taken only for the single cached UPDATE, after the latest filing has been read
+                with pooledConnection() as connection:
+                    connection.execute(Global_entity_statements["update_name"], cik = target_cik, new_entity_name = new_entity_name)
+            except Exception as err:
+                database_utility_logger.error("updateEntityName() inner:%s", err)
+    except Exception as err:
+        database_utility_logger.error("updateEntityName() outer:%s", err)
+
+    return
+
+def reclaimSpace(connection):
+    try:
+        # VACUUM and executescript both need the connection outside a transaction; inside a batch the freed pages stay on the freelist until the next removal
+        if connection is Global_batch_connection:
+            return
+        if connection.execute("PRAGMA auto_vacuum").scalar() == 2: #INCREMENTAL
+            # the pragma frees one page per step, so it is run with executescript, which steps it to completion
+            connection.connection.executescript("PRAGMA incremental_vacuum")
+        else:
+            free_pages = connection.execute("PRAGMA freelist_count").scalar()
+            total_pages = connection.execute("PRAGMA page_count").scalar()
+            if total_pages and free_pages > VACUUM_FREE_RATIO * total_pages:
+                connection.execute("VACUUM") #rewrites the whole file; also applies auto_vacuum=INCREMENTAL from setPragmas
     except Exception as err:
-        database_utility_logger.error("{0}:updateEntityName() outer:{1}".format(str(datetime.datetime.now()), str(err)))
+        database_utility_logger.error("reclaimSpace():%s", err)
 
     return
 
+def getLastFilingPeriod(target_cik):
+    try:
+        last_period = None
+        target_cik = int(target_cik)
+        if Global_last_period_stmt is not None:
+            # a single query across all years, built once by refreshFilingsTables
+            with pooledConnection() as connection:
+                last_row = connection.execute(Global_last_period_stmt, cik = target_cik).first()
+            if last_row is not None:
+                last_period = "q{0}{1}".format(last_row[1], Global_filings_tables[last_row[0]].name[-4:])
+
+        return last_period
+    except Exception as err:
+        database_utility_logger.error("getLastFilingPeriod():%s", err)
+
 def getLastFiling(target_cik):
     try:
-        connection = Engine.connect()
-        tables = getAllTables()
         select_result = None
         target_cik = int(target_cik)
-        for table in reversed(tables):
-            if table.name.startswith("filings"):
-                try:
-                    select_stmt = table.select().where(table.columns.entity_cik == target_cik)
-                    select_result = connection.execute(select_stmt).first() #SA RowProxy
-                    if select_result is not None: # entity is in table
-                        try:
-                            for col in reversed(select_result.items()):
-                                if col[1] is not None: # latest filing
-                                    select_result = pickle.loads(col[1]) # [0 = key, 1 = val]
-                                    return select_result
-                                else:
-                                    pass
-                        except Exception as err:
-                            database_utility_logger.error("{0}:getLastFiling() inner:{1}".format(str(datetime.datetime.now()), str(err)))
-                            select_result = None
-                except Exception as err:
-                    database_utility_logger.error("{0}:getLastFiling() middle:{1}".format(str(datetime.datetime.now()), str(err)))
-                    select_result = None
-        connection.close()
+        if Global_last_filing_stmt is not None:
+            try:
+                with pooledConnection() as connection:
+                    last_row = connection.execute(Global_last_filing_stmt, cik = target_cik).first()
+                if last_row is not None:
+                    select_result = loadFiling(last_row[1])
+            except Exception as err:
+                database_utility_logger.error("getLastFiling() inner:%s", err)
+                select_result = None
 
         return select_result
     except Exception as err:
-        database_utility_logger.error("{0}:getLastFiling() outer:{1}".format(str(datetime.datetime.now()), str(err)))
+        database_utility_logger.error("getLastFiling() outer:%s", err)
 
 def renameEntityInDatabase(target_cik, new_entity_name):
     try:
         target_cik = int(target_cik)
         new_entity_name = str(new_entity_name)
-        connection = Engine.connect()
-        tables = getAllTables()
-        for table in tables:
-            if table.name == "entities":
-                try:
-                    update_stmt = table.update().where(table.columns.entity_cik == target_cik).values(entity_name = new_entity_name)
-                    update_result = connection.execute(update_stmt)
-                except Exception as err:
-                    database_utility_logger.error("{0}:renameEntityInDatabase() inner:{1}".format(str(datetime.datetime.now()), str(err)))
-
-        connection.close()
+        table = Global_metadata.tables.get("entities")
+        if table is not None:
+            try:
+                with pooledConnection() as connection:
+                    connection.execute(Global_entity_statements["update_name"], cik = target_cik, new_entity_name = new_entity_name)
+            except Exception as err:
+                database_utility_logger.error("renameEntityInDatabase() inner:%s", err)
     except Exception as err:
-        database_utility_logger.error("{0}:renameEntityInDatabase() outer:{1}".format(str(datetime.datetime.now()), str(err)))
+        database_utility_logger.error("renameEntityInDatabase() outer:%s", err)
 
     return
@@ -9,15 +9,19 @@
     :description: Contains the following classes:
 
         BookExporter - primary class for exporting from XBRLStudio to external file types; currently supports PDF and CSV exports
+        BookExportSignals - signals emitted by a BookExportTask while it writes an export file
+        BookExportTask - writes the contents gathered by BookExporter to an export file, on a QThreadPool thread
 """
 
 try:
-    import copy, csv, sys, os, datetime, logging
+    import csv, sys, os, logging
     export_utility_logger = logging.getLogger()
-    from PySide2 import QtWidgets
+    from PySide2 import QtCore, QtWidgets
     from PySide2.QtCore import (QFile, QIODevice)
 except Exception as err:
-    export_utility_logger.error("{0}:BookExportUtility import error:{1}".format(str(datetime.datetime.now()), str(err)))
+    export_utility_logger.error("BookExportUtility import error:{0}".format(str(err)))
+
+EXPORT_BUFFER_SIZE = 1 << 20 #export files are written through a 1 MiB buffer, instead of one write call per 8 KiB
 
 class BookExporter():
     """
@@ -27,7 +31,10 @@ class BookExporter():
 
     Functions
     ~~~~~~~~~
-    buildHtmlTexGraphic(self, current_top_tab, current_tex_graphic, out_file, current_tab_index, tmp_files) - builds textual graphic html string
+    buildHtmlTexGraphic(self, current_top_tab, current_tex_graphic) - builds the html fragments (title, textual graphic) of one tab
+    getNumTableItems(self, current_top_tab, current_num_table_view) - returns the title and a copy of the non-empty rows of a numerical table, for a BookExportTask
+    getOutFile(self, file_type) - asks the user for an export file path with the given extension; confirms hidden and existing files
+    startExportTask(self, export_task) - connects a BookExportTask to the main window progress bar and starts it on the global QThreadPool
     exportHtml(self, mode) - exports textual graphics (from single or total tabs) to a html file
     exportCsv(self, mode) - exports numerical tables (from single or total tabs) to a csv file
 
@@ -37,211 +44,211 @@ class BookExporter():
     """
 
     def __init__(self, book_main_window):
-        export_utility_logger.info("{0}:Initializing BookExporter".format(str(datetime.datetime.now())))
+        export_utility_logger.info("Initializing BookExporter")
         self.book_main_window = book_main_window
         self.tmp_dir = self.book_main_window.directories["Global_tmp_dir"]
 
     def buildHtmlTexGraphic(self, current_top_tab, current_tex_graphic):
         try:
-            current_tex_html = ""
-            current_tex_html += "<p>{0} - Textual Graphic</p><br>".format(current_top_tab.objectName())
-            current_tex_html += current_tex_graphic.html
+            current_tex_html = ["<p>{0} - Textual Graphic</p><br>".format(current_top_tab.objectName()),
+                                current_tex_graphic.html]
 
             return current_tex_html
         except Exception as err:
-            export_utility_logger.error("{0}:BookExporter.buildHtmlTexGraphic():{1}".format(str(datetime.datetime.now()), str(err)))
+            export_utility_logger.error("BookExporter.buildHtmlTexGraphic():{0}".format(str(err)))
 
-    def exportHtml(self, mode):
+    def getNumTableItems(self, current_top_tab, current_num_table_view):
         try:
-            #Get out_file path, ensure valid filename for a html
-            out_file = QtWidgets.QFileDialog.getSaveFileName(caption = "HTML Export",
+            #Only the non-empty rows are copied, and only one level deep; cells are ints, strings and bools, which the
+            #export thread can share with the model, but rows are edited in place by setData
+            current_num_table_title_text = current_top_tab.objectName() + " - Numerical Table"
+            current_num_table_items = [item[:] for item in current_num_table_view.model().items if item[0] is not None]
+
+            return current_num_table_title_text, current_num_table_items
+        except Exception as err:
+            export_utility_logger.error("BookExporter.getNumTableItems():{0}".format(str(err)))
+
+    def getOutFile(self, file_type):
+        try:
+            #Get out_file path, ensure valid filename for the file type ("html" or "csv"); "" if the user cancels
+            file_label = file_type.upper()
+            out_file = QtWidgets.QFileDialog.getSaveFileName(caption = "{0} Export".format(file_label),
                                                             directory = "C:\\",
-                                                            filter = "HTML (*.html)",
+                                                            filter = "{0} (*.{1})".format(file_label, file_type),
                                                             options = QtWidgets.QFileDialog.DontConfirmOverwrite)[0]
-            if out_file != "":
-                if out_file.split(os.sep)[-1] != "":
-                    file_name = out_file.split(os.sep)[-1]
-                if "." in file_name:
-                    if file_name[0] == ".":
-                        hidden_file_choice = QtWidgets.QMessageBox.warning(self.book_main_window,
-                                                       "HTML file name confirmation",
-                                                       "Are you sure you want to create HTML file {0}".format(out_file.split(os.sep)[-1]),
-                                                       QtWidgets.QMessageBox.Ok | QtWidgets.QMessageBox.Cancel,
-                                                       QtWidgets.QMessageBox.Cancel)
-                        if hidden_file_choice == QtWidgets.QMessageBox.Cancel:
-                            return
-                    if file_name.split(".")[-1] != "html":
-                        file_name += ".html"
-                        out_file += ".html"
-                elif "." not in file_name:
-                    file_name += ".html"
-                    out_file += ".html"
+            if out_file == "":
+                return out_file
+            file_name = os.path.basename(out_file)
+            if file_name.startswith("."):
+                hidden_file_choice = QtWidgets.QMessageBox.warning(self.book_main_window,
+                                               "{0} file name confirmation".format(file_label),
+                                               "Are you sure you want to create {0} file {1}".format(file_label, file_name),
+                                               QtWidgets.QMessageBox.Ok | QtWidgets.QMessageBox.Cancel,
+                                               QtWidgets.QMessageBox.Cancel)
+                if hidden_file_choice == QtWidgets.QMessageBox.Cancel:
+                    return ""
+            if not file_name.lower().endswith("." + file_type):
+                out_file += "." + file_type
             if os.path.isfile(out_file):
                 overwrite_choice = QtWidgets.QMessageBox.warning(self.book_main_window,
                                                "Overwrite file?",
-                                               "Are you sure you want to overwrite {0}?".format(out_file.split(os.sep)[-1]),
+                                               "Are you sure you want to overwrite {0}?".format(os.path.basename(out_file)),
                                                QtWidgets.QMessageBox.Ok | QtWidgets.QMessageBox.Cancel,
                                                QtWidgets.QMessageBox.Cancel)
                 if overwrite_choice == QtWidgets.QMessageBox.Ok:
                     os.remove(out_file)
                 else:
-                    return
+                    return ""
+
+            return out_file
+        except Exception as err:
+            export_utility_logger.error("BookExporter.getOutFile():{0}".format(str(err)))
+            return ""
+
+    def startExportTask(self, export_task):
+        try:
+            #Signals are emitted on the pool thread and delivered to the main window on the GUI thread
+            export_task.signals.progress.connect(self.book_main_window.updateProgressBar)
+            export_task.signals.finished.connect(self.book_main_window.resetProgressBar)
+            QtCore.QThreadPool.globalInstance().start(export_task)
+        except Exception as err:
+            export_utility_logger.error("BookExporter.startExportTask():{0}".format(str(err)))
+
+        return
+
+    def exportHtml(self, mode):
+        try:
+            out_file = self.getOutFile("html")
             if out_file != "":
+                #Widgets are only read here, on the GUI thread; the file is written by a BookExportTask
+                current_html_tex_graphics = []
                 if mode == "all_tabs":
                     tab_index = 0
-                    current_html_tex_graphic = ""
-                    while tab_index < self.book_main_window.mainTabWidget.count() - 1:
+                    tab_count = self.book_main_window.mainTabWidget.count() - 1 #without the '+' tab
+                    while tab_index < tab_count:
                         current_top_tab = self.book_main_window.mainTabWidget.widget(tab_index)
-                        current_tex_graphic = current_top_tab.findChild(QtWidgets.QTextEdit, "textualGraphic")
-                        current_html_tex_graphic += self.buildHtmlTexGraphic(current_top_tab, current_tex_graphic)
+                        current_tex_graphic = current_top_tab.tex_graphic
+                        current_html_tex_graphics.append(self.buildHtmlTexGraphic(current_top_tab, current_tex_graphic))
                         tab_index += 1
 
                 elif mode == "single_tab":
                     tab_index = self.book_main_window.mainTabWidget.currentIndex()
-                    current_html_tex_graphic = ""
                     current_top_tab = self.book_main_window.mainTabWidget.widget(tab_index)
-                    current_tex_graphic = current_top_tab.findChild(QtWidgets.QTextEdit, "textualGraphic")
-                    current_html_tex_graphic += self.buildHtmlTexGraphic(current_top_tab, current_tex_graphic)
+                    current_tex_graphic = current_top_tab.tex_graphic
+                    current_html_tex_graphics.append(self.buildHtmlTexGraphic(current_top_tab, current_tex_graphic))
 
-                html_file = open(out_file, "w")
-                html_file.write(current_html_tex_graphic)
-                html_file.close()
+                self.startExportTask(BookExportTask(out_file, "html", current_html_tex_graphics))
 
             return
         except Exception as err:
-            export_utility_logger.error("{0}:BookExporter.exportHtml():{1}".format(str(datetime.datetime.now()), str(err)))
+            export_utility_logger.error("BookExporter.exportHtml():{0}".format(str(err)))
 
     def exportCsv(self, mode):
         try:
-            #Get out_file path, ensure valid filename for a csv
-            out_file = QtWidgets.QFileDialog.getSaveFileName(caption = "CSV Export",
-                                  directory = "C:\\",
-                                  filter = "CSV (*.csv)",
-                                  options = QtWidgets.QFileDialog.DontConfirmOverwrite)[0]
-            if out_file != "":
-                if out_file.split(os.sep)[-1] != "":
-                    file_name = out_file.split(os.sep)[-1]
-                if "." in file_name:
-                    if file_name[0] == ".":
-                        hidden_file_choice = QtWidgets.QMessageBox.warning(self.book_main_window,
-                                                       "CSV file name confirmation",
-                                                       "Are you sure you want to create CSV file {0}".format(out_file.split(os.sep)[-1]),
-                                                       QtWidgets.QMessageBox.Ok | QtWidgets.QMessageBox.Cancel,
-                                                       QtWidgets.QMessageBox.Cancel)
-                        if hidden_file_choice == QtWidgets.QMessageBox.Cancel:
-                            return
-                    if file_name.split(".")[-1] != "csv":
-                        file_name += ".csv"
-                        out_file += ".csv"
-                elif "." not in file_name:
-                    file_name += ".csv"
-                    out_file += ".csv"
-            if os.path.isfile(out_file):
-                overwrite_choice = QtWidgets.QMessageBox.warning(self.book_main_window,
-                                               "Overwrite file?",
-                                               "Are you sure you want to overwrite {0}?".format(out_file.split(os.sep)[-1]),
-                                               QtWidgets.QMessageBox.Ok | QtWidgets.QMessageBox.Cancel,
-                                               QtWidgets.QMessageBox.Cancel)
-                if overwrite_choice == QtWidgets.QMessageBox.Ok:
-                    os.remove(out_file)
-                else:
-                    return
+            out_file = self.getOutFile("csv")
             if out_file != "":
-
+                #Models are only read here, on the GUI thread; the file is written by a BookExportTask
+                current_num_tables = []
                 if mode == "all_tabs":
-                    csv_file_handler = open(out_file, "w", newline = "")
                     tab_index = 0
-                    while tab_index < self.book_main_window.mainTabWidget.count() - 1:
+                    tab_count = self.book_main_window.mainTabWidget.count() - 1 #without the '+' tab
+                    while tab_index < tab_count:
                         current_top_tab = self.book_main_window.mainTabWidget.widget(tab_index)
-                        current_num_table_view = current_top_tab.findChild(QtWidgets.QTableView, "numericalTableView")
-                        current_num_table_title_text = current_top_tab.objectName() + " - Numerical Table"
-                        current_tex_table_title_text = current_top_tab.objectName() + " - Textual Table"
-                        csv_file_writer = csv.writer(csv_file_handler)
-                        current_num_table_items = copy.deepcopy(current_num_table_view.model().items)
-                        #Remove raw periods
-                        for item in current_num_table_items:
-                            del(item[1])
-                        #Remove empty rows
-                        empty_rows_gone = False
-                        while not empty_rows_gone:
-                            for index, item in enumerate(current_num_table_items):
-                                if item[0] is None:
-                                    empty_rows_gone = False
-                                    current_num_table_items.pop(index)
-                            current_rows = []
-                            if len(current_num_table_items) > 0:
-                                for item in current_num_table_items:
-                                    current_rows.append(item[0])
-                                    if None in current_rows:
-                                        empty_rows_gone = False
-                                    else:
-                                        empty_rows_gone = True
-                            else:
-                                empty_rows_gone = True
-                        empty_rows_gone = False
-                        #Insert index
-                        for index, item in enumerate(current_num_table_items):
-                            item.insert(0, index + 1)
-                        #Insert header
-                        current_num_table_items.insert(0, ["#", "CIK", "View", "Entity", "Filing", "Fact", "Context", "Value", "Unit", "Dec"])
-                        #Insert tab header
-                        current_num_table_items.insert(0, [current_num_table_title_text, "", "", "", "", "", "", "", "", ""])
-                        #Remove commas
-                        for item in current_num_table_items:
-                            for sub_item in item:
-                                sub_item = str(sub_item).replace(",", "")
-                        #Write rows
-                        for item in current_num_table_items:
-                            csv_file_writer.writerow(item)
+                        current_num_table_view = current_top_tab.num_table_view
+                        current_num_tables.append(self.getNumTableItems(current_top_tab, current_num_table_view))
 
                         tab_index += 1
 
                 elif mode == "single_tab":
-                    csv_file_handler = open(out_file, "w", newline = "")
                     tab_index = self.book_main_window.mainTabWidget.currentIndex()
                     current_top_tab = self.book_main_window.mainTabWidget.widget(tab_index)
-                    current_num_table_view = current_top_tab.findChild(QtWidgets.QTableView, "numericalTableView")
-                    current_num_table_title_text = current_top_tab.objectName() + " - Numerical Table"
-                    csv_file_writer = csv.writer(csv_file_handler)
-                    current_num_table_items = copy.deepcopy(current_num_table_view.model().items)
-                    #Remove raw periods
-                    for item in current_num_table_items:
-                        del(item[1])
-                    #Remove empty rows
-                    empty_rows_gone = False
-                    while not empty_rows_gone:
-                        for index, item in enumerate(current_num_table_items):
-                            if item[0] is None:
-                                empty_rows_gone = False
-                                current_num_table_items.pop(index)
-                        current_rows = []
-                        if len(current_num_table_items) > 0:
-                            for item in current_num_table_items:
-                                current_rows.append(item[0])
-                                if None in current_rows:
-                                    empty_rows_gone = False
-                                else:
-                                    empty_rows_gone = True
-                        else:
-                            empty_rows_gone = True
-                    empty_rows_gone = False
-                    #Insert index
-                    for index, item in enumerate(current_num_table_items):
-                        item.insert(0, index + 1)
-                    #Insert header
-                    current_num_table_items.insert(0, ["#", "CIK", "View", "Entity", "Filing", "Fact", "Context", "Value", "Unit", "Dec"])
-                    #Insert tab header
-                    current_num_table_items.insert(0, [current_num_table_title_text, "", "", "", "", "", "", "", "", ""])
-                    #Remove commas
-                    for item in current_num_table_items:
-                        for sub_item in item:
-                            sub_item = str(sub_item).replace(",", "")
-                    #Write rows
-                    for item in current_num_table_items:
-                        csv_file_writer.writerow(item)
-
-                csv_file_handler.close()
+                    current_num_table_view = current_top_tab.num_table_view
+                    current_num_tables.append(self.getNumTableItems(current_top_tab, current_num_table_view))
+
+                self.startExportTask(BookExportTask(out_file, "csv", current_num_tables))
 
             return
         except Exception as err:
-            export_utility_logger.error("{0}:BookExporter.exportCsv():{1}".format(str(datetime.datetime.now()), str(err)))
+            export_utility_logger.error("BookExporter.exportCsv():{0}".format(str(err)))
+
+class BookExportSignals(QtCore.QObject):
+    """
+    BookExportSignals
+    ~~~~~~~~~~~~~~~~~
+    Signals of a BookExportTask; QRunnable is not a QObject, so it cannot declare signals itself
+
+    Attributes
+    ~~~~~~~~~~
+    progress (QtCore.Signal type); percentage of tabs written so far
+    finished (QtCore.Signal type); emitted once the export file is closed, True if it was written completely
+    """
+
+    progress = QtCore.Signal(int)
+    finished = QtCore.Signal(bool)
+
+class BookExportTask(QtCore.QRunnable):
+    """
+    BookExportTask
+    ~~~~~~~~~~~~~~
+    Custom sub-class of QRunnable; writes an export file away from the GUI thread
+
+    Functions
+    ~~~~~~~~~
+    buildCsvNumTable(self, current_num_table_title_text, current_num_table_items) - generates the csv rows (tab header, header, items) of a numerical table
+    run(self) - writes the contents of every tab to out_file, emitting progress after each tab
+
+    Attributes
+    ~~~~~~~~~~
+    out_file (string type); path of the export file
+    file_type (string type); "csv" (tab contents are (title, rows) from getNumTableItems) or "html" (tab contents are lists of html fragments)
+    tab_contents (list type); contents of each exported tab, gathered on the GUI thread
+    signals (BookExportSignals type); progress and finished signals
+    """
+
+    def __init__(self, out_file, file_type, tab_contents):
+        export_utility_logger.info("Initializing BookExportTask")
+        QtCore.QRunnable.__init__(self)
+        self.out_file = out_file
+        self.file_type = file_type
+        self.tab_contents = tab_contents
+        self.signals = BookExportSignals()
+
+    def buildCsvNumTable(self, current_num_table_title_text, current_num_table_items):
+        try:
+            #Rows are generated as csv.writer consumes them, so no second copy of the table is held
+            #Tab header and header
+            yield [current_num_table_title_text, "", "", "", "", "", "", "", "", ""]
+            yield ["#", "CIK", "View", "Entity", "Filing", "Fact", "Context", "Value", "Unit", "Dec"]
+            #Insert index, remove raw periods and commas
+            for row_index, item in enumerate(current_num_table_items, 1):
+                current_row = [row_index]
+                for sub_item in item[:1] + item[2:]:
+                    if isinstance(sub_item, str):
+                        sub_item = sub_item.replace(",", "")
+                    current_row.append(sub_item)
+                yield current_row
+        except Exception as err:
+            export_utility_logger.error("BookExportTask.buildCsvNumTable():{0}".format(str(err)))
+
+    def run(self):
+        try:
+            if self.file_type == "csv":
+                export_file = open(self.out_file, "w", newline = "", buffering = EXPORT_BUFFER_SIZE)
+                csv_file_writer = csv.writer(export_file)
+            else:
+                export_file = open(self.out_file, "w", buffering = EXPORT_BUFFER_SIZE)
+            try:
+                for tab_index, tab_content in enumerate(self.tab_contents):
+                    if self.file_type == "csv":
+                        csv_file_writer.writerows(self.buildCsvNumTable(*tab_content))
+                    else:
+                        export_file.write("".join(tab_content))
+                    self.signals.progress.emit(int(100 * (tab_index + 1) / len(self.tab_contents)))
+            finally:
+                export_file.close()
+            self.signals.finished.emit(True)
+        except Exception as err:
+            export_utility_logger.error("BookExportTask.run():{0}".format(str(err)))
+            self.signals.finished.emit(False)
+
+        return
@@ -12,14 +12,14 @@
 """
 
 try:
-    import importlib, os, sys, datetime, logging
+    import contextlib, importlib, os, sys, logging
     filing_manager_logger = logging.getLogger()
     # Tiered
     # from . import (BookFilingUtility, BookView)
     # Flat
     import BookFilingUtility, BookView
 except Exception as err:
-    filing_manager_logger.error("{0}:BookFilingManager import error:{1}".format(str(datetime.datetime.now()), str(err)))
+    filing_manager_logger.error("BookFilingManager import error:{0}".format(str(err)))
 
 class BookFilingManager():
     """
@@ -33,8 +33,15 @@ class BookFilingManager():
     getEntityTreeInfo(self) - retrieves entity tree information in the form of a list of tuples, where each tuple is a row [(entity_cik, parent_cik, entity_name)]
     getFilingTreeInfo(self, target_cik) - retrieves filing tree information in the form of a list of strings, where each string corresponds to a filing available for viewing
     updateParentInfo(self, child_cik, parent_cik) - updates the parent_cik for a given child_cik
-    importFactFile(self, target_fact_uri) - parses and imports an Arelle-generated fact file into the currently-open database
-    manualImportFactFile(self, manual_cik, manual_name, manual_period, target_fact_uri) - given parameters from user, parses and imports an Arelle-generated fact file into the currently-open database
+    beginBatch(self) - starts a transaction shared by all following database calls, until commitBatch or rollbackBatch
+    commitBatch(self) - commits the transaction started by beginBatch
+    rollbackBatch(self) - rolls back the transaction started by beginBatch
+    bulkTransaction(self) - context manager; the database calls made inside it share one transaction, committed on exit and rolled back if the block raises
+    makeFilingsTables(self, target_periods) - creates the missing filings tables for a list of periods; called before bulkTransaction, whose rollback would not undo them
+    confirmImport(self, target_fact_uri, target_cik, target_filing) - checks for a filing already in the database for the same cik and period, and asks the user whether to overwrite it; True if the fact file should be imported
+    importFactFile(self, target_fact_uri, target_cik) - parses and imports an Arelle-generated fact file into the currently-open database; raises on failure, so bulkTransaction rolls back
+    confirmManualImport(self, manual_cik, manual_name, manual_period) - checks for a filing already in the database at the cik and period given by the user, and asks whether to overwrite it; True if the fact file should be imported
+    manualImportFactFile(self, manual_cik, manual_name, manual_period, target_fact_uri) - given parameters from user, parses and imports an Arelle-generated fact file into the currently-open database; raises on failure, so bulkTransaction rolls back
     removeEntity(self, target_cik) - removes an entity and its children from the currently-open database
     removeFiling(self, target_cik, target_period) - removes a filing item and its children from the currently-open database
     getFiling(self, current_cik, current_period) - queries the database and gets a filing, given a cik and period; None otherwise
@@ -46,204 +53,214 @@ class BookFilingManager():
     Attributes
     ~~~~~~~~~~
     book_main_window - (BookView.BookMainWindow type); access to book main window and related functionality
+    db_util - (module type); BookDatabaseUtility, bound by initDb; None until then
     """
 
     def __init__(self, book_main_window):
-        filing_manager_logger.info("{0}:Initializing BookFilingManager".format(str(datetime.datetime.now())))
+        filing_manager_logger.info("Initializing BookFilingManager")
         self.book_main_window = book_main_window
+        self.db_util = None
 
     def initDb(self, close = False):
         try:
             global db_util
-            try:
+            # Tiered
+            # if "XBRLStudio1.src.BookDatabaseUtility" not in sys.modules:
+            # Flat
+            if "BookDatabaseUtility" not in sys.modules:
                 # Tiered
-                # if "XBRLStudio1.src.BookDatabaseUtility" not in sys.modules:
+                # from . import BookDatabaseUtility as db_util
                 # Flat
-                if "BookDatabaseUtility" not in sys.modules:
-                    # Tiered
-                    # from . import BookDatabaseUtility as db_util
-                    # Flat
-                    import BookDatabaseUtility as db_util
-                db_util.buildEngine(BookView.Global_db_uri)
-                if not db_util.tableExists("entities"):
-                    db_util.makeEntityTable()
-                return True
-            except Exception as err:
-                filing_manager_logger.error("{0}:BookFilingManager.initDb() inner:{1}".format(str(datetime.datetime.now()), str(err)))
-                return False
+                import BookDatabaseUtility as db_util
+            self.db_util = db_util #bound once; the other methods use the attribute instead of a module global
+            db_util.buildEngine(BookView.Global_db_uri)
+            if not db_util.tableExists("entities"):
+                db_util.makeEntityTable()
+            return True
         except Exception as err:
-            filing_manager_logger.error("{0}:BookFilingManager.initDb() outer:{1}".format(str(datetime.datetime.now()), str(err)))
+            filing_manager_logger.error("BookFilingManager.initDb():%s", err)
             return False
 
     def getEntityTreeInfo(self):
         try:
-            global db_util
-            try:
-                entity_tree_info = db_util.getEntityTreeInfo()
-                return entity_tree_info
-            except Exception as err:
-                filing_manager_logger.error("{0}:BookFilingManager.getEntityTreeInfo() inner:{1}".format(str(datetime.datetime.now()), str(err)))
-                return
+            entity_tree_info = self.db_util.getEntityTreeInfo()
+            return entity_tree_info
         except Exception as err:
-            filing_manager_logger.error("{0}:BookFilingManager.getEntityTreeInfo() outer:{1}".format(str(datetime.datetime.now()), str(err)))
+            filing_manager_logger.error("BookFilingManager.getEntityTreeInfo():%s", err)
 
     def getFilingTreeInfo(self, target_cik):
         try:
-            global db_util
-            try:
-                if target_cik is not None:
-                    filing_info = db_util.getFilingTreeInfo(target_cik)
-                    return filing_info
-                else:
-                    filing_info = None
-                    return filing_info
-            except Exception as err:
-                filing_manager_logger.error("{0}:BookFilingManager.getFilingTreeInfo() inner:{1}".format(str(datetime.datetime.now()), str(err)))
-                return
+            if target_cik is not None:
+                filing_info = self.db_util.getFilingTreeInfo(target_cik)
+                return filing_info
+            else:
+                filing_info = None
+                return filing_info
         except Exception as err:
-            filing_manager_logger.error("{0}:BookFilingManager.getFilingTreeInfo() outer:{1}".format(str(datetime.datetime.now()), str(err)))
+            filing_manager_logger.error("BookFilingManager.getFilingTreeInfo():%s", err)
 
     def updateParentInfo(self, child_cik, parent_cik):
         try:
-            global db_util
-            try:
-                if child_cik is not None:
-                    if db_util.updateEntityParent(child_cik, parent_cik):
-                        return True
-                    else:
-                        return False
+            if child_cik is not None:
+                if self.db_util.updateEntityParent(child_cik, parent_cik):
+                    return True
                 else:
                     return False
-            except Exception as err:
-                filing_manager_logger.error("{0}:BookFilingManager.updateParentInfo() inner:{1}".format(str(datetime.datetime.now()), str(err)))
+            else:
                 return False
         except Exception as err:
-            filing_manager_logger.error("{0}:BookFilingManager.updateParentInfo() outer:{1}".format(str(datetime.datetime.now()), str(err)))
+            filing_manager_logger.error("BookFilingManager.updateParentInfo():%s", err)
+            return False
+
+    def beginBatch(self):
+        try:
+            self.db_util.beginBatch()
+        except Exception as err:
+            filing_manager_logger.error("BookFilingManager.beginBatch():%s", err)
+
+        return
+
+    def commitBatch(self):
+        try:
+            self.db_util.commitBatch()
+        except Exception as err:
+            filing_manager_logger.error("BookFilingManager.commitBatch():%s", err)
+
+        return
+
+    def rollbackBatch(self):
+        try:
+            self.db_util.rollbackBatch()
+        except Exception as err:
+            filing_manager_logger.error("BookFilingManager.rollbackBatch():%s", err)
+
+        return
+
+    @contextlib.contextmanager
+    def bulkTransaction(self):
+        self.beginBatch()
+        try:
+            yield
+        except Exception:
+            self.rollbackBatch()
+            raise
+        self.commitBatch()
+
+    def makeFilingsTables(self, target_periods):
+        try:
+            self.db_util.makeFilingsTables(target_periods)
+        except Exception as err:
+            filing_manager_logger.error("BookFilingManager.makeFilingsTables():%s", err)
+
+        return
+
+    def confirmImport(self, target_fact_uri, target_cik = None, target_filing = None):
+        try:
+            pre_existing_filings = self.db_util.existsInDatabase(target_fact_uri, target_cik, target_filing)
+            if len(pre_existing_filings) >= 1:
+                continue_choice = self.book_main_window.preExistingFilingWarning(pre_existing_filings)
+                return continue_choice is True
+            else:
+                return True
+        except Exception as err:
+            filing_manager_logger.error("BookFilingManager.confirmImport():%s", err)
+            return False
 
     def importFactFile(self, target_fact_uri, target_cik = None):
         try:
-            global db_util
-            try:
-                pre_existing_filings = db_util.existsInDatabase(target_fact_uri, target_cik)
-                if len(pre_existing_filings) >= 1:
-                    continue_choice = self.book_main_window.preExistingFilingWarning(pre_existing_filings)
-                    if continue_choice is True:
-                        db_util.addToDatabase(target_fact_uri, target_cik)
-                    else:
-                        return
-                else:
-                    db_util.addToDatabase(target_fact_uri, target_cik)
-            except Exception as err:
-                filing_manager_logger.error("{0}:BookFilingManager.importFactFile() inner:{1}".format(str(datetime.datetime.now()), str(err)))
-                return
+            self.db_util.addToDatabase(target_fact_uri, target_cik)
         except Exception as err:
-            filing_manager_logger.error("{0}:BookFilingManager.importFactFile() outer:{1}".format(str(datetime.datetime.now()), str(err)))
+            filing_manager_logger.error("BookFilingManager.importFactFile():%s", err)
+            raise
 
         return
 
+    def confirmManualImport(self, manual_cik, manual_name, manual_period):
+        try:
+            pre_existing_filing = self.db_util.manualExistsInDatabase(manual_cik, manual_period)
+            if pre_existing_filing == True:
+                overwrite = self.book_main_window.manualPreExistingFilingWarning(manual_name, manual_period)
+                return overwrite is True
+            else:
+                return True
+        except Exception as err:
+            filing_manager_logger.error("BookFilingManager.confirmManualImport():%s", err)
+            return False
+
     def manualImportFactFile(self, manual_cik, manual_name, manual_period, target_fact_uri):
         try:
-            global db_util
-            try:
-                pre_existing_filing = db_util.manualExistsInDatabase(manual_cik, manual_period)
-                if pre_existing_filing == True:
-                    overwrite = self.book_main_window.manualPreExistingFilingWarning(manual_name, manual_period)
-                    if overwrite:
-                        db_util.manualAddToDatabase(manual_cik, manual_name, manual_period, target_fact_uri)
-                    else:
-                        return
-                else:
-                    db_util.manualAddToDatabase(manual_cik, manual_name, manual_period, target_fact_uri)
-            except Exception as err:
-                filing_manager_logger.error("{0}:BookFilingManager.manualImportFactFile() inner:{1}".format(str(datetime.datetime.now()), str(err)))
+            self.db_util.manualAddToDatabase(manual_cik, manual_name, manual_period, target_fact_uri)
         except Exception as err:
-            filing_manager_logger.error("{0}:BookFilingManager.manualImportFactFile() outer:{1}".format(str(datetime.datetime.now()), str(err)))
+            filing_manager_logger.error("BookFilingManager.manualImportFactFile():%s", err)
+            raise
 
         return
 
     def removeEntity(self, target_cik):
         try:
-            global db_util
-            try:
-                if target_cik is not None:
-                    db_util.removeEntityFromDatabase(self.book_main_window, target_cik, call = 0, total_items = 0)
-                else:
-                    filing_manager_logger.error("{0}:BookFilingManager.removeEntity() inner:{1}".format(str(datetime.datetime.now()), "target_cik is None"))
-            except Exception as err:
-                filing_manager_logger.error("{0}:BookFilingManager.removeEntity() middle:{1}".format(str(datetime.datetime.now()), str(err)))
+            if target_cik is not None:
+                self.db_util.removeEntityFromDatabase(self.book_main_window, target_cik, call = 0, total_items = 0)
+            else:
+                filing_manager_logger.error("BookFilingManager.removeEntity():%s", "target_cik is None")
         except Exception as err:
-            filing_manager_logger.error("{0}:BookFilingManager.removeEntity() outer:{1}".format(str(datetime.datetime.now()), str(err)))
+            filing_manager_logger.error("BookFilingManager.removeEntity():%s", err)
 
         return
 
     def removeFiling(self, target_cik, target_period):
         try:
-            global db_util
-            try:
-                if target_cik is not None and target_period is not None:
-                    db_util.removeFilingFromDatabase(self.book_main_window, target_cik, target_period, call = 0, total_items = 0)
-                else:
-                    filing_manager_logger.error("{0}:BookFilingManager.removeFiling() inner:{1}".format(str(datetime.datetime.now()), "None in target_cik or target_period"))
-            except Exception as err:
-                filing_manager_logger.error("{0}:BookFilingManager.removeFiling() middle:{1}".format(str(datetime.datetime.now()), str(err)))
+            if target_cik is not None and target_period is not None:
+                self.db_util.removeFilingFromDatabase(self.book_main_window, target_cik, target_period, call = 0, total_items = 0)
+            else:
+                filing_manager_logger.error("BookFilingManager.removeFiling():%s", "None in target_cik or target_period")
         except Exception as err:
-            filing_manager_logger.error("{0}:BookFilingManager.removeFiling() outer:{1}".format(str(datetime.datetime.now()), str(err)))
+            filing_manager_logger.error("BookFilingManager.removeFiling():%s", err)
 
         return
 
     def getFiling(self, current_cik, current_period):
         try:
-            global db_util
-            try:
-                if current_cik is not None and current_period is not None:
-                    filing = db_util.selectFromDatabase(current_cik, current_period)
-                    return filing
-                else:
-                    filing_manager_logger.error("{0}:BookFilingManager.getFiling() inner:{1}".format(str(datetime.datetime.now()), "None in current_cik or current_period"))
-                    filing = None
-                    return filing
-            except Exception as err:
-                filing_manager_logger.error("{0}:BookFilingManager.getFiling() middle:{1}".format(str(datetime.datetime.now()), str(err)))
-                return None
+            if current_cik is not None and current_period is not None:
+                filing = self.db_util.selectFromDatabase(current_cik, current_period)
+                return filing
+            else:
+                filing_manager_logger.error("BookFilingManager.getFiling():%s", "None in current_cik or current_period")
+                filing = None
+                return filing
         except Exception as err:
-            filing_manager_logger.error("{0}:BookFilingManager.getFiling() outer:{1}".format(str(datetime.datetime.now()), str(err)))
+            filing_manager_logger.error("BookFilingManager.getFiling():%s", err)
+            return None
 
     def getFilingInfo(self, filing):
         try:
             if filing is not None:
                 return BookFilingUtility.getFilingInfo(filing)
             else:
-                filing_manager_logger.error("{0}:BookFilingManager.getFiling() inner:{1}".format(str(datetime.datetime.now()), "None in filing"))
+                filing_manager_logger.error("BookFilingManager.getFilingInfo():%s", "None in filing")
                 return None
         except Exception as err:
-            filing_manager_logger.error("{0}:BookFilingManager.getFilingInfo() outer:{1}".format(str(datetime.datetime.now()), str(err)))
+            filing_manager_logger.error("BookFilingManager.getFilingInfo():%s", err)
 
     def getNameFromCik(self, target_cik):
         try:
-            global db_util
-            try:
-                current_name = db_util.getNameFromCik(target_cik)
-                return current_name
-            except Exception as err:
-                filing_manager_logger.error("{0}:BookFilingManager.getNameFromCik() inner:{1}".format(str(datetime.datetime.now()), str(err)))
+            current_name = self.db_util.getNameFromCik(target_cik)
+            return current_name
         except Exception as err:
-            filing_manager_logger.error("{0}:BookFilingManager.getNameFromCik() outer:{1}".format(str(datetime.datetime.now()), str(err)))
+            filing_manager_logger.error("BookFilingManager.getNameFromCik():%s", err)
 
         return
 
     def getEntityDict(self):
         try:
-            global db_util
             entity_dict = {}
-            entity_dict = db_util.getEntityDict()
+            entity_dict = self.db_util.getEntityDict()
 
             return entity_dict
         except Exception as err:
-            filing_manager_logger.error("{0}:BookFilingManager.getEntityDict():{1}".format(str(datetime.datetime.now()), str(err)))
+            filing_manager_logger.error("BookFilingManager.getEntityDict():%s", err)
 
     def renameEntity(self, target_cik, new_name):
         try:
-            global db_util
-            db_util.renameEntityInDatabase(target_cik, new_name)
+            self.db_util.renameEntityInDatabase(target_cik, new_name)
         except Exception as err:
-            filing_manager_logger.error("{0}:BookFilingManager.renameEntity():{1}".format(str(datetime.datetime.now()), str(err)))
+            filing_manager_logger.error("BookFilingManager.renameEntity():%s", err)
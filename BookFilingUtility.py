@@ -14,23 +14,75 @@
 
                   Contains the following functions:
 
-        isXbrlInstance - determines whether a file is an XBRL instance or not
+        isXbrlCandidate - cheap prefilter on file extension and the root start tag, if it is within the first 4 KB; False when a file cannot be an XBRL instance
+        isXbrlInstance - determines whether a file is an XBRL instance or not; cached per file version
+        readXbrlInstance - reads the root element of a file to determine whether it is an XBRL instance (cached by isXbrlInstance)
         isAlphaOrHtml - determines whether a Fact is a textual or numerical business fact
         getFilingInfo - analyzes a Filing object and returns information relevant for display and database storage
-        isImportable - determines whether a fact file can be imported into a XBRLStudio sqlite database
+        readFilingInfo - reads only the dei facts of a fact file, returning its importability, a Filing of those facts and getFilingInfo results together
         parseFactFile - converts a fact file (produced by an Arelle controller) into a Filing object
+        parseFactFileRows - generates one dict per fact of a fact file, keyed by Fact attribute, as the file is parsed
+        getRawPeriod - converts a displayed period ('2015-Q1') into the stored form ('q12015'); a bare year is returned unchanged
+        getPrettyPeriod - converts a stored period ('q12015') into the displayed form ('2015-Q1')
         decodeHtml - converts a text block (string) into formatted html (string)
 """
 
 try:
-    import os, sys, datetime, logging
+    import functools, os, re, sys, logging
     filing_utility_logger = logging.getLogger()
-    import xml.etree.ElementTree as etree
-    # from lxml import etree
+    try:
+        from lxml import etree #optional; faster on large fact files
+    except ImportError:
+        import xml.etree.ElementTree as etree
     from html.parser import HTMLParser
     from html.entities import name2codepoint
 except Exception as err:
-    filing_utility_logger.error("{0}:BookFilingUtility import error:{1}".format(str(datetime.datetime.now()), str(err)))
+    filing_utility_logger.error("BookFilingUtility import error:{0}".format(str(err)))
+
+#isXbrlCandidate prefilter; only a head whose root start tag is complete and declares no xbrl namespace is rejected,
+#anything the sniff cannot decide (unknown encoding, prolog or root tag longer than the head) is left to the parser
+XBRL_EXTENSIONS = frozenset((".xml", ".xbrl"))
+XBRL_HEAD_SIZE = 4096
+XBRL_HEAD_ENCODINGS = ((b"\xef\xbb\xbf", "utf-8", 3), #byte order marks, skipped
+                       (b"\xff\xfe", "utf-16-le", 2),
+                       (b"\xfe\xff", "utf-16-be", 2),
+                       (b"<\x00", "utf-16-le", 0), #UTF-16 without a byte order mark (XML 1.0, appendix F)
+                       (b"\x00<", "utf-16-be", 0))
+XML_PROLOG_RE = re.compile(r'\s*(?:<\?.*?\?>|<!--.*?-->|<!DOCTYPE(?:[^\[>]|\[.*?\])*>)', re.S) #declaration, comments, PIs, DOCTYPE
+XML_ROOT_TAG_RE = re.compile(r'\s*<[^\s!?/>][^\s/>]*(?:\s+[^\s=/>]+\s*=\s*(?:"[^"]*"|\'[^\']*\'))*\s*/?>')
+XBRL_NS_RE = re.compile(r'xmlns[^=]*=\s*(?:"[^"]*xbrl|\'[^\']*xbrl)') #attribute values may use either quote
+
+#isAlphaOrHtml precheck; values matching NUMERIC_VALUE_RE (commas removed) are numerical, values whose first character
+#is not a digit or in FLOAT_LEAD_CHARS cannot be parsed by float() and are textual; anything else is left to float()
+NUMERIC_VALUE_RE = re.compile(r"-?[0-9]+(?:\.[0-9]+)?(?:[eE][+-]?[0-9]+)?\Z")
+FLOAT_LEAD_CHARS = frozenset("+-.iInN") #sign, leading point, inf/nan
+
+#isXbrlInstance results kept, one per file version
+XBRL_INSTANCE_CACHE_SIZE = 256
+
+#dei fact name -> getFilingInfo field
+DEI_FACT_FIELDS = {"dei:EntityRegistrantName":"entity_name",
+                   "dei:DocumentFiscalYearFocus":"filing_year",
+                   "dei:DocumentFiscalPeriodFocus":"filing_period",
+                   "dei:EntityCentralIndexKey":"entity_cik",
+                   "dei:DocumentPeriodEndDate":"filing_end_date"}
+
+#fact file child tag -> Fact attribute
+FACT_CHILD_ATTRS = {"label":"label",
+                    "contextRef":"context_ref",
+                    "unitRef":"unit_ref",
+                    "dec":"dec",
+                    "prec":"prec",
+                    "lang":"lang",
+                    "value":"value",
+                    "entityScheme":"entity_scheme",
+                    "entityIdentifier":"entity_identifier",
+                    "period":"period",
+                    "dimensions":"dimensions"}
+
+#Fact attributes repeated across most facts of a filing; parseFactFile interns their values
+FACT_INTERNED_ATTRS = frozenset(("name", "context_ref", "unit_ref", "dec", "prec", "lang",
+                                 "entity_scheme", "entity_identifier", "period"))
 
 class Filing():
     """
@@ -44,42 +96,81 @@ class Filing():
     __eq__(self, other) - equals function used, e.g., by set()
     __ne__(self, other) - not-equals function used, e.g., by set()
     __hash__(self) - hash function used, e.g., by set()
+    __getstate__(self) - pickled state; the facts, without the cached hash
+    __setstate__(self, state) - restores a pickled Filing, including ones pickled before Filing used __slots__
+    getFact(self, label, context_ref) - returns the only fact with label and context_ref, or None if there is none or more than one
 
     Attributes
     ~~~~~~~~~~
-    facts (list type); list of Fact objects, each representing a business fact from a parsed fact file
+    facts (tuple type); Fact objects, each representing a business fact from a parsed fact file
     """
 
+    __slots__ = ("facts", "_hash_cache", "_fact_index")
+
     def __init__(self, facts):
-        filing_utility_logger.info("{0}:Initializing Filing".format(str(datetime.datetime.now())))
-        self.facts = facts
+        filing_utility_logger.info("Initializing Filing")
+        self.facts = tuple(facts) #a tuple, so the key is hashable
+        self._hash_cache = None
+        self._fact_index = None
 
     def __key(self):
         try:
             return self.facts
         except Exception as err:
-            filing_utility_logger.error("{0}:Filing.__key():{1}".format(str(datetime.datetime.now()), str(err)))
+            filing_utility_logger.error("Filing.__key():{0}".format(str(err)))
 
     def __eq__(self, other):
         try:
             return self.__key() == other.__key()
         except Exception as err:
-            filing_utility_logger.error("{0}:Filing.__eq__():{1}".format(str(datetime.datetime.now()), str(err)))
+            filing_utility_logger.error("Filing.__eq__():{0}".format(str(err)))
 
     def __ne__(self, other):
         try:
-            if self.__eq__(self, other):
+            if self.__eq__(other):
                 return False
             else:
                 return True
         except Exception as err:
-            filing_utility_logger.error("{0}:Filing.__ne__():{1}".format(str(datetime.datetime.now()), str(err)))
+            filing_utility_logger.error("Filing.__ne__():{0}".format(str(err)))
 
     def __hash__(self):
         try:
-            return hash(self.__key())
+            if self._hash_cache is None:
+                self._hash_cache = hash(self.__key())
+            return self._hash_cache
+        except Exception as err:
+            filing_utility_logger.error("Filing.__hash__():{0}".format(str(err)))
+
+    def __getstate__(self):
+        try:
+            return {"facts":self.facts}
+        except Exception as err:
+            filing_utility_logger.error("Filing.__getstate__():{0}".format(str(err)))
+
+    def __setstate__(self, state):
+        try:
+            #Filings pickled before __slots__ carry their __dict__, with facts as a list
+            self.facts = tuple(state["facts"])
+            self._hash_cache = None
+            self._fact_index = None
         except Exception as err:
-            filing_utility_logger.error("{0}:Filing.__hash__():{1}".format(str(datetime.datetime.now()), str(err)))
+            filing_utility_logger.error("Filing.__setstate__():{0}".format(str(err)))
+
+    def getFact(self, label, context_ref):
+        try:
+            #Built on first use; facts never change, so the index stays valid for the life of the Filing
+            if self._fact_index is None:
+                fact_index = {}
+                for fact in self.facts:
+                    fact_key = (fact.label, fact.context_ref)
+                    indexed_fact = fact_index.setdefault(fact_key, fact)
+                    if indexed_fact is not fact and (indexed_fact is None or indexed_fact != fact):
+                        fact_index[fact_key] = None #distinct facts share label and context_ref
+                self._fact_index = fact_index
+            return self._fact_index.get((label, context_ref))
+        except Exception as err:
+            filing_utility_logger.error("Filing.getFact():{0}".format(str(err)))
 
 class Fact():
     """
@@ -93,6 +184,8 @@ class Fact():
     __eq__(self, other) - equals function used, e.g., by set()
     __ne__(self, other) - not-equals function used, e.g., by set()
     __hash__(self) - hash function used, e.g., by set()
+    __getstate__(self) - pickled state; the fact attributes, without the cached key and hash
+    __setstate__(self, state) - restores a pickled Fact, including ones pickled before Fact used __slots__
 
     Attributes
     ~~~~~~~~~~
@@ -110,6 +203,11 @@ class Fact():
     dimensions (string type); fact dimensions (not used by XBRLStudio)
     """
 
+    #Facts are the most numerous objects in XBRLStudio; __slots__ drops the per-instance __dict__
+    FACT_ATTRS = ("label", "name", "context_ref", "unit_ref", "dec", "prec", "lang", "value",
+                  "entity_scheme", "entity_identifier", "period", "dimensions")
+    __slots__ = FACT_ATTRS + ("_key_cache", "_hash_cache")
+
     def __init__(self, label = None, name = None, context_ref = None, unit_ref = None,
                  dec = None, prec = None, lang = None, value = None, entity_scheme = None,
                  entity_identifier = None, period = None, dimensions = None):
@@ -125,34 +223,57 @@ class Fact():
         self.entity_identifier = entity_identifier
         self.period = period
         self.dimensions = dimensions
+        self._key_cache = None
+        self._hash_cache = None
 
     def __key(self):
         try:
-            return(self.label, self.name, self.context_ref, self.unit_ref, self.dec, self.prec,
-               self.lang, self.value, self.entity_scheme, self.entity_identifier, self.period, self.dimensions)
+            #Facts are not changed once parseFactFile has built them, so the key and hash are computed once
+            if self._key_cache is None:
+                self._key_cache = (self.label, self.name, self.context_ref, self.unit_ref, self.dec, self.prec,
+                   self.lang, self.value, self.entity_scheme, self.entity_identifier, self.period, self.dimensions)
+            return self._key_cache
         except Exception as err:
-            filing_utility_logger.error("{0}:Fact.__key():{1}".format(str(datetime.datetime.now()), str(err)))
+            filing_utility_logger.error("Fact.__key():{0}".format(str(err)))
 
     def __eq__(self, other):
         try:
             return self.__key() == other.__key()
         except Exception as err:
-            filing_utility_logger.error("{0}:Fact.__eq__():{1}".format(str(datetime.datetime.now()), str(err)))
+            filing_utility_logger.error("Fact.__eq__():{0}".format(str(err)))
 
     def __ne__(self, other):
         try:
-            if self.__eq__(self, other):
+            if self.__eq__(other):
                 return False
             else:
                 return True
         except Exception as err:
-            filing_utility_logger.error("{0}:Fact.__ne__():{1}".format(str(datetime.datetime.now()), str(err)))
+            filing_utility_logger.error("Fact.__ne__():{0}".format(str(err)))
 
     def __hash__(self):
         try:
-            return hash(self.__key())
+            if self._hash_cache is None:
+                self._hash_cache = hash(self.__key())
+            return self._hash_cache
+        except Exception as err:
+            filing_utility_logger.error("Fact.__hash__():{0}".format(str(err)))
+
+    def __getstate__(self):
+        try:
+            return {attr_name:getattr(self, attr_name) for attr_name in self.FACT_ATTRS}
         except Exception as err:
-            filing_utility_logger.error("{0}:Fact.__hash__():{1}".format(str(datetime.datetime.now()), str(err)))
+            filing_utility_logger.error("Fact.__getstate__():{0}".format(str(err)))
+
+    def __setstate__(self, state):
+        try:
+            #Facts pickled before __slots__ carry their __dict__, which holds the same attribute names
+            self._key_cache = None
+            self._hash_cache = None
+            for attr_name in self.FACT_ATTRS:
+                setattr(self, attr_name, state.get(attr_name))
+        except Exception as err:
+            filing_utility_logger.error("Fact.__setstate__():{0}".format(str(err)))
 
 class MyHTMLParser(HTMLParser):
     """
@@ -173,98 +294,132 @@ class MyHTMLParser(HTMLParser):
 
     Attributes
     ~~~~~~~~~~
-    element - main string containing the html to be delivered
+    element - list of the html pieces to be delivered, joined by retrieveElement
     """
     def __init__(self):
         HTMLParser.__init__(self)
-        self.element = ""
+        self.element = []
 
     def handle_starttag(self, tag, attrs):
-        self.element += str(tag)
+        self.element.append(tag)
         for attr in attrs:
-            self.element += str(attr)
+            self.element.append(str(attr))
 
     def handle_endtag(self, tag):
-        self.element += str(tag)
+        self.element.append(tag)
 
     def handle_data(self, data):
-        self.element += str(data)
+        self.element.append(data)
 
     def handle_comment(self, data):
-        self.element += str(data)
+        self.element.append(data)
 
     def handle_entityref(self, name):
-        c = chr(name2codepoint[name])
-        self.element += str(c)
+        self.element.append(chr(name2codepoint[name]))
 
     def handle_charref(self, name):
-        self.element += str(name)
+        self.element.append(name)
 
     def handle_decl(self, data):
-        self.element += str(data)
+        self.element.append(data)
 
     def retrieveElement(self):
-        return self.element
+        return "".join(self.element)
 
-def isXbrlInstance(uri):
+def isXbrlCandidate(uri):
     try:
-        uri_tree = etree.parse(uri)
-        uri_tree_root = uri_tree.getroot()
-        if "instance" in uri_tree_root.tag:
-            return True
-        else:
+        if os.path.splitext(uri)[1].lower() not in XBRL_EXTENSIONS:
             return False
+        with open(uri, "rb") as candidate_file:
+            head = candidate_file.read(XBRL_HEAD_SIZE)
+        #Markup is ASCII in every ASCII-compatible encoding, so anything without a UTF-16 signature is read as latin-1
+        head_encoding, head_start = "latin-1", 0
+        for head_mark, mark_encoding, mark_size in XBRL_HEAD_ENCODINGS:
+            if head.startswith(head_mark):
+                head_encoding, head_start = mark_encoding, mark_size
+                break
+        head_text = head[head_start:].decode(head_encoding, errors = "replace")
+        if "\x00" in head_text: #another multi-byte encoding (e.g., UTF-32)
+            return True
+        #The namespace of the root element is declared on its start tag, which follows the prolog
+        head_pos = 0
+        prolog_match = XML_PROLOG_RE.match(head_text)
+        while prolog_match is not None:
+            head_pos = prolog_match.end()
+            prolog_match = XML_PROLOG_RE.match(head_text, head_pos)
+        root_match = XML_ROOT_TAG_RE.match(head_text, head_pos)
+        if root_match is None: #no complete root start tag within the head
+            return True
+        return XBRL_NS_RE.search(root_match.group()) is not None
     except Exception as err:
-        filing_utility_logger.error("{0}:isXbrlInstance():{1}".format(str(datetime.datetime.now()), str(err)))
+        filing_utility_logger.error("isXbrlCandidate():{0}".format(str(err)))
+        return True
+
+def isXbrlInstance(uri):
+    try:
+        #Results are cached per file version, so a file is read again only once it has been modified
+        uri_stat = os.stat(uri)
+        return readXbrlInstance(uri, uri_stat.st_mtime_ns, uri_stat.st_size)
+    except Exception as err:
+        filing_utility_logger.error("isXbrlInstance():{0}".format(str(err)))
+
+@functools.lru_cache(maxsize = XBRL_INSTANCE_CACHE_SIZE)
+def readXbrlInstance(uri, uri_mtime_ns, uri_size):
+    try:
+        #Only the root element is parsed; the modification time and size are only part of the cache key
+        with open(uri, "rb") as uri_file:
+            for event, uri_tree_root in etree.iterparse(uri_file, events = ("start",)):
+                if "instance" in uri_tree_root.tag:
+                    return True
+                else:
+                    return False
+        return False
+    except Exception as err:
+        filing_utility_logger.error("readXbrlInstance():{0}".format(str(err)))
 
 def isAlphaOrHtml(target_fact):
     try:
         try:
-            temp = None
-            temp = float(target_fact.value.replace(",", ""))
+            #Plain numbers and values that cannot start a float (html, most text) are decided without raising
+            if target_fact.value is None: #fact value is NoneType - group with html facts
+                return True
+            fact_value = target_fact.value.replace(",", "").strip()
+            if NUMERIC_VALUE_RE.match(fact_value) is not None:
+                return False
+            if fact_value == "" or not (fact_value[0].isdecimal() or fact_value[0] in FLOAT_LEAD_CHARS):
+                return True
+            float(fact_value)
             return False
         except ValueError: #fact value is non-integer (i.e., string)
             return True
-        except TypeError: #fact value is NoneType - group with html facts
-            return True
     except Exception as err:
-        filing_utility_logger.error("{0}:isAlphaOrHtml():{1}".format(str(datetime.datetime.now()), str(err)))
+        filing_utility_logger.error("isAlphaOrHtml():{0}".format(str(err)))
 
 def getFilingInfo(filing):
     try:
-        entity_name = None
-        filing_year = None
         filing_period = None
-        entity_cik = None
         entity_parent_cik = None
-        filing_end_date = None
         entity_cik_list = []
+        get_dei_field = DEI_FACT_FIELDS.get
+        dei_values = {}
         for fact in filing.facts:
-            if fact.name == "dei:EntityRegistrantName": #entity name
-                try:
-                    entity_name = str(fact.value)
-                except Exception as err:
-                    pass
-            if fact.name == "dei:DocumentFiscalYearFocus": #filing year
-                try:
-                    filing_year = str(fact.value)
-                except Exception as err:
-                    pass
-            if fact.name == "dei:DocumentFiscalPeriodFocus": #filing quarter/fy
-                try:
-                    filing_period = str(fact.value).lower()
-                except Exception as err:
-                    pass
-            if fact.name == "dei:EntityCentralIndexKey": #cik
+            #fact names are interned by parseFactFile, so their hashes are cached and this lookup is the only work done
+            #for the non-dei facts; a startswith("dei:") prefilter would cost about as much as the lookup itself
+            dei_field = get_dei_field(fact.name)
+            if dei_field is None: #not a dei fact used here
+                continue
+            if dei_field == "entity_cik":
                 try:
                     entity_cik_list.append(int(fact.value))
-                except Exception as err:
-                    pass
-            if fact.name == "dei:DocumentPeriodEndDate": #document end date (more prevalent)
-                try:
-                    filing_end_date = str(fact.value)
-                except Exception as err:
+                except (TypeError, ValueError):
                     pass
+            else:
+                dei_values[dei_field] = str(fact.value)
+        entity_name = dei_values.get("entity_name")
+        filing_year = dei_values.get("filing_year")
+        filing_end_date = dei_values.get("filing_end_date") #document end date (more prevalent)
+        if "filing_period" in dei_values: #filing quarter/fy
+            filing_period = dei_values["filing_period"].lower()
         if filing_period is not None and filing_year is not None:
             if filing_period == "fy":
                 filing_period = "q4"
@@ -285,61 +440,78 @@ def getFilingInfo(filing):
             else:
                 pass
 
-        for entity_cik in entity_cik_list:
-            entity_cik = "{0:010d}".format(entity_cik)
-
         return entity_cik_list, entity_parent_cik, entity_name, filing_period
     except Exception as err:
-        filing_utility_logger.error("{0}:getFilingInfo():{1}".format(str(datetime.datetime.now()), str(err)))
+        filing_utility_logger.error("getFilingInfo():{0}".format(str(err)))
 
-def isImportable(target_fact_uri):
+def readFilingInfo(target_fact_uri):
     try:
-        target_filing = parseFactFile(target_fact_uri)
+        #the fact file is still read in full, but Fact objects are built only for the few facts getFilingInfo uses
+        target_filing = Filing([Fact(**fact_row) for fact_row in parseFactFileRows(target_fact_uri) if fact_row["name"] in DEI_FACT_FIELDS])
         target_cik_list, target_parent_cik, target_name, target_period = getFilingInfo(target_filing)
 
         if len(target_cik_list) == 0 or None in (target_name, target_period):
-            return False
+            filing_importable = False
         else:
-            return True
+            filing_importable = True
+
+        return filing_importable, target_filing, target_cik_list, target_parent_cik, target_name, target_period
     except Exception as err:
-        filing_utility_logger.error("{0}:isImportable():{1}".format(str(datetime.datetime.now()), str(err)))
+        filing_utility_logger.error("readFilingInfo():{0}".format(str(err)))
+        return False, None, [], None, None, None
 
 def parseFactFile(target_fact_uri):
     try:
-        fact_object_list = []
-        uri_tree = etree.parse(target_fact_uri)
-        fact_list = uri_tree.getroot()
-
-        for item in fact_list:
-            new_fact = Fact(name = item.attrib["name"])
-            for child in item:
-                if child.tag == "label":
-                    new_fact.label = child.text
-                if child.tag == "contextRef":
-                    new_fact.context_ref = child.text
-                if child.tag == "unitRef":
-                    new_fact.unit_ref = child.text
-                if child.tag == "dec":
-                    new_fact.dec = child.text
-                if child.tag == "prec":
-                    new_fact.prec = child.text
-                if child.tag == "lang":
-                    new_fact.lang = child.text
-                if child.tag == "value":
-                    new_fact.value = child.text
-                if child.tag == "entityScheme":
-                    new_fact.entity_scheme = child.text
-                if child.tag == "entityIdentifier":
-                    new_fact.entity_identifier = child.text
-                if child.tag == "period":
-                    new_fact.period = child.text
-                if child.tag == "dimensions":
-                    new_fact.dimensions = child.text
-            fact_object_list.append(new_fact)
-
-        return Filing(fact_object_list)
+        return Filing([Fact(**fact_row) for fact_row in parseFactFileRows(target_fact_uri)])
+    except Exception as err:
+        filing_utility_logger.error("parseFactFile():{0}".format(str(err)))
+
+def parseFactFileRows(target_fact_uri):
+    try:
+        fact_list = None
+        fact_attrs = FACT_CHILD_ATTRS
+        interned_attrs = FACT_INTERNED_ATTRS
+        intern = sys.intern
+        depth = 0
+
+        #Facts are read as the file is parsed; each one is dropped from the tree once it is complete, so the
+        #whole fact file is never held in memory as a tree
+        for event, item in etree.iterparse(target_fact_uri, events = ("start", "end")):
+            if event == "start":
+                if fact_list is None:
+                    fact_list = item
+                depth += 1
+                continue
+            depth -= 1
+            if depth == 1: #direct child of the root, i.e., a fact
+                fact_row = {"name":intern(item.attrib["name"])}
+                for child in item:
+                    fact_attr = fact_attrs.get(child.tag)
+                    if fact_attr is not None:
+                        fact_text = child.text
+                        if fact_text is not None and fact_attr in interned_attrs:
+                            fact_text = intern(fact_text)
+                        fact_row[fact_attr] = fact_text
+                fact_list.clear()
+                yield fact_row
+    except Exception as err:
+        filing_utility_logger.error("parseFactFileRows():{0}".format(str(err)))
+        raise #a partly read fact file must not pass for a complete one
+
+def getRawPeriod(pretty_period):
+    try:
+        filing_year, separator, filing_quarter = pretty_period.partition("-")
+        if separator:
+            return filing_quarter.lower() + filing_year
+        return pretty_period
+    except Exception as err:
+        filing_utility_logger.error("getRawPeriod():{0}".format(str(err)))
+
+def getPrettyPeriod(raw_period):
+    try:
+        return raw_period[2:6] + "-" + raw_period[0:2].upper()
     except Exception as err:
-        filing_utility_logger.error("{0}:parseFactFile():{1}".format(str(datetime.datetime.now()), str(err)))
+        filing_utility_logger.error("getPrettyPeriod():{0}".format(str(err)))
 
 def decodeHtml(text_block):
     try:
@@ -347,4 +519,4 @@ def decodeHtml(text_block):
         parser.feed(text_block)
         return parser.retrieveElement()
     except Exception as err:
-        filing_utility_logger.error("{0}:decodeHtml():{1}".format(str(datetime.datetime.now()), str(err)))
+        filing_utility_logger.error("decodeHtml():{0}".format(str(err)))
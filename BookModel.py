@@ -18,7 +18,7 @@
 """
 
 try:
-    import copy, sys, os, datetime, logging
+    import sys, os, logging
     model_logger = logging.getLogger()
     from PySide2 import (QtCore, QtWidgets, QtGui)
     # Tiered
@@ -26,7 +26,16 @@ try:
     # Flat
     import BookFilingUtility
 except Exception as err:
-    model_logger.error("{0}:BookModel import error:{1}".format(str(datetime.datetime.now()), str(err)))
+    model_logger.error("BookModel import error:%s", err)
+
+#item data roles, read by BookTableModel.data() on every paint
+DISPLAY_ROLE = QtCore.Qt.DisplayRole
+DECORATION_ROLE = QtCore.Qt.DecorationRole
+EDIT_ROLE = QtCore.Qt.EditRole
+TEXT_ALIGNMENT_ROLE = QtCore.Qt.TextAlignmentRole
+
+#BookTableModel.items row layout: cik, period, view, entity, filing, fact, context, value, unit, dec
+TABLE_ITEM_WIDTH = 10
 
 class BookTableModel(QtCore.QAbstractTableModel):
     """
@@ -43,6 +52,7 @@ class BookTableModel(QtCore.QAbstractTableModel):
     data(self, index, role) - returns the items object at the given index position, for the given role
     headerData(self, section, orientation, role) - sets labels for the columns, and other column attributes
     setData(self, index, value, role) - assigns an items object to be equal to the given value, according to position (index) and role
+    setItemsData(self, rows, column, value) - applies a selection in column to each of rows, without refreshing the graphic; False if a fact was not found
     insertFilingIntoTable(self, current_cik, current_period) - inserts the selected entity name and filing into items
     flags(self, index) - function for QAbstractTableModel flags; defines aspects of the different columns
     setHeaderData(self, section, orientation, value, role) - default implementation of QAbstractTableModel.setHeaderData
@@ -55,26 +65,58 @@ class BookTableModel(QtCore.QAbstractTableModel):
     row_count - (int type); number of rows (initialized to be 10)
     items - (list type); main model collection of bool, string, and int values for use by the view
     view_indices - (list type); used (e.g., by BookView.BookMainWindow instance) to create persistent checkboxes in 'View' column
-    sub_items - (list type); used during the initial creation of the items matrix (items[row][column])
+    free_row - (int type); no row before this one has an empty cik; where insertFilingIntoTable starts looking for an empty row
+    column_count - (int type); number of columns, 8 for numerical tables and 5 for textual tables
+    display_columns - (frozenset type); columns whose items are returned for DisplayRole; the 'View' column is drawn by its persistent editor
+    EDIT_COLUMNS - (frozenset type); columns whose items are returned for EditRole
+    TEXT_ALIGNMENTS - (dict type); text alignment of the value, unit and dec columns {column:alignment}
+    COLUMN_FLAGS - (dict type); item flags of each column {column:flags}
+    HEADER_LABELS - (dict type); horizontal header labels {section:label}
+    HEADER_VIEW_SIZE, HEADER_SIZE, HEADER_ROW_SIZE - (QtCore.QSize type); size hints of the 'View' header, the other column headers and the row headers
     """
 
+    #headerData is called for every header section on each repaint; labels and sizes are built once
+    HEADER_LABELS = {0:"View", 1:"Entity", 2:"Filing", 3:"Fact", 4:"Context", 5:"Value", 6:"Unit", 7:"Dec"}
+    HEADER_VIEW_SIZE = QtCore.QSize(45, 25)
+    HEADER_SIZE = QtCore.QSize(100, 25)
+    HEADER_ROW_SIZE = QtCore.QSize(40, 25)
+    #data() is called for every cell and role on each repaint
+    EDIT_COLUMNS = frozenset((0, 1, 2, 3, 4))
+    TEXT_ALIGNMENTS = {5:QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter,
+                       6:QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter,
+                       7:QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter}
+    #flags() is called for every cell on each repaint as well
+    COLUMN_FLAGS = {0:QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsEditable | QtCore.Qt.ItemIsSelectable | QtCore.Qt.ItemIsUserCheckable,
+                    1:QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsEditable | QtCore.Qt.ItemIsSelectable | QtCore.Qt.ItemIsDropEnabled,
+                    2:QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsEditable | QtCore.Qt.ItemIsSelectable | QtCore.Qt.ItemIsDropEnabled,
+                    3:QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsEditable | QtCore.Qt.ItemIsSelectable,
+                    4:QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsEditable | QtCore.Qt.ItemIsSelectable,
+                    5:QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsEditable | QtCore.Qt.ItemIsSelectable,
+                    6:QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsEditable | QtCore.Qt.ItemIsSelectable,
+                    7:QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsEditable | QtCore.Qt.ItemIsSelectable}
+
     def __init__(self, book_table_view):
-        model_logger.info("{0}:Initializing BookTableModel".format(str(datetime.datetime.now())))
+        model_logger.info("Initializing BookTableModel")
         QtCore.QAbstractTableModel.__init__(self)
         self.book_table_view = book_table_view
         self.row_count = 10
-        self.items = []
-        self.view_indices = []
-        #cik, period, view, entity, filing, fact, context, value, unit, dec
-        self.sub_items = [None, None, None, None, None, None, None, None, None, None]
-        for i in range(0, self.row_count):
-            self.items.append(copy.deepcopy(self.sub_items))
+        #rows only hold None, ints, strings and bools, so each is a fresh [None] * TABLE_ITEM_WIDTH rather than a deep copy
+        self.items = [[None] * TABLE_ITEM_WIDTH for i in range(self.row_count)]
+        self.free_row = 0
+        #made with the rows, rather than by data() while the view paints
+        self.view_indices = [self.createIndex(row, 0) for row in range(self.row_count)]
+        self.column_count = None
+        self.display_columns = frozenset()
         if self.book_table_view.objectName() == "numericalTableView":
             self.setObjectName("numericalTableModel")
+            self.column_count = 8
+            self.display_columns = frozenset((1, 2, 3, 4, 5, 6, 7))
         elif self.book_table_view.objectName() == "textualTableView":
             self.setObjectName("textualTableModel")
+            self.column_count = 5
+            self.display_columns = frozenset((1, 2, 3, 4)) #values are shown in the textual graphic, not the table
         else:
-            model_logger.error("{0}:BookTableModel.book_table_view.objectName(): unacceptable return value".format(str(datetime.datetime.now())))
+            model_logger.error("BookTableModel.book_table_view.objectName(): unacceptable return value")
 
     def rowCount(self, parent):
 
@@ -83,8 +125,8 @@ class BookTableModel(QtCore.QAbstractTableModel):
     def addRows(self, num_rows):
         self.layoutAboutToBeChanged.emit()
 
-        for i in range(self.row_count, self.row_count + num_rows):
-            self.items.append(copy.deepcopy(self.sub_items))
+        self.items.extend([None] * TABLE_ITEM_WIDTH for i in range(num_rows))
+        self.view_indices.extend(self.createIndex(row, 0) for row in range(self.row_count, self.row_count + num_rows))
         self.row_count += num_rows
 
         self.layoutChanged.emit()
@@ -92,95 +134,42 @@ class BookTableModel(QtCore.QAbstractTableModel):
         return
 
     def columnCount(self, parent):
-        if self.objectName() == "textualTableModel":
-            return 5
-        elif self.objectName() == "numericalTableModel":
-            return 8
-        else:
-            model_logger.error("{0}:BookTableModel.columnCount(): unacceptable object name".format(str(datetime.datetime.now())))
+        if self.column_count is None:
+            model_logger.error("BookTableModel.columnCount(): unacceptable object name")
+
+        return self.column_count
 
     def data(self, index, role):
         if not index.isValid():
-            model_logger.warning("{0}:BookTableModel.data(): invalid index".format(str(datetime.datetime.now())))
+            model_logger.warning("BookTableModel.data(): invalid index")
             return
-        if index.column() == 0:
-            if len(self.view_indices) < self.row_count:
-                row = len(self.view_indices)
-                while row < self.row_count:
-                    self.view_indices.append(index.sibling(row, 0))
-                    row += 1
-            if role == QtCore.Qt.DisplayRole:
-                pass
-            elif role == QtCore.Qt.DecorationRole:
+        #one test per role, then a set or dict lookup on the column
+        column = index.column()
+        if role == DISPLAY_ROLE:
+            if column in self.display_columns:
+                return self.items[index.row()][column + 2]
+        elif role == EDIT_ROLE:
+            if column in self.EDIT_COLUMNS:
+                return self.items[index.row()][column + 2]
+        elif role == TEXT_ALIGNMENT_ROLE:
+            return self.TEXT_ALIGNMENTS.get(column)
+        elif role == DECORATION_ROLE:
+            if column == 0:
                 return QtCore.Qt.AlignCenter
-            elif role == QtCore.Qt.EditRole:
-                return self.items[index.row()][index.column() + 2]
-        elif index.column() in (1, 2, 3, 4):
-            if role in (QtCore.Qt.DisplayRole, QtCore.Qt.EditRole):
-                return self.items[index.row()][index.column() + 2]
-        elif index.column() in (5, 6, 7):
-            if role == QtCore.Qt.DisplayRole:
-                if self.objectName() == "numericalTableModel":
-                    return self.items[index.row()][index.column() + 2]
-                elif self.objectName() == "textualTableModel":
-                    return None
-            if index.column() == 5:
-                if role == QtCore.Qt.TextAlignmentRole:
-                    return QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter
-            if index.column() == 6 or index.column() == 7:
-                if role == QtCore.Qt.TextAlignmentRole:
-                    return QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter
-        else:
-            model_logger.warning("{0}:BookTableModel.data(): invalid index.column()".format(str(datetime.datetime.now())))
-            return
+
+        return
 
     def headerData(self, section, orientation, role):
         if orientation == QtCore.Qt.Horizontal:
-            if section == 0:
-                if role == QtCore.Qt.DisplayRole:
-                    return "View"
-                elif role == QtCore.Qt.SizeHintRole:
-                    return QtCore.QSize(45, 25)
-            elif section == 1:
-                if role == QtCore.Qt.DisplayRole:
-                    return "Entity"
-                elif role == QtCore.Qt.SizeHintRole:
-                    return QtCore.QSize(100, 25)
-            elif section == 2:
-                if role == QtCore.Qt.DisplayRole:
-                    return "Filing"
-                elif role == QtCore.Qt.SizeHintRole:
-                    return QtCore.QSize(100, 25)
-            elif section == 3:
-                if role == QtCore.Qt.DisplayRole:
-                    return "Fact"
-                elif role == QtCore.Qt.SizeHintRole:
-                    return QtCore.QSize(100, 25)
-            elif section == 4:
-                if role == QtCore.Qt.DisplayRole:
-                    return "Context"
-                elif role == QtCore.Qt.SizeHintRole:
-                    return QtCore.QSize(100, 25)
-            elif section == 5:
-                if role == QtCore.Qt.DisplayRole:
-                    return "Value"
-                elif role == QtCore.Qt.SizeHintRole:
-                    return QtCore.QSize(100, 25)
-            elif section == 6:
-                if role == QtCore.Qt.DisplayRole:
-                    return "Unit"
-                elif role == QtCore.Qt.SizeHintRole:
-                    return QtCore.QSize(100, 25)
-            elif section == 7:
-                if role == QtCore.Qt.DisplayRole:
-                    return "Dec"
-                elif role == QtCore.Qt.SizeHintRole:
-                    return QtCore.QSize(100, 25)
+            if role == QtCore.Qt.DisplayRole:
+                return self.HEADER_LABELS.get(section)
+            elif role == QtCore.Qt.SizeHintRole and section in self.HEADER_LABELS:
+                return self.HEADER_VIEW_SIZE if section == 0 else self.HEADER_SIZE
         elif orientation == QtCore.Qt.Vertical:
             if role == QtCore.Qt.DisplayRole:
                 return str(section + 1)
             elif role == QtCore.Qt.SizeHintRole:
-                return QtCore.QSize(40, 25)
+                return self.HEADER_ROW_SIZE
 
         return
 
@@ -189,87 +178,89 @@ class BookTableModel(QtCore.QAbstractTableModel):
             if value is not None and index.isValid():
                 if index.column() == 0: #view toggled
                     self.book_table_view.closePersistentEditor(index)
-                    self.items[index.row()][2] = value
+                    self.setItemsData((index.row(),), 0, value)
                     self.book_table_view.openPersistentEditor(index)
-                    self.book_table_view.refreshGraphic()
-                elif index.column() == 1: #entity selected (set cik)
-                    # TODO - rearrange for this to be cik_name_dict ({cik:name})
-                    name_cik_dict = self.book_table_view.book_main_window.cntlr.book_filing_manager.getEntityDict()
-                    current_cik = int(name_cik_dict[value])
-                    self.items[index.row()][0] = current_cik
-                    self.items[index.row()][3] = value
-                elif index.column() == 2: #filing selected (set period)
-                    current_period = value.split("-")[1].lower() + value.split("-")[0]
-                    self.items[index.row()][1] = current_period
-                    self.items[index.row()][4] = value
-                elif index.column() == 3: #fact selected
-                    self.items[index.row()][5] = value
-                elif index.column() == 4: #context selected (set value and unit)
-                    self.items[index.row()][6] = value
-                    current_cik = self.items[index.row()][0]
-                    current_period = self.items[index.row()][1]
-                    current_filing = self.book_table_view.book_main_window.cntlr.book_filing_manager.getFiling(current_cik, current_period)
-                    current_fact_name = self.items[index.row()][5]
-                    current_context = str(value)
-                    current_facts = set()
-                    if current_filing is not None:
-                        for fact_item in current_filing.facts:
-                            if fact_item.label == current_fact_name:
-                                if fact_item.context_ref == current_context:
-                                    current_facts.add(fact_item)
-                    if len(current_facts) == 1:
-                        if self.objectName() == "numericalTableModel":
-                            self.items[index.row()][7] = list(current_facts)[0].value
-                            self.items[index.row()][8] = list(current_facts)[0].unit_ref
-                            self.items[index.row()][9] = list(current_facts)[0].dec
-                        elif self.objectName() == "textualTableModel":
-                            self.items[index.row()][7] = list(current_facts)[0].value
-                            self.items[index.row()][8] = list(current_facts)[0].unit_ref
-                            self.items[index.row()][9] = list(current_facts)[0].dec
-                    elif len(current_facts) != 1:
-                        return False
+                elif not self.setItemsData((index.row(),), index.column(), value):
+                    return False
                 self.book_table_view.refreshGraphic()
                 return True
         except Exception as err:
-            model_logger.error("{0}:BookTableModel.setData():{1}".format(str(datetime.datetime.now()), str(err)))
+            model_logger.error("BookTableModel.setData():%s", err)
 
         return
 
+    def setItemsData(self, rows, column, value):
+        try:
+            #Updates items only; callers emit dataChanged and refresh the graphic once for all rows
+            items = self.items
+            all_set = True
+            if column == 0: #view toggled
+                for row in rows:
+                    items[row][2] = value
+            elif column == 1: #entity selected (set cik)
+                # TODO - rearrange for this to be cik_name_dict ({cik:name})
+                name_cik_dict = self.book_table_view.book_main_window.cntlr.book_filing_manager.getEntityDict()
+                current_cik = int(name_cik_dict[value])
+                for row in rows:
+                    items[row][0] = current_cik
+                    items[row][3] = value
+            elif column == 2: #filing selected (set period)
+                current_period = BookFilingUtility.getRawPeriod(value)
+                for row in rows:
+                    items[row][1] = current_period
+                    items[row][4] = value
+            elif column == 3: #fact selected
+                for row in rows:
+                    items[row][5] = value
+            elif column == 4: #context selected (set value and unit)
+                current_context = str(value)
+                for row in rows:
+                    items[row][6] = value
+                    current_filing = self.book_table_view.book_main_window.cntlr.getFiling(items[row][0], items[row][1])
+                    current_fact = None
+                    if current_filing is not None:
+                        current_fact = current_filing.getFact(items[row][5], current_context)
+                    if current_fact is not None:
+                        items[row][7] = current_fact.value
+                        items[row][8] = current_fact.unit_ref
+                        items[row][9] = current_fact.dec
+                    else:
+                        all_set = False
+
+            return all_set
+        except Exception as err:
+            model_logger.error("BookTableModel.setItemsData():%s", err)
+            return False
+
     def insertFilingIntoTable(self, current_cik, current_period):
         try:
             current_filing = self.book_table_view.book_main_window.cntlr.getFiling(current_cik, current_period)
             entity_name = self.book_table_view.book_main_window.cntlr.getNameFromCik(current_cik)
-            pretty_filing_period = current_period[2:6] + "-" + current_period[0:2].upper()
-            i = 0
-            while i < self.row_count:
-                if self.items[i][0] == None:
-                    self.items[i][0] = int(current_cik)
-                    self.items[i][1] = current_period
-                    self.items[i][3] = entity_name
-                    self.items[i][4] = pretty_filing_period
-                    self.book_table_view.update()
-                    i = self.row_count
+            pretty_filing_period = BookFilingUtility.getPrettyPeriod(current_period)
+            #rows are never emptied, so the first free row is never before free_row; each row is passed over once per table
+            i = self.free_row
+            while i < self.row_count and self.items[i][0] is not None:
                 i += 1
+            self.free_row = i
+            if i < self.row_count:
+                self.items[i][0] = int(current_cik)
+                self.items[i][1] = current_period
+                self.items[i][3] = entity_name
+                self.items[i][4] = pretty_filing_period
+                self.free_row = i + 1
+                self.book_table_view.update()
         except Exception as err:
-            model_logger.error("{0}:BookTableModel.insertFilingIntoTable():{1}".format(str(datetime.datetime.now()), str(err)))
+            model_logger.error("BookTableModel.insertFilingIntoTable():%s", err)
 
     def flags(self, index):
-        try:
-            if not index.isValid():
-                model_logger.info("{0}:BookTableModel.flags(): invalid index".format(str(datetime.datetime.now())))
-                return QtCore.Qt.ItemIsEnabled
-            if index.column() == 0:
-                return QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsEditable | QtCore.Qt.ItemIsSelectable | QtCore.Qt.ItemIsUserCheckable
-            elif index.column() == 1 or index.column() == 2:
-                return QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsEditable | QtCore.Qt.ItemIsSelectable | QtCore.Qt.ItemIsDropEnabled
-            elif index.column() == 3 or index.column() == 4:
-                return QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsEditable | QtCore.Qt.ItemIsSelectable
-            elif index.column() == 5 or index.column() == 6 or index.column() == 7:
-                return QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsEditable | QtCore.Qt.ItemIsSelectable
-            else:
-                model_logger.warning("{0}:BookTableModel.flags(): invalid index.column()".format(str(datetime.datetime.now())))
-        except Exception as err:
-            model_logger.error("{0}:BookTableModel.flags():{1}".format(str(datetime.datetime.now()), str(err)))
+        if not index.isValid():
+            model_logger.info("BookTableModel.flags(): invalid index")
+            return QtCore.Qt.ItemIsEnabled
+        column_flags = self.COLUMN_FLAGS.get(index.column())
+        if column_flags is None:
+            model_logger.warning("BookTableModel.flags(): invalid index.column()")
+
+        return column_flags
 
     def setHeaderData(self, section, orientation, value, role):
         QtCore.QAbstractTableModel.setHeaderData(self, section, orientation, value, role)
@@ -284,29 +275,33 @@ class BookTableModel(QtCore.QAbstractTableModel):
             if num_rows > 0:
                 try:
                     if fill_text is not None and fill_text is not "":
-                        i = row_pos
-                        while i < self.row_count:
-                            current_index = self.createIndex(i, col_pos)
-                            self.setData(current_index, fill_text, QtCore.Qt.EditRole)
-                            i += 1
+                        self.setItemsData(range(row_pos, self.row_count), col_pos, fill_text)
+                        self.dataChanged.emit(index, self.createIndex(self.row_count - 1, self.column_count - 1))
+                        self.book_table_view.refreshGraphic()
                     self.book_table_view.update()
                 except Exception as err:
-                    model_logger.error("{0}:BookTableModel.fillDown():{1}".format(str(datetime.datetime.now()), str(err)))
+                    model_logger.error("BookTableModel.fillDown():%s", err)
         except Exception as err:
-            model_logger.error("{0}:BookTableModel.fillDown():{1}".format(str(datetime.datetime.now()), str(err)))
+            model_logger.error("BookTableModel.fillDown():%s", err)
 
         return
 
     def viewAll(self):
         try:
-            i = 0
-            while i < self.row_count:
-                current_index = self.createIndex(i, 0)
-                self.setData(current_index, True, QtCore.Qt.EditRole)
-                i += 1
+            if self.row_count > 0:
+                self.setItemsData(range(self.row_count), 0, True)
+                #The persistent checkboxes are checked with their signals blocked, so toggled does not refresh the graphic once per row
+                for view_index in self.view_indices:
+                    view_ch = self.book_table_view.indexWidget(view_index)
+                    if view_ch is not None:
+                        view_ch.blockSignals(True)
+                        view_ch.setChecked(True)
+                        view_ch.blockSignals(False)
+                self.dataChanged.emit(self.view_indices[0], self.view_indices[-1])
+                self.book_table_view.refreshGraphic()
             self.book_table_view.update()
         except Exception as err:
-            model_logger.error("{0}:BookTableModel.viewAll():{1}".format(str(datetime.datetime.now()), str(err)))
+            model_logger.error("BookTableModel.viewAll():%s", err)
 
         return
 
@@ -331,7 +326,7 @@ class BookEntityTreeModel(QtGui.QStandardItemModel):
     """
 
     def __init__(self, book_main_window, raw_items = None):
-        model_logger.info("{0}:Initializing BookEntityTreeModel".format(str(datetime.datetime.now())))
+        model_logger.info("Initializing BookEntityTreeModel")
         QtGui.QStandardItemModel.__init__(self)
         self.book_main_window = book_main_window
         self.raw_items = raw_items
@@ -348,14 +343,14 @@ class BookEntityTreeModel(QtGui.QStandardItemModel):
             self.book_main_window.entity_tree_view.refresh()
             return
         else:
-            model_logger.error("{0}:BookEntityTreeModel.itemMoved(): update attempt failed".format(str(datetime.datetime.now())))
+            model_logger.error("BookEntityTreeModel.itemMoved(): update attempt failed")
             return
 
     def populateRawItems(self):
         try:
             self.raw_items = self.book_main_window.cntlr.book_filing_manager.getEntityTreeInfo()
         except Exception as err:
-            model_logger.error("{0}:BookEntityTreeModel.populateRawItems():{1}".format(str(datetime.datetime.now()), str(err)))
+            model_logger.error("BookEntityTreeModel.populateRawItems():%s", err)
 
         return
 
@@ -363,7 +358,7 @@ class BookEntityTreeModel(QtGui.QStandardItemModel):
         try:
             self.book_main_window.cntlr.renameEntity(target_cik, new_name)
         except Exception as err:
-            model_logger.error("{0}:BookEntityTreeModel.renameItem():{1}".format(str(datetime.datetime.now()), str(err)))
+            model_logger.error("BookEntityTreeModel.renameItem():%s", err)
 
     def flags(self, index):
         try:
@@ -373,7 +368,7 @@ class BookEntityTreeModel(QtGui.QStandardItemModel):
 
             return flags
         except Exception as err:
-            model_logger.error("{0}:BookEntityTreeModel.flags():{1}".format(str(datetime.datetime.now()), str(err)))
+            model_logger.error("BookEntityTreeModel.flags():%s", err)
 
             return
 
@@ -396,7 +391,7 @@ class BookEntityTreeItem(QtGui.QStandardItem):
     """
 
     def __init__(self, cik, parent_cik, name, children = None):
-        model_logger.info("{0}:Initializing BookEntityTreeItem".format(str(datetime.datetime.now())))
+        model_logger.info("Initializing BookEntityTreeItem")
         QtGui.QStandardItem.__init__(self)
         self.setEditable(False)
         self.cik = cik
@@ -408,10 +403,11 @@ class BookEntityTreeItem(QtGui.QStandardItem):
 
     def setChildren(self):
         try:
-            for row, child in enumerate(self.children):
-                self.setChild(row, child)
+            #One insertion for all children, instead of growing the child table (and notifying the model) once per child
+            if self.children:
+                self.appendRows(self.children)
         except Exception as err:
-            model_logger.error("{0}:BookEntityTreeItem.setChildren():{1}".format(str(datetime.datetime.now()), str(err)))
+            model_logger.error("BookEntityTreeItem.setChildren():%s", err)
 
 class BookFilingTreeModel(QtGui.QStandardItemModel):
     """
@@ -430,7 +426,7 @@ class BookFilingTreeModel(QtGui.QStandardItemModel):
     """
 
     def __init__(self, book_main_window, raw_items = None):
-        model_logger.info("{0}:Initializing BookFilingTreeModel".format(str(datetime.datetime.now())))
+        model_logger.info("Initializing BookFilingTreeModel")
         QtGui.QStandardItemModel.__init__(self)
         self.book_main_window = book_main_window
         self.raw_items = raw_items
@@ -440,7 +436,7 @@ class BookFilingTreeModel(QtGui.QStandardItemModel):
             if target_cik is not None:
                 self.raw_items = self.book_main_window.cntlr.book_filing_manager.getFilingTreeInfo(target_cik)
         except Exception as err:
-            model_logger.error("{0}:BookFilingTreeModel.populateRawItems():{1}".format(str(datetime.datetime.now()), str(err)))
+            model_logger.error("BookFilingTreeModel.populateRawItems():%s", err)
 
 class BookFilingTreeItem(QtGui.QStandardItem):
     """
@@ -460,7 +456,7 @@ class BookFilingTreeItem(QtGui.QStandardItem):
     """
 
     def __init__(self, period, cik = None, children = None):
-        model_logger.info("{0}:Initializing BookFilingTreeItem".format(str(datetime.datetime.now())))
+        model_logger.info("Initializing BookFilingTreeItem")
         QtGui.QStandardItem.__init__(self)
         self.cik = cik
         self.period = period
@@ -469,10 +465,11 @@ class BookFilingTreeItem(QtGui.QStandardItem):
 
     def setChildren(self):
         try:
-            for row, child in enumerate(self.children):
-                self.setChild(row, child)
+            #One insertion for all children, instead of growing the child table (and notifying the model) once per child
+            if self.children:
+                self.appendRows(self.children)
         except Exception as err:
-            model_logger.error("{0}:BookFilingTreeItem.setChildren():{1}".format(str(datetime.datetime.now()), str(err)))
+            model_logger.error("BookFilingTreeItem.setChildren():%s", err)
 
 class BookLineEdit(QtWidgets.QLineEdit):
     """
@@ -482,6 +479,8 @@ class BookLineEdit(QtWidgets.QLineEdit):
 
     Functions
     ~~~~~~~~~
+    connectActions(self) - connects the main window edit actions (undo, redo, cut, copy, paste, delete, select all) to this line edit
+    disconnectActions(self) - undoes connectActions; called by BookTableViewDelegate.destroyEditor when the editor closes
     contextMenuEvent(self, event) - overrides QLineEdit context menu to add "fill down" option
 
     Attributes
@@ -491,16 +490,45 @@ class BookLineEdit(QtWidgets.QLineEdit):
     book_table_view - (BookView.BookTableView type) - allows access to book table view for fill down functionality
     menu - standard context menu for QLineEdit
     action_fill_down - (QAction type) - activates the fill down functionality in the current book table model using a lambda function
+    action_connections - (list type) - (signal, slot) pairs made by connectActions, for disconnectActions
     """
 
     def __init__(self, parent, index):
-        model_logger.info("{0}:Initializing BookLineEdit".format(str(datetime.datetime.now())))
+        model_logger.info("Initializing BookLineEdit")
         QtWidgets.QLineEdit.__init__(self)
         self.parent = parent
         self.index = index
         self.book_table_view = self.parent.parent()
         self.setContextMenuPolicy(QtCore.Qt.DefaultContextMenu)
         self.setObjectName("BookLineEdit")
+        self.action_connections = []
+
+    def connectActions(self):
+        try:
+            book_main_window = self.book_table_view.book_main_window
+            self.action_connections = [(book_main_window.actionUndo.triggered, self.undo),
+                                       (book_main_window.actionRedo.triggered, self.redo),
+                                       (book_main_window.actionCut.triggered, self.cut),
+                                       (book_main_window.actionCopy.triggered, self.copy),
+                                       (book_main_window.actionPaste.triggered, self.paste),
+                                       (book_main_window.actionDelete.triggered, self.backspace),
+                                       (book_main_window.actionSelectAll.triggered, self.selectAll)]
+            for action_signal, line_edit_slot in self.action_connections:
+                action_signal.connect(line_edit_slot)
+        except Exception as err:
+            model_logger.error("BookLineEdit.connectActions():%s", err)
+
+        return
+
+    def disconnectActions(self):
+        try:
+            for action_signal, line_edit_slot in self.action_connections:
+                action_signal.disconnect(line_edit_slot)
+            self.action_connections = []
+        except Exception as err:
+            model_logger.error("BookLineEdit.disconnectActions():%s", err)
+
+        return
 
     def contextMenuEvent(self, event):
         try:
@@ -511,7 +539,7 @@ class BookLineEdit(QtWidgets.QLineEdit):
             self.menu.exec_(event.globalPos())
             del(self.menu)
         except Exception as err:
-            model_logger.error("{0}:BookLineEdit.contextMenuEvent():{1}".format(str(datetime.datetime.now()), str(err)))
+            model_logger.error("BookLineEdit.contextMenuEvent():%s", err)
 
         return
 
@@ -525,20 +553,31 @@ class BookTableViewDelegate(QtWidgets.QStyledItemDelegate):
     ~~~~~~~~~
     paint(self, painter, option, index) - default implementation of QStyledItemDelegate.paint function
     sizeHint(self, option, index) - default implementation of QStyledItemDelegate.sizeHint function
+    setEntityCompletions(self, entity_names) - refills the shared entity completer, if entity_names is not the list it already holds
     createEditor(self, parent, option, index) - custom implementation, creates at least a combobox for the view
     setEditorData(self, editor, index) - sets the editor data to be equal to the current selection
     setModelData(self, editor, model, index) - sets the model data to be equal to the current selection
+    destroyEditor(self, editor, index) - disconnects the main window actions from the editor's BookLineEdit, then destroys the editor
     updateEditorGeometry(self, editor, option, index) - default implmentation of QStyledItemDelegate.updateEditorGeometry function
 
     Attributes
     ~~~~~~~~~~
     book_table_view - (BookView.BookTableView type); view for instances of this model (model accessed via index)
+    entity_names - (list type); controller entity name list the entity completer was last filled from
+    entity_sl - (QtCore.QStringListModel type); sorted entity names for entity_cm
+    entity_cm - (QtWidgets.QCompleter type); completer shared by the entity editors
     """
 
     def __init__(self, book_table_view):
-        model_logger.info("{0}:Initializing BookTableViewDelegate".format(str(datetime.datetime.now())))
+        model_logger.info("Initializing BookTableViewDelegate")
         QtWidgets.QStyledItemDelegate.__init__(self)
         self.book_table_view = book_table_view
+        #One completer serves every entity editor; it is only refilled when the controller's entity name list changes
+        self.entity_names = None
+        self.entity_sl = QtCore.QStringListModel(self)
+        self.entity_cm = QtWidgets.QCompleter(self)
+        self.entity_cm.setModel(self.entity_sl)
+        self.entity_cm.setCompletionRole(QtCore.Qt.EditRole)
 
     def paint(self, painter, option, index):
         QtWidgets.QStyledItemDelegate.paint(self, painter, option, index)
@@ -549,6 +588,16 @@ class BookTableViewDelegate(QtWidgets.QStyledItemDelegate):
 
         return QtWidgets.QStyledItemDelegate.sizeHint(self, option, index)
 
+    def setEntityCompletions(self, entity_names):
+        try:
+            if entity_names is not self.entity_names:
+                self.entity_sl.setStringList(sorted(entity_names))
+                self.entity_names = entity_names
+        except Exception as err:
+            model_logger.error("BookTableViewDelegate.setEntityCompletions():%s", err)
+
+        return
+
     def createEditor(self, parent, option, index):
         if self.book_table_view.objectName() == "numericalTableView":
             if index.column() == 0: #View
@@ -559,32 +608,18 @@ class BookTableViewDelegate(QtWidgets.QStyledItemDelegate):
                 self.num_entity_cb = QtWidgets.QComboBox(parent)
                 self.num_entity_cb.setSizeAdjustPolicy(QtWidgets.QComboBox.AdjustToMinimumContentsLengthWithIcon)
                 try:
-                    # [cik, parent_cik, name]
-                    self.num_entity_tree_info = self.book_table_view.book_main_window.cntlr.book_filing_manager.getEntityTreeInfo()
-                    self.entity_list = []
-                    for item in self.num_entity_tree_info:
-                        self.entity_list.append(item[2])
-                    self.num_entity_cb.addItems(self.entity_list)
+                    entity_names = self.book_table_view.book_main_window.cntlr.getEntityNames()
+                    self.num_entity_cb.addItems(entity_names)
                     self.num_entity_cb.setEditable(True)
                     self.num_entity_le = BookLineEdit(parent, index)
 
                     self.num_entity_le.undoAvailable = True
                     self.num_entity_le.redoAvailable = True
-                    self.book_table_view.book_main_window.actionUndo.triggered.connect(self.num_entity_le.undo)
-                    self.book_table_view.book_main_window.actionRedo.triggered.connect(self.num_entity_le.redo)
-                    self.book_table_view.book_main_window.actionCut.triggered.connect(self.num_entity_le.cut)
-                    self.book_table_view.book_main_window.actionCopy.triggered.connect(self.num_entity_le.copy)
-                    self.book_table_view.book_main_window.actionPaste.triggered.connect(self.num_entity_le.paste)
-                    self.book_table_view.book_main_window.actionDelete.triggered.connect(self.num_entity_le.backspace)
-                    self.book_table_view.book_main_window.actionSelectAll.triggered.connect(self.num_entity_le.selectAll)
+                    self.num_entity_le.connectActions()
 
                     self.num_entity_cb.setLineEdit(self.num_entity_le)
-                    self.num_entity_cm = QtWidgets.QCompleter(self)
-                    self.num_entity_sl = QtCore.QStringListModel(self)
-                    self.num_entity_cm.setModel(self.num_entity_sl)
-                    self.num_entity_cm.setCompletionRole(QtCore.Qt.EditRole)
-                    self.num_entity_sl.setStringList(sorted(self.entity_list))
-                    self.num_entity_cb.setCompleter(self.num_entity_cm)
+                    self.setEntityCompletions(entity_names)
+                    self.num_entity_cb.setCompleter(self.entity_cm)
                     # self.num_entity_le.setFrame(False)
                     # self.num_entity_le.setTextMargins(0, 0, 10, 0)
                     # self.num_entity_le.setStyleSheet("background-color: rgba(0, 0, 0, 0)")
@@ -603,13 +638,7 @@ class BookTableViewDelegate(QtWidgets.QStyledItemDelegate):
 
                     self.num_filing_le.undoAvailable = True
                     self.num_filing_le.redoAvailable = True
-                    self.book_table_view.book_main_window.actionUndo.triggered.connect(self.num_filing_le.undo)
-                    self.book_table_view.book_main_window.actionRedo.triggered.connect(self.num_filing_le.redo)
-                    self.book_table_view.book_main_window.actionCut.triggered.connect(self.num_filing_le.cut)
-                    self.book_table_view.book_main_window.actionCopy.triggered.connect(self.num_filing_le.copy)
-                    self.book_table_view.book_main_window.actionPaste.triggered.connect(self.num_filing_le.paste)
-                    self.book_table_view.book_main_window.actionDelete.triggered.connect(self.num_filing_le.backspace)
-                    self.book_table_view.book_main_window.actionSelectAll.triggered.connect(self.num_filing_le.selectAll)
+                    self.num_filing_le.connectActions()
 
                     self.num_filing_cb.setLineEdit(self.num_filing_le)
                     self.num_filing_cm = QtWidgets.QCompleter(self)
@@ -638,13 +667,7 @@ class BookTableViewDelegate(QtWidgets.QStyledItemDelegate):
 
                     self.num_fact_le.undoAvailable = True
                     self.num_fact_le.redoAvailable = True
-                    self.book_table_view.book_main_window.actionUndo.triggered.connect(self.num_fact_le.undo)
-                    self.book_table_view.book_main_window.actionRedo.triggered.connect(self.num_fact_le.redo)
-                    self.book_table_view.book_main_window.actionCut.triggered.connect(self.num_fact_le.cut)
-                    self.book_table_view.book_main_window.actionCopy.triggered.connect(self.num_fact_le.copy)
-                    self.book_table_view.book_main_window.actionPaste.triggered.connect(self.num_fact_le.paste)
-                    self.book_table_view.book_main_window.actionDelete.triggered.connect(self.num_fact_le.backspace)
-                    self.book_table_view.book_main_window.actionSelectAll.triggered.connect(self.num_fact_le.selectAll)
+                    self.num_fact_le.connectActions()
 
                     self.num_fact_cb.setLineEdit(self.num_fact_le)
                     self.num_fact_cm = QtWidgets.QCompleter(self)
@@ -674,13 +697,7 @@ class BookTableViewDelegate(QtWidgets.QStyledItemDelegate):
 
                     self.num_con_le.undoAvailable = True
                     self.num_con_le.redoAvailable = True
-                    self.book_table_view.book_main_window.actionUndo.triggered.connect(self.num_con_le.undo)
-                    self.book_table_view.book_main_window.actionRedo.triggered.connect(self.num_con_le.redo)
-                    self.book_table_view.book_main_window.actionCut.triggered.connect(self.num_con_le.cut)
-                    self.book_table_view.book_main_window.actionCopy.triggered.connect(self.num_con_le.copy)
-                    self.book_table_view.book_main_window.actionPaste.triggered.connect(self.num_con_le.paste)
-                    self.book_table_view.book_main_window.actionDelete.triggered.connect(self.num_con_le.backspace)
-                    self.book_table_view.book_main_window.actionSelectAll.triggered.connect(self.num_con_le.selectAll)
+                    self.num_con_le.connectActions()
 
                     self.num_con_cb.setLineEdit(self.num_con_le)
                     self.num_con_cm = QtWidgets.QCompleter(self)
@@ -701,32 +718,18 @@ class BookTableViewDelegate(QtWidgets.QStyledItemDelegate):
             elif index.column() == 1: #Entity
                 self.tex_entity_cb = QtWidgets.QComboBox(parent)
                 try:
-                    # cik, parent_cik, name
-                    self.tex_entity_tree_info = self.book_table_view.book_main_window.cntlr.book_filing_manager.getEntityTreeInfo()
-                    self.entity_list = []
-                    for item in self.tex_entity_tree_info:
-                        self.entity_list.append(item[2])
-                    self.tex_entity_cb.addItems(self.entity_list)
+                    entity_names = self.book_table_view.book_main_window.cntlr.getEntityNames()
+                    self.tex_entity_cb.addItems(entity_names)
                     self.tex_entity_cb.setEditable(True)
                     self.tex_entity_le = BookLineEdit(parent, index)
 
                     self.tex_entity_le.undoAvailable = True
                     self.tex_entity_le.redoAvailable = True
-                    self.book_table_view.book_main_window.actionUndo.triggered.connect(self.tex_entity_le.undo)
-                    self.book_table_view.book_main_window.actionRedo.triggered.connect(self.tex_entity_le.redo)
-                    self.book_table_view.book_main_window.actionCut.triggered.connect(self.tex_entity_le.cut)
-                    self.book_table_view.book_main_window.actionCopy.triggered.connect(self.tex_entity_le.copy)
-                    self.book_table_view.book_main_window.actionPaste.triggered.connect(self.tex_entity_le.paste)
-                    self.book_table_view.book_main_window.actionDelete.triggered.connect(self.tex_entity_le.backspace)
-                    self.book_table_view.book_main_window.actionSelectAll.triggered.connect(self.tex_entity_le.selectAll)
+                    self.tex_entity_le.connectActions()
 
                     self.tex_entity_cb.setLineEdit(self.tex_entity_le)
-                    self.tex_entity_cm = QtWidgets.QCompleter(self)
-                    self.tex_entity_sl = QtCore.QStringListModel(self)
-                    self.tex_entity_cm.setModel(self.tex_entity_sl)
-                    self.tex_entity_cm.setCompletionRole(QtCore.Qt.EditRole)
-                    self.tex_entity_sl.setStringList(sorted(self.entity_list))
-                    self.tex_entity_cb.setCompleter(self.tex_entity_cm)
+                    self.setEntityCompletions(entity_names)
+                    self.tex_entity_cb.setCompleter(self.entity_cm)
                 except:
                     return self.tex_entity_cb
                 return self.tex_entity_cb
@@ -741,13 +744,7 @@ class BookTableViewDelegate(QtWidgets.QStyledItemDelegate):
 
                     self.tex_filing_le.undoAvailable = True
                     self.tex_filing_le.redoAvailable = True
-                    self.book_table_view.book_main_window.actionUndo.triggered.connect(self.tex_filing_le.undo)
-                    self.book_table_view.book_main_window.actionRedo.triggered.connect(self.tex_filing_le.redo)
-                    self.book_table_view.book_main_window.actionCut.triggered.connect(self.tex_filing_le.cut)
-                    self.book_table_view.book_main_window.actionCopy.triggered.connect(self.tex_filing_le.copy)
-                    self.book_table_view.book_main_window.actionPaste.triggered.connect(self.tex_filing_le.paste)
-                    self.book_table_view.book_main_window.actionDelete.triggered.connect(self.tex_filing_le.backspace)
-                    self.book_table_view.book_main_window.actionSelectAll.triggered.connect(self.tex_filing_le.selectAll)
+                    self.tex_filing_le.connectActions()
 
                     self.tex_filing_cb.setLineEdit(self.tex_filing_le)
                     self.tex_filing_cm = QtWidgets.QCompleter(self)
@@ -775,13 +772,7 @@ class BookTableViewDelegate(QtWidgets.QStyledItemDelegate):
 
                     self.tex_fact_le.undoAvailable = True
                     self.tex_fact_le.redoAvailable = True
-                    self.book_table_view.book_main_window.actionUndo.triggered.connect(self.tex_fact_le.undo)
-                    self.book_table_view.book_main_window.actionRedo.triggered.connect(self.tex_fact_le.redo)
-                    self.book_table_view.book_main_window.actionCut.triggered.connect(self.tex_fact_le.cut)
-                    self.book_table_view.book_main_window.actionCopy.triggered.connect(self.tex_fact_le.copy)
-                    self.book_table_view.book_main_window.actionPaste.triggered.connect(self.tex_fact_le.paste)
-                    self.book_table_view.book_main_window.actionDelete.triggered.connect(self.tex_fact_le.backspace)
-                    self.book_table_view.book_main_window.actionSelectAll.triggered.connect(self.tex_fact_le.selectAll)
+                    self.tex_fact_le.connectActions()
 
                     self.tex_fact_cb.setLineEdit(self.tex_fact_le)
                     self.tex_fact_cm = QtWidgets.QCompleter(self)
@@ -810,13 +801,7 @@ class BookTableViewDelegate(QtWidgets.QStyledItemDelegate):
 
                     self.tex_con_le.undoAvailable = True
                     self.tex_con_le.redoAvailable = True
-                    self.book_table_view.book_main_window.actionUndo.triggered.connect(self.tex_con_le.undo)
-                    self.book_table_view.book_main_window.actionRedo.triggered.connect(self.tex_con_le.redo)
-                    self.book_table_view.book_main_window.actionCut.triggered.connect(self.tex_con_le.cut)
-                    self.book_table_view.book_main_window.actionCopy.triggered.connect(self.tex_con_le.copy)
-                    self.book_table_view.book_main_window.actionPaste.triggered.connect(self.tex_con_le.paste)
-                    self.book_table_view.book_main_window.actionDelete.triggered.connect(self.tex_con_le.backspace)
-                    self.book_table_view.book_main_window.actionSelectAll.triggered.connect(self.tex_con_le.selectAll)
+                    self.tex_con_le.connectActions()
 
                     self.tex_con_cb.setLineEdit(self.tex_con_le)
                     self.tex_con_cm = QtWidgets.QCompleter(self)
@@ -830,7 +815,7 @@ class BookTableViewDelegate(QtWidgets.QStyledItemDelegate):
                 return self.tex_con_cb
 
         else:
-            model_logger.error("{0}:BookTableViewDelegate:createEditor(): Invalid book_table_view.objectName()".format(str(datetime.datetime.now())))
+            model_logger.error("BookTableViewDelegate:createEditor(): Invalid book_table_view.objectName()")
 
     def setEditorData(self, editor, index):
         if self.book_table_view.objectName() == "numericalTableView":
@@ -874,7 +859,7 @@ class BookTableViewDelegate(QtWidgets.QStyledItemDelegate):
 
             return
         else:
-            model_logger.error("{0}:BookTableViewDelegate:createEditor(): Invalid book_table_view.objectName()".format(str(datetime.datetime.now())))
+            model_logger.error("BookTableViewDelegate:createEditor(): Invalid book_table_view.objectName()")
 
     def setModelData(self, editor, model, index):
         if self.book_table_view.objectName() == "numericalTableView":
@@ -888,7 +873,19 @@ class BookTableViewDelegate(QtWidgets.QStyledItemDelegate):
             elif index.column() in (1, 2, 3, 4):
                 model.setData(index, editor.currentText(), QtCore.Qt.EditRole)
         else:
-            model_logger.error("{0}:BookTableViewDelegate:createEditor(): Invalid book_table_view.objectName()".format(str(datetime.datetime.now())))
+            model_logger.error("BookTableViewDelegate:createEditor(): Invalid book_table_view.objectName()")
+
+        return
+
+    def destroyEditor(self, editor, index):
+        try:
+            #The main window actions outlive the editor; without this, every closed editor would stay connected to them
+            line_edit = editor.lineEdit() if isinstance(editor, QtWidgets.QComboBox) else None
+            if isinstance(line_edit, BookLineEdit):
+                line_edit.disconnectActions()
+        except Exception as err:
+            model_logger.error("BookTableViewDelegate.destroyEditor():%s", err)
+        QtWidgets.QStyledItemDelegate.destroyEditor(self, editor, index)
 
         return
 
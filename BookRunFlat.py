@@ -12,12 +12,12 @@
 """
 
 try:
-    import sys, os, datetime, logging
+    import sys, os, logging
     logger = logging.getLogger()
     from PySide2 import QtWidgets
     import BookView, BookValidator
 except Exception as err:
-    logger.error("{0}:BookRun import error:".format(str(datetime.datetime.now()) + str(err)))
+    logger.error("BookRun import error:{0}".format(str(err)))
 
 #module-level directories
 Global_app_dir = os.path.dirname(os.path.abspath( __file__ ))
@@ -25,6 +25,7 @@ Global_app_par_dir = os.path.abspath(os.path.join(Global_app_dir, os.pardir))
 Global_tmp_dir = os.path.join(Global_app_dir, "tmp") #temporary files (e.g., *_fct.xml, *.pdf)
 Global_log_dir = os.path.join(Global_app_dir, "log") #log files
 Global_key_dir = os.path.join(Global_app_dir, "key") #keyfile folder (sale ID file and key file)
+Global_cache_dir = os.path.join(Global_app_dir, "arelle_cache") #Arelle configuration and web cache (downloaded taxonomies), kept between runs
 Global_res_dir = os.path.join(Global_app_par_dir, "xbrlstudio-res")
 Global_img_dir = os.path.join(Global_res_dir, "img")
 Global_doc_dir = os.path.join(Global_res_dir, "doc")
@@ -38,7 +39,7 @@ def ensureDirs(target_dirs):
                 os.mkdir(dir)
         return True
     except Exception as err:
-        logger.error("{0}:BookRun ensureDirs error:".format(str(datetime.datetime.now()) + str(err)))
+        logger.error("BookRun ensureDirs error:{0}".format(str(err)))
         return False
 
 def startupRegistrationCheck():
@@ -64,7 +65,7 @@ def startupRegistrationCheck():
         else:
             registration_status = False
     except Exception as err:
-        logger.error("{0}:BookRun startupRegistrationCheck error:".format(str(datetime.datetime.now()) + str(err)))
+        logger.error("BookRun startupRegistrationCheck error:{0}".format(str(err)))
 
     return registration_status
 
@@ -73,6 +74,7 @@ def environmentSetup():
     global Global_tmp_dir
     global Global_log_dir
     global Global_key_dir
+    global Global_cache_dir
     global Global_res_dir
     global Global_img_dir
     global Global_doc_dir
@@ -84,6 +86,7 @@ def environmentSetup():
                        Global_tmp_dir,
                        Global_log_dir,
                        Global_key_dir,
+                       Global_cache_dir,
                        Global_res_dir,
                        Global_img_dir,
                        Global_doc_dir,
@@ -92,7 +95,7 @@ def environmentSetup():
         directories = ensureDirs(target_dirs)
         registration = startupRegistrationCheck()
     except Exception as err:
-        logger.error("{0}:BookRun environmentSetup error:".format(str(datetime.datetime.now()) + str(err)))
+        logger.error("BookRun environmentSetup error:{0}".format(str(err)))
 
     return directories, registration
 
@@ -101,6 +104,7 @@ def main():
     global Global_tmp_dir
     global Global_log_dir
     global Global_key_dir
+    global Global_cache_dir
     global Global_res_dir
     global Global_img_dir
     global Global_doc_dir
@@ -117,13 +121,15 @@ def main():
                     os.remove(logger_fn)
             logger_fh = logging.FileHandler(logger_fn)
             logger_fh.setLevel(logging.INFO)
+            logger_fh.setFormatter(logging.Formatter("%(asctime)s:%(message)s")) #records are timestamped here, not by each message
             logger.addHandler(logger_fh)
-            logger.info("{0}:Initializing MainApplication".format(str(datetime.datetime.now())))
+            logger.info("Initializing MainApplication")
             app = QtWidgets.QApplication(sys.argv)
             bmw = BookView.BookMainWindow({"Global_app_dir":Global_app_dir,
                                            "Global_tmp_dir":Global_tmp_dir,
                                            "Global_log_dir":Global_log_dir,
                                            "Global_key_dir":Global_key_dir,
+                                           "Global_cache_dir":Global_cache_dir,
                                            "Global_res_dir":Global_res_dir,
                                            "Global_img_dir":Global_img_dir,
                                            "Global_doc_dir":Global_doc_dir,
@@ -131,13 +137,13 @@ def main():
                                            "Global_arelle_dir":Global_arelle_dir}, registration)
             bmw.show()
             return_val = sys.exit(app.exec_())
-            logger.info("{0}:Exit_status={1}".format(str(datetime.datetime.now()), return_val))
+            logger.info("Exit_status={0}".format(return_val))
 
             return return_val
         else:
-            logger.error("{0}:Environment setup failed. '{1}' is not a supported platform.".format(str(datetime.datetime.now()), sys.platform))
+            logger.error("Environment setup failed. '{0}' is not a supported platform.".format(sys.platform))
     except Exception as err:
-        logger.error("{0}:Main setup failed:{1}".format(str(datetime.datetime.now()), str(err)))
+        logger.error("Main setup failed:{0}".format(str(err)))
 
 if __name__ == "__main__":
     main()
@@ -19,10 +19,10 @@
 """
 
 try:
-    import math, decimal, sys, os, datetime, logging
+    import math, decimal, sys, os, logging
     validator_logger = logging.getLogger()
 except Exception as err:
-    validator_logger.error("{0}:BookValidator import error:{1}".format(str(datetime.datetime.now()), str(err)))
+    validator_logger.error("BookValidator import error:{0}".format(str(err)))
 
 class BookValidator():
     """
@@ -50,7 +50,7 @@ class BookValidator():
             else:
                 return False
         except Exception as err:
-            validator_logger.error("{0}:BookValidator.validate error:{1}".format(str(datetime.datetime.now()), str(err)))
+            validator_logger.error("BookValidator.validate error:{0}".format(str(err)))
 
     def keygen(self, sale_id):
         try:
@@ -66,4 +66,4 @@ class BookValidator():
                     sale_key += str(sale_pre_key[item])
                 return sale_key
         except Exception as err:
-            validator_logger.error("{0}:BookValidator.keygen error:{1}".format(str(datetime.datetime.now()), str(err)))
+            validator_logger.error("BookValidator.keygen error:{0}".format(str(err)))
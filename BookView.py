@@ -18,7 +18,7 @@
         BookTextualGraphic - html graphic for viewing textual table facts
 """
 try:
-    import webbrowser, sys, os, datetime, logging
+    import webbrowser, sys, os, logging
     import subprocess
     view_logger = logging.getLogger()
     from PySide2 import (QtWidgets, QtCore)
@@ -28,11 +28,11 @@ try:
     from PySide2.QtGui import (QPainter, QColor, QPixmap, QImage)
     from PySide2.QtWidgets import (QApplication, QMainWindow)
     # Tiered
-    # from . import (BookModel, BookCntlr, BookFilingManager, BookFilingUtility, BookValidator, BookExportUtility)
+    # from . import (BookModel, BookCntlr, BookFilingUtility, BookValidator, BookExportUtility)
     # Flat
-    import BookModel, BookCntlr, BookFilingManager, BookFilingUtility, BookValidator, BookExportUtility
+    import BookModel, BookCntlr, BookFilingUtility, BookValidator, BookExportUtility
 except Exception as err:
-    view_logger.error("{0}:BookView import error:{1}".format(str(datetime.datetime.now()), str(err)))
+    view_logger.error("BookView import error:{0}".format(str(err)))
 
 # global variable for user-selected database uri
 Global_db_uri = ""
@@ -73,7 +73,7 @@ class BookMainWindow(QtWidgets.QMainWindow):
     addTableRows(self) - adds user-defined number of rows to the currently active table
     viewAll(self) - sets all "view" column rows to True; graphs all current table items in the current table graphic
     getInputText(self, title, body) - simple pop-up window that prompts the user for text (e.g., manual cik, entity_name, filing_period)
-    getCikCombobox(self, fact_file_list) - simple pip-up window that prompts the user to specify one among more than one cik values found
+    getCikCombobox(self, fact_file_items) - simple pip-up window that prompts the user to specify one among more than one cik values found
     updateProgressBar(self, value) - used by expensive functions to update the user regarding progress (e.g., importing XBRL into database)
     resetProgressBar(self) - resets the progress bar to zero
     exportTabHtml(self) - Export currently active textual graphic to html
@@ -134,7 +134,7 @@ class BookMainWindow(QtWidgets.QMainWindow):
         actionAboutXbrlStudio - (QtWidgets.QAction type); display information about XBRLStudio
     plusTab - (QtWidgets.QWidget type); tab which, when brought into focus, creates a new tab and changes focus to the new tab
     current_tab_count - (int type); integer containing number of top-level tabs
-    newTab - (QtWidgets.QWidget type); main tab containing table and graphic objects
+    newTab - (QtWidgets.QWidget type); main tab containing table and graphic objects, also held as its sub_tab_widget, num_table_view, num_graphic, tex_table_view and tex_graphic attributes
     newTab_VL - (QtWidgets.QVBoxLayout type); layout for newTab
     newTab_subTabWidget - (QtWidgets.QTabWidget type); sub-tab object for numerical/textual division of facts
     newTab_numericalTab - (QtWidgets.QWidget type); tab containing numerical table and graphic
@@ -168,7 +168,7 @@ class BookMainWindow(QtWidgets.QMainWindow):
     cntlr_processXbrl_start_signal = QtCore.Signal("QString", "bool", "bool", "QObject", "QString")
 
     def __init__(self, directories, registration):
-        view_logger.info("{0}:Initializing BookMainWindow".format(str(datetime.datetime.now())))
+        view_logger.info("Initializing BookMainWindow")
         QtWidgets.QMainWindow.__init__(self)
         self.directories = directories
         """self.directories
@@ -199,7 +199,7 @@ class BookMainWindow(QtWidgets.QMainWindow):
             self.setWindowTitle("XBRLStudio")
             self.resize(1050, 700)
             self.cntlr = BookCntlr.BookCntlr(book_main_window = self)
-            self.book_filing_manager = BookFilingManager.BookFilingManager(book_main_window = self)
+            self.book_filing_manager = self.cntlr.book_filing_manager #one manager, bound to the database by the controller
             self.pref = BookPref(book_main_window = self)
             self.book_exporter = BookExportUtility.BookExporter(book_main_window = self)
             self.centralWidget = QtWidgets.QWidget(self)
@@ -424,14 +424,14 @@ class BookMainWindow(QtWidgets.QMainWindow):
                 try:
                     self.mainTabWidget.tabBar().tabButton(1, QtWidgets.QTabBar.RightSide).hide()
                 except Exception as err:
-                    view_logger.error("{0}:BookMainWindow.setupUi():{1}".format(str(datetime.datetime.now()), str(err)))
+                    view_logger.error("BookMainWindow.setupUi():{0}".format(str(err)))
             elif sys.platform.startswith("darwin"):
                 try:
                     self.mainTabWidget.tabBar().tabButton(1, QtWidgets.QTabBar.LeftSide).hide()
                 except Exception as err:
-                    view_logger.error("{0}:BookMainWindow.setupUi():{1}".format(str(datetime.datetime.now()), str(err)))
+                    view_logger.error("BookMainWindow.setupUi():{0}".format(str(err)))
             else:
-                view_logger.error("{0}:BookMainWindow.setupUi():{1}".format(str(datetime.datetime.now()), "OS not in (win, linux, darwin)"))
+                view_logger.error("BookMainWindow.setupUi():{0}".format("OS not in (win, linux, darwin)"))
 
             self.mainTabWidget.setCurrentIndex(0)
             self.mainTabWidget.tabBarClicked.connect(self.addNewTab)
@@ -440,7 +440,7 @@ class BookMainWindow(QtWidgets.QMainWindow):
 
             QtCore.QMetaObject.connectSlotsByName(self)
         except Exception as err:
-            view_logger.error("{0}:BookMainWindow.setupUi():{1}".format(str(datetime.datetime.now()), str(err)))
+            view_logger.error("BookMainWindow.setupUi():{0}".format(str(err)))
 
         return
 
@@ -448,7 +448,7 @@ class BookMainWindow(QtWidgets.QMainWindow):
         try:
             self.mainTabWidget.setCurrentIndex(self.mainTabWidget.currentIndex() - 1)
         except Exception as err:
-            view_logger.error("{0}:BookMainWindow.previousTab():{1}".format(str(datetime.datetime.now()), str(err)))
+            view_logger.error("BookMainWindow.previousTab():{0}".format(str(err)))
 
         return
 
@@ -460,7 +460,7 @@ class BookMainWindow(QtWidgets.QMainWindow):
             else:
                 self.mainTabWidget.setCurrentIndex(self.mainTabWidget.currentIndex() + 1)
         except Exception as err:
-            view_logger.error("{0}:BookMainWindow.nextTab():{1}".format(str(datetime.datetime.now()), str(err)))
+            view_logger.error("BookMainWindow.nextTab():{0}".format(str(err)))
 
         return
 
@@ -476,7 +476,7 @@ class BookMainWindow(QtWidgets.QMainWindow):
                 self.newTab_numericalGraphic.refreshGraphic()
                 self.newTab_textualGraphic.refreshGraphic()
         except Exception as err:
-            view_logger.error("{0}:BookMainWindow.renameTab():{1}".format(str(datetime.datetime.now()), str(err)))
+            view_logger.error("BookMainWindow.renameTab():{0}".format(str(err)))
 
         return
 
@@ -490,7 +490,7 @@ class BookMainWindow(QtWidgets.QMainWindow):
             else:
                 self.mainTabWidget.removeTab(current_index)
         except Exception as err:
-            view_logger.error("{0}:BookMainWindow.closeTab():{1}".format(str(datetime.datetime.now()), str(err)))
+            view_logger.error("BookMainWindow.closeTab():{0}".format(str(err)))
 
         return
 
@@ -643,6 +643,12 @@ class BookMainWindow(QtWidgets.QMainWindow):
                 self.newTab_textualTab_VL.addWidget(self.newTab_textualSplitter)
                 self.newTab_subTabWidget.addTab(self.newTab_textualTab, "Textual")
                 self.newTab_VL.addWidget(self.newTab_subTabWidget)
+                #Tab widgets are kept on the tab itself, so they are reached without a findChild walk of the tab's object tree
+                self.newTab.sub_tab_widget = self.newTab_subTabWidget
+                self.newTab.num_table_view = self.newTab_numericalTableView
+                self.newTab.num_graphic = self.newTab_numericalGraphic
+                self.newTab.tex_table_view = self.newTab_textualTableView
+                self.newTab.tex_graphic = self.newTab_textualGraphic
                 self.mainTabWidget.insertTab(self.current_tab_count - 1, self.newTab, "New Tab")
                 self.newTab_numericalSplitter.setSizes([193, 207])
                 self.newTab_textualSplitter.setSizes([193, 207])
@@ -653,7 +659,7 @@ class BookMainWindow(QtWidgets.QMainWindow):
                 self.newTab_numericalGraphic.refreshGraphic()
                 self.newTab_textualGraphic.refreshGraphic()
         except Exception as err:
-            view_logger.error("{0}:BookMainWindow.addNewTab():{1}".format(str(datetime.datetime.now()), str(err)))
+            view_logger.error("BookMainWindow.addNewTab():{0}".format(str(err)))
 
         return
 
@@ -696,7 +702,7 @@ class BookMainWindow(QtWidgets.QMainWindow):
                 self.setWindowTitle("{0} - XBRLStudio".format(os.path.split(Global_db_uri)[1].split(".")[0]))
                 self.entity_tree_view.refresh()
         except Exception as err:
-            view_logger.error("{0}:BookMainWindow.newDb():{1}".format(str(datetime.datetime.now()), str(err)))
+            view_logger.error("BookMainWindow.newDb():{0}".format(str(err)))
 
         return
 
@@ -725,7 +731,7 @@ class BookMainWindow(QtWidgets.QMainWindow):
             else:
                 return
         except Exception as err:
-            view_logger.error("{0}:BookMainWindow.openDb():{1}".format(str(datetime.datetime.now()), str(err)))
+            view_logger.error("BookMainWindow.openDb():{0}".format(str(err)))
 
     def closeDb(self):
         try:
@@ -737,7 +743,7 @@ class BookMainWindow(QtWidgets.QMainWindow):
             self.refreshAll()
             self.clearTabs()
         except Exception as err:
-            view_logger.error("{0}:BookMainWindow.closeDb():{1}".format(str(datetime.datetime.now()), str(err)))
+            view_logger.error("BookMainWindow.closeDb():{0}".format(str(err)))
 
         return
 
@@ -751,7 +757,7 @@ class BookMainWindow(QtWidgets.QMainWindow):
                 i += 1
             self.addNewTab(0)
         except Exception as err:
-            view_logger.error("{0}:BookMainWindow.clearTabs():{1}".format(str(datetime.datetime.now()), str(err)))
+            view_logger.error("BookMainWindow.clearTabs():{0}".format(str(err)))
 
         return
 
@@ -772,7 +778,7 @@ class BookMainWindow(QtWidgets.QMainWindow):
             else:
                 return False
         except Exception as err:
-            view_logger.error("{0}:BookMainWindow.preExistingFilingWarning():{1}".format(str(datetime.datetime.now()), str(err)))
+            view_logger.error("BookMainWindow.preExistingFilingWarning():{0}".format(str(err)))
             return False
 
     def manualPreExistingFilingWarning(self, manual_name, manual_period):
@@ -788,7 +794,7 @@ class BookMainWindow(QtWidgets.QMainWindow):
             else:
                 return False
         except Exception as err:
-            view_logger.error("{0}:BookMainWindow.manualPreExistingFilingWarning():{1}".format(str(datetime.datetime.now()), str(err)))
+            view_logger.error("BookMainWindow.manualPreExistingFilingWarning():{0}".format(str(err)))
             return False
 
     def fileImport(self):
@@ -809,7 +815,7 @@ class BookMainWindow(QtWidgets.QMainWindow):
                                           filter = "Instances (*.xml)")[0]
             self.cntlr_processXbrl_start_signal.emit("File", False, True, f_list, root_dir)
         except Exception as err:
-            view_logger.error("{0}:BookMainWindow.fileImport():{1}".format(str(datetime.datetime.now()), str(err)))
+            view_logger.error("BookMainWindow.fileImport():{0}".format(str(err)))
 
         return
 
@@ -829,7 +835,7 @@ class BookMainWindow(QtWidgets.QMainWindow):
             root_dir = QtWidgets.QFileDialog.getExistingDirectory(caption = "Select XBRL Folder", directory = "C:\\")
             self.cntlr_processXbrl_start_signal.emit("Folder", False, True, f_list, root_dir)
         except Exception as err:
-            view_logger.error("{0}:BookMainWindow.folderImport():{1}".format(str(datetime.datetime.now()), str(err)))
+            view_logger.error("BookMainWindow.folderImport():{0}".format(str(err)))
 
         return
 
@@ -837,7 +843,7 @@ class BookMainWindow(QtWidgets.QMainWindow):
         try:
             self.closeDb()
         except Exception as err:
-            view_logger.error("{0}:BookMainWindow.exitApplication():{1}".format(str(datetime.datetime.now()), str(err)))
+            view_logger.error("BookMainWindow.exitApplication():{0}".format(str(err)))
 
         return sys.exit()
 
@@ -858,7 +864,7 @@ class BookMainWindow(QtWidgets.QMainWindow):
                 remove_entity_action.triggered.connect(lambda x: self.cntlr.removeEntity(selection.toolTip().split("=")[1]))
                 entity_tree_view_context_menu.exec_(self.entity_tree_view.viewport().mapToGlobal(position))
         except Exception as err:
-            view_logger.error("{0}:BookMainWindow.customMenuEntityTreeView():{1}".format(str(datetime.datetime.now()), str(err)))
+            view_logger.error("BookMainWindow.customMenuEntityTreeView():{0}".format(str(err)))
 
         return
 
@@ -875,13 +881,13 @@ class BookMainWindow(QtWidgets.QMainWindow):
                 remove_filing_action.triggered.connect(lambda x: self.cntlr.removeFiling(selection))
                 filing_tree_view_context_menu.exec_(self.filing_tree_view.viewport().mapToGlobal(position))
         except Exception as err:
-            view_logger.error("{0}:BookMainWindow.customMenuFilingTreeView():{1}".format(str(datetime.datetime.now()), str(err)))
+            view_logger.error("BookMainWindow.customMenuFilingTreeView():{0}".format(str(err)))
 
         return
 
     def customMenuNumericalGraphic(self, position):
         try:
-            current_num_graphic = self.mainTabWidget.currentWidget().findChild(QtCharts.QChartView, "numericalGraphic")
+            current_num_graphic = self.mainTabWidget.currentWidget().num_graphic
             if current_num_graphic.chart().items_viewed == True:
                 clipboard = QApplication.clipboard()
                 numerical_graphic_context_menu = QtWidgets.QMenu(self)
@@ -889,13 +895,13 @@ class BookMainWindow(QtWidgets.QMainWindow):
                 graphic_copy_action.triggered.connect(lambda x: clipboard.setPixmap(current_num_graphic.grab()))
                 numerical_graphic_context_menu.exec_(current_num_graphic.viewport().mapToGlobal(position))
         except Exception as err:
-            view_logger.error("{0}:BookMainWindow.customMenuNumericalGraphic():{1}".format(str(datetime.datetime.now()), str(err)))
+            view_logger.error("BookMainWindow.customMenuNumericalGraphic():{0}".format(str(err)))
 
         return
 
     def customMenuTextualGraphic(self, position):
         try:
-            current_tex_graphic = self.mainTabWidget.currentWidget().findChild(QtWidgets.QTextEdit, "textualGraphic")
+            current_tex_graphic = self.mainTabWidget.currentWidget().tex_graphic
             if current_tex_graphic.items_viewed == True:
                 clipboard = QApplication.clipboard()
                 textual_graphic_context_menu = QtWidgets.QMenu(self)
@@ -905,7 +911,7 @@ class BookMainWindow(QtWidgets.QMainWindow):
                 graphic_copy_img_action.triggered.connect(lambda x: clipboard.setPixmap(current_tex_graphic.grab()))
                 textual_graphic_context_menu.exec_(current_tex_graphic.mapToGlobal(position))
         except Exception as err:
-            view_logger.error("{0}:BookMainWindow.customMenuTextualGraphic():{1}".format(str(datetime.datetime.now()), str(err)))
+            view_logger.error("BookMainWindow.customMenuTextualGraphic():{0}".format(str(err)))
 
         return
 
@@ -915,7 +921,7 @@ class BookMainWindow(QtWidgets.QMainWindow):
             self.pref_window.show()
             self.pref_window.activateWindow()
         except Exception as err:
-            view_logger.error("{0}:BookMainWindow.choosePreferences():{1}".format(str(datetime.datetime.now()), str(err)))
+            view_logger.error("BookMainWindow.choosePreferences():{0}".format(str(err)))
 
         return
 
@@ -924,28 +930,53 @@ class BookMainWindow(QtWidgets.QMainWindow):
             self.entity_tree_view.refresh()
             self.filing_tree_view.refresh()
         except Exception as err:
-            view_logger.error("{0}:BookMainWindow.refreshAll():{1}".format(str(datetime.datetime.now()), str(err)))
+            view_logger.error("BookMainWindow.refreshAll():{0}".format(str(err)))
 
         return
 
-    def manualImport(self, fact_file_list):
+    def manualImport(self, fact_file_items):
+        path_tab, path_indices = fact_file_items
         if self.pref.import_manual_info_option == "Yes":
-            for fact_file in fact_file_list:
+            # every dialog is answered first; the transaction holds only the database writes
+            import_items = [] #(cik, name, period, fact file)
+            for path_index in path_indices:
+                fact_file = path_tab[path_index]
                 try:
                     entity_cik, entity_name, filing_period = self.getManualImportInfo(fact_file)
-                    self.showStatus("Importing {0}".format(os.path.split(fact_file)[1]))
-                    self.book_filing_manager.manualImportFactFile(entity_cik, entity_name, filing_period, fact_file)
-                    os.remove(fact_file)
+                    entity_cik = int(entity_cik)
+                    filing_period = filing_period.strip().lower()
+                    if len(filing_period) != 6 or filing_period[0:2] not in ("q1", "q2", "q3", "q4") or not filing_period[2:6].isdigit():
+                        raise Exception
+                    if self.book_filing_manager.confirmManualImport(entity_cik, entity_name, filing_period):
+                        import_items.append((entity_cik, entity_name, filing_period, fact_file))
+                    else:
+                        os.remove(fact_file)
                 except Exception as err:
-                    view_logger.error("{0}:BookMainWindow.manualImport():{1}".format(str(datetime.datetime.now()), "Processing error - manual input failed"))
+                    view_logger.error("BookMainWindow.manualImport():{0}".format("Processing error - manual input failed"))
                     self.warnUser_signal.emit("Processing Error", "Error processing {0}. Manually input the filing information as indicated. Each instance must have a complete DTS in the same directory.".format(fact_file))
                     os.remove(fact_file)
+            try:
+                self.book_filing_manager.makeFilingsTables([import_item[2] for import_item in import_items])
+                with self.book_filing_manager.bulkTransaction(): #one commit for all manually imported filings
+                    for entity_cik, entity_name, filing_period, fact_file in import_items:
+                        self.showStatus("Importing {0}".format(os.path.split(fact_file)[1]))
+                        self.book_filing_manager.manualImportFactFile(entity_cik, entity_name, filing_period, fact_file)
+            except Exception as err:
+                view_logger.error("BookMainWindow.manualImport():{0}".format(str(err)))
+                self.warnUser_signal.emit("Processing Error", "Import failed. None of the manually input filings were imported.")
+                self.resetProgressBar()
+            finally:
+                for entity_cik, entity_name, filing_period, fact_file in import_items:
+                    os.remove(fact_file) #only once the batch is committed or rolled back
+            self.cntlr.clearCaches()
             self.refreshAll()
             return
         else:
-            view_logger.error("{0}:BookMainWindow.manualImport():{1}".format(str(datetime.datetime.now()), "Processing error - manual input required"))
-            self.warnUser_signal.emit("Processing Error", "Error processing {0}. Enable manual import under File->Preferences->Import. Each instance must have a complete DTS in the same directory.".format(fact_file))
-            os.remove(fact_file)
+            for path_index in path_indices:
+                fact_file = path_tab[path_index]
+                view_logger.error("BookMainWindow.manualImport():{0}".format("Processing error - manual input required"))
+                self.warnUser_signal.emit("Processing Error", "Error processing {0}. Enable manual import under File->Preferences->Import. Each instance must have a complete DTS in the same directory.".format(fact_file))
+                os.remove(fact_file)
             self.refreshAll()
             return
 
@@ -970,7 +1001,7 @@ class BookMainWindow(QtWidgets.QMainWindow):
 
             return manual_entity_cik, manual_entity_name, manual_filing_period
         except Exception as err:
-            view_logger.error("{0}:BookMainWindow.getManualImportInfo():{1}".format(str(datetime.datetime.now()), str(err)))
+            view_logger.error("BookMainWindow.getManualImportInfo():{0}".format(str(err)))
 
     def warnUser(self, title, body):
         try:
@@ -980,7 +1011,7 @@ class BookMainWindow(QtWidgets.QMainWindow):
                                        QtWidgets.QMessageBox.Ok,
                                        QtWidgets.QMessageBox.Ok)
         except Exception as err:
-            view_logger.error("{0}:BookMainWindow.warnUser():{1}".format(str(datetime.datetime.now()), str(err)))
+            view_logger.error("BookMainWindow.warnUser():{0}".format(str(err)))
 
         return
 
@@ -990,7 +1021,7 @@ class BookMainWindow(QtWidgets.QMainWindow):
             self.register_window.show()
             self.register_window.activateWindow()
         except Exception as err:
-            view_logger.error("{0}:BookMainWindow.registerApplication():{1}".format(str(datetime.datetime.now()), str(err)))
+            view_logger.error("BookMainWindow.registerApplication():{0}".format(str(err)))
 
         return
 
@@ -1014,15 +1045,15 @@ class BookMainWindow(QtWidgets.QMainWindow):
             notifier.setText(body)
             notifier.show()
         except Exception as err:
-            view_logger.error("{0}:BookMainWindow.aboutXbrlStudio():{1}".format(str(datetime.datetime.now()), str(err)))
+            view_logger.error("BookMainWindow.aboutXbrlStudio():{0}".format(str(err)))
 
         return
 
     def addTableRows(self):
         try:
-            current_sub_tab = self.mainTabWidget.currentWidget().findChild(QtWidgets.QTabWidget, "newTab_subTabWidget").currentWidget()
+            current_sub_tab = self.mainTabWidget.currentWidget().sub_tab_widget.currentWidget()
             if current_sub_tab.objectName() == "newTab_numericalTab":
-                num_table_view = self.mainTabWidget.currentWidget().findChild(QtWidgets.QTableView, "numericalTableView")
+                num_table_view = self.mainTabWidget.currentWidget().num_table_view
                 num_rows = QtWidgets.QInputDialog.getText(self, "Add Rows", "Number of rows to add (integer):", QtWidgets.QLineEdit.Normal)[0]
                 if num_rows != "":
                     try:
@@ -1043,7 +1074,7 @@ class BookMainWindow(QtWidgets.QMainWindow):
                     except Exception as err:
                         self.addTableRows()
             elif current_sub_tab.objectName() == "newTab_textualTab":
-                tex_table_view = self.mainTabWidget.currentWidget().findChild(QtWidgets.QTableView, "textualTableView")
+                tex_table_view = self.mainTabWidget.currentWidget().tex_table_view
                 num_rows = QtWidgets.QInputDialog.getText(self, "Add Rows", "Number of rows to add (integer):", QtWidgets.QLineEdit.Normal)[0]
                 if num_rows != "":
                     try:
@@ -1064,21 +1095,21 @@ class BookMainWindow(QtWidgets.QMainWindow):
                     except Exception as err:
                         self.addTableRows()
         except Exception as err:
-            view_logger.error("{0}:BookMainWindow.addTableRows():{1}".format(str(datetime.datetime.now()), str(err)))
+            view_logger.error("BookMainWindow.addTableRows():{0}".format(str(err)))
 
         return
 
     def viewAll(self):
         try:
-            current_sub_tab = self.mainTabWidget.currentWidget().findChild(QtWidgets.QTabWidget, "newTab_subTabWidget").currentWidget()
+            current_sub_tab = self.mainTabWidget.currentWidget().sub_tab_widget.currentWidget()
             if current_sub_tab.objectName() == "newTab_numericalTab":
-                num_table_view = self.mainTabWidget.currentWidget().findChild(QtWidgets.QTableView, "numericalTableView")
+                num_table_view = self.mainTabWidget.currentWidget().num_table_view
                 num_table_view.model().viewAll()
             elif current_sub_tab.objectName() == "newTab_textualTab":
-                tex_table_view = self.mainTabWidget.currentWidget().findChild(QtWidgets.QTableView, "textualTableView")
+                tex_table_view = self.mainTabWidget.currentWidget().tex_table_view
                 tex_table_view.model().viewAll()
         except Exception as err:
-            view_logger.error("{0}:BookMainWindow.viewAll():{1}".format(str(datetime.datetime.now()), str(err)))
+            view_logger.error("BookMainWindow.viewAll():{0}".format(str(err)))
 
         return
 
@@ -1086,13 +1117,16 @@ class BookMainWindow(QtWidgets.QMainWindow):
         try:
             return QtWidgets.QInputDialog.getText(self, title, body, QtWidgets.QLineEdit.Normal)[0]
         except Exception as err:
-            view_logger.error("{0}:BookMainWindow.getInputText():{1}".format(str(datetime.datetime.now()), str(err)))
+            view_logger.error("BookMainWindow.getInputText():{0}".format(str(err)))
 
-    def getCikCombobox(self, fact_file_list):
+    def getCikCombobox(self, fact_file_items):
         try:
-            for fact_file in fact_file_list:
-                target_filing = BookFilingUtility.parseFactFile(fact_file)
-                target_cik_list, target_parent_cik, target_name, target_period = BookFilingUtility.getFilingInfo(target_filing)
+            path_tab, path_indices = fact_file_items
+            # every dialog is answered first; the transaction holds only the database writes
+            import_items = [] #(fact file, chosen cik, period)
+            for path_index in path_indices:
+                fact_file = path_tab[path_index]
+                filing_importable, dei_filing, target_cik_list, target_parent_cik, target_name, target_period = BookFilingUtility.readFilingInfo(fact_file)
                 title = "Select CIK"
                 body = "Multiple Central Index Keys were found in filing {0}.\nPlease choose the CIK you want to import this filing under.\n".format(os.path.split(fact_file)[1])
                 str_selection_list = []
@@ -1100,20 +1134,36 @@ class BookMainWindow(QtWidgets.QMainWindow):
                 for selection in selection_list:
                     str_selection_list.append(str(selection))
                 selection = QtWidgets.QInputDialog.getItem(self, title, body, str_selection_list)
-                if selection[1] is True:
-                    self.status_bar.showMessage("Importing {0}.".format(os.path.split(fact_file)[1]))
-                    self.book_filing_manager.importFactFile(target_fact_uri = fact_file, target_cik = selection[0])
-                os.remove(fact_file)
+                if selection[1] is True and self.book_filing_manager.confirmImport(fact_file, selection[0], dei_filing):
+                    import_items.append((fact_file, selection[0], target_period))
+                else:
+                    os.remove(fact_file)
+            try:
+                self.book_filing_manager.makeFilingsTables([import_item[2] for import_item in import_items])
+                with self.book_filing_manager.bulkTransaction(): #one commit for all filings imported under a chosen cik
+                    for fact_file, target_cik, target_period in import_items:
+                        self.status_bar.showMessage("Importing {0}.".format(os.path.split(fact_file)[1]))
+                        self.book_filing_manager.importFactFile(target_fact_uri = fact_file, target_cik = target_cik)
+            except Exception as err:
+                view_logger.error("BookMainWindow.getCikCombobox():{0}".format(str(err)))
+                self.warnUser_signal.emit("Processing Error", "Import failed. None of the filings with multiple CIKs were imported.")
+                self.resetProgressBar()
+            finally:
+                for fact_file, target_cik, target_period in import_items:
+                    os.remove(fact_file) #only once the batch is committed or rolled back
+            self.cntlr.clearCaches()
             self.refreshAll()
             return
         except Exception as err:
-            view_logger.error("{0}:BookMainWindow.getCikCombobox():{1}".format(str(datetime.datetime.now()), str(err)))
+            view_logger.error("BookMainWindow.getCikCombobox():{0}".format(str(err)))
+            self.cntlr.clearCaches()
+            self.resetProgressBar()
 
     def updateProgressBar(self, value):
         try:
             self.progressBar.setValue(value)
         except Exception as err:
-            view_logger.error("{0}:BookMainWindow.updateProgressBar():{1}".format(str(datetime.datetime.now()), str(err)))
+            view_logger.error("BookMainWindow.updateProgressBar():{0}".format(str(err)))
 
         return
 
@@ -1121,7 +1171,7 @@ class BookMainWindow(QtWidgets.QMainWindow):
         try:
             self.progressBar.setValue(0)
         except Exception as err:
-            view_logger.error("{0}:BookMainWindow.resetProgressBar():{1}".format(str(datetime.datetime.now()), str(err)))
+            view_logger.error("BookMainWindow.resetProgressBar():{0}".format(str(err)))
 
         return
 
@@ -1129,7 +1179,7 @@ class BookMainWindow(QtWidgets.QMainWindow):
         try:
             self.book_exporter.exportHtml("single_tab")
         except Exception as err:
-            view_logger.error("{0}:BookMainWindow.exportTabHtml():{1}".format(str(datetime.datetime.now()), str(err)))
+            view_logger.error("BookMainWindow.exportTabHtml():{0}".format(str(err)))
 
         return
 
@@ -1137,7 +1187,7 @@ class BookMainWindow(QtWidgets.QMainWindow):
         try:
             self.book_exporter.exportHtml("all_tabs")
         except Exception as err:
-            view_logger.error("{0}:BookMainWindow.exportHtml():{1}".format(str(datetime.datetime.now()), str(err)))
+            view_logger.error("BookMainWindow.exportHtml():{0}".format(str(err)))
 
         return
 
@@ -1145,7 +1195,7 @@ class BookMainWindow(QtWidgets.QMainWindow):
         try:
             self.book_exporter.exportCsv("single_tab")
         except Exception as err:
-            view_logger.error("{0}:BookMainWindow.exportTabCsv():{1}".format(str(datetime.datetime.now()), str(err)))
+            view_logger.error("BookMainWindow.exportTabCsv():{0}".format(str(err)))
 
         return
 
@@ -1153,7 +1203,7 @@ class BookMainWindow(QtWidgets.QMainWindow):
         try:
             self.book_exporter.exportCsv("all_tabs")
         except Exception as err:
-            view_logger.error("{0}:BookMainWindow.exportCsv():{1}".format(str(datetime.datetime.now()), str(err)))
+            view_logger.error("BookMainWindow.exportCsv():{0}".format(str(err)))
 
         return
 
@@ -1190,7 +1240,7 @@ class BookPrefTab(QtWidgets.QWidget):
 
     """
     def __init__(self, book_pref_window_mtw, tab_name, book_main_window):
-        view_logger.info("{0}:Initializing BookPrefTab".format(str(datetime.datetime.now())))
+        view_logger.info("Initializing BookPrefTab")
         QtWidgets.QWidget.__init__(self, book_pref_window_mtw)
         self.book_pref_window_mtw = book_pref_window_mtw
         self.setObjectName(tab_name.lower() + "Tab")
@@ -1260,7 +1310,7 @@ class BookPrefTab(QtWidgets.QWidget):
                 self.import_manual_info_HL.addWidget(self.import_manual_info_cb)
                 self.main_VL.addWidget(self.import_manual_info_wd)
         except Exception as err:
-            view_logger.error("{0}:BookPrefTab.setupUi():{1}".format(str(datetime.datetime.now()), str(err)))
+            view_logger.error("BookPrefTab.setupUi():{0}".format(str(err)))
 
         return
 
@@ -1282,7 +1332,7 @@ class BookPref():
     import_manual_info_option (string type); specifies whether to allow user to manually enter import information, where needed
     """
     def __init__(self, book_main_window):
-        view_logger.info("{0}:Initializing BookPref".format(str(datetime.datetime.now())))
+        view_logger.info("Initializing BookPref")
         self.book_main_window = book_main_window
         self.general_num_graph_type = "Bar"
         self.general_show_decimal_column = "No"
@@ -1316,7 +1366,7 @@ class BookPrefWindow(QtWidgets.QDialog):
     ok_button (QtWidgets.QPushButton type); connected to closeWithChanges
     """
     def __init__(self, book_main_window, window_flags):
-        view_logger.info("{0}:Initializing BookPrefWindow".format(str(datetime.datetime.now())))
+        view_logger.info("Initializing BookPrefWindow")
         QtWidgets.QDialog.__init__(self)
         self.book_main_window = book_main_window #self.book_main_window.pref = BookPref() instance
         self.setupUi()
@@ -1355,13 +1405,13 @@ class BookPrefWindow(QtWidgets.QDialog):
             self.apply_button.clicked.connect(self.updatePreferences)
             self.ok_button.clicked.connect(self.closeWithChanges)
         except Exception as err:
-            view_logger.error("{0}:BookPrefWindow.setupUi():{1}".format(str(datetime.datetime.now()), str(err)))
+            view_logger.error("BookPrefWindow.setupUi():{0}".format(str(err)))
 
     def closeWithoutChanges(self):
         try:
             return self.book_main_window.pref_window.close()
         except Exception as err:
-            view_logger.error("{0}:BookPrefWindow.closeWithoutChanges():{1}".format(str(datetime.datetime.now()), str(err)))
+            view_logger.error("BookPrefWindow.closeWithoutChanges():{0}".format(str(err)))
 
     def closeWithChanges(self):
         try:
@@ -1369,7 +1419,7 @@ class BookPrefWindow(QtWidgets.QDialog):
 
             return self.book_main_window.pref_window.close()
         except Exception as err:
-            view_logger.error("{0}:BookPrefWindow.closeWithChanges():{1}".format(str(datetime.datetime.now()), str(err)))
+            view_logger.error("BookPrefWindow.closeWithChanges():{0}".format(str(err)))
 
     def updatePreferences(self):
         try:
@@ -1381,10 +1431,10 @@ class BookPrefWindow(QtWidgets.QDialog):
             current_index = 0
             while current_index < self.book_main_window.mainTabWidget.count() - 1:
                 current_tab = self.book_main_window.mainTabWidget.widget(current_index)
-                current_num_table = current_tab.findChild(QtWidgets.QTableView, "numericalTableView")
-                current_num_graphic = current_tab.findChild(QtCharts.QChartView, "numericalGraphic")
-                current_tex_table = current_tab.findChild(QtWidgets.QTableView, "textualTableView")
-                current_tex_graphic = current_tab.findChild(QtWidgets.QTextEdit, "textualGraphic")
+                current_num_table = current_tab.num_table_view
+                current_num_graphic = current_tab.num_graphic
+                current_tex_table = current_tab.tex_table_view
+                current_tex_graphic = current_tab.tex_graphic
 
                 if self.book_main_window.pref.general_show_decimal_column == "Yes":
                     try:
@@ -1404,7 +1454,7 @@ class BookPrefWindow(QtWidgets.QDialog):
 
                 current_index += 1
         except Exception as err:
-            view_logger.error("{0}:BookPrefWindow.updatePreferences():{1}".format(str(datetime.datetime.now()), str(err)))
+            view_logger.error("BookPrefWindow.updatePreferences():{0}".format(str(err)))
 
         return
 
@@ -1444,7 +1494,7 @@ class BookRegisterWindow(QtWidgets.QDialog):
     register_button (QtWidgets.QPushButton type); connected to attemptRegistration
     """
     def __init__(self, book_main_window, window_flags):
-        view_logger.info("{0}:Initializing BookRegisterWindow".format(str(datetime.datetime.now())))
+        view_logger.info("Initializing BookRegisterWindow")
         QtWidgets.QDialog.__init__(self)
         self.book_main_window = book_main_window
         self.setupUi()
@@ -1498,7 +1548,7 @@ class BookRegisterWindow(QtWidgets.QDialog):
             self.cancel_button.clicked.connect(self.closeWithoutRegistration)
             self.register_button.clicked.connect(lambda x: self.attemptRegistration(self.book_main_window.directories.get("Global_key_dir")))
         except Exception as err:
-            view_logger.error("{0}:BookRegisterWindow.setupUi():{1}".format(str(datetime.datetime.now()), str(err)))
+            view_logger.error("BookRegisterWindow.setupUi():{0}".format(str(err)))
 
         return
 
@@ -1506,7 +1556,7 @@ class BookRegisterWindow(QtWidgets.QDialog):
         try:
             return self.book_main_window.register_window.close()
         except Exception as err:
-            view_logger.error("{0}:BookRegisterWindow.closeWithoutRegistration():{1}".format(str(datetime.datetime.now()), str(err)))
+            view_logger.error("BookRegisterWindow.closeWithoutRegistration():{0}".format(str(err)))
 
         return
 
@@ -1534,7 +1584,7 @@ class BookRegisterWindow(QtWidgets.QDialog):
                 self.book_main_window.warnUser("Registration Failed", "Please ensure that your Sale ID and Registration Key are entered correctly.\n\nDo not enter dashes when entering the Registration Key.\n\n")
                 return
         except Exception as err:
-            view_logger.error("{0}:BookRegisterWindow.attemptRegistration():{1}".format(str(datetime.datetime.now()), str(err)))
+            view_logger.error("BookRegisterWindow.attemptRegistration():{0}".format(str(err)))
 
         return
 
@@ -1558,7 +1608,7 @@ class BookFilingTreeView(QtWidgets.QTreeView):
     """
 
     def __init__(self, book_main_window):
-        view_logger.info("{0}:Initializing BookFilingTreeView".format(str(datetime.datetime.now())))
+        view_logger.info("Initializing BookFilingTreeView")
         QtWidgets.QTreeView.__init__(self)
         self.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
         self.book_main_window = book_main_window
@@ -1591,9 +1641,10 @@ class BookFilingTreeView(QtWidgets.QTreeView):
                             if filing_item.period.split("-")[0] == real_year_item.period:
                                 real_year_item.children.append(filing_item)
                         real_year_item.setChildren()
-                        self.model().appendRow(real_year_item)
+                    if self.real_year_items:
+                        self.model().invisibleRootItem().appendRows(self.real_year_items)
         except Exception as err:
-            view_logger.error("{0}:BookFilingTreeView.refresh():{1}".format(str(datetime.datetime.now()), str(err)))
+            view_logger.error("BookFilingTreeView.refresh():{0}".format(str(err)))
 
         return
 
@@ -1602,16 +1653,16 @@ class BookFilingTreeView(QtWidgets.QTreeView):
             current_cik = selection.model().itemFromIndex(selection).cik
             current_period = selection.model().itemFromIndex(selection).period
             if len(current_period) > 4:
-                current_period = current_period.split("-")[1].lower() + current_period.split("-")[0]
-                current_sub_tab = self.book_main_window.mainTabWidget.currentWidget().findChild(QtWidgets.QTabWidget, "newTab_subTabWidget").currentWidget()
+                current_period = BookFilingUtility.getRawPeriod(current_period)
+                current_sub_tab = self.book_main_window.mainTabWidget.currentWidget().sub_tab_widget.currentWidget()
                 if current_sub_tab.objectName() == "newTab_numericalTab":
-                    num_table_view = self.book_main_window.mainTabWidget.currentWidget().findChild(QtWidgets.QTableView, "numericalTableView")
+                    num_table_view = self.book_main_window.mainTabWidget.currentWidget().num_table_view
                     num_table_view.model().insertFilingIntoTable(current_cik, current_period)
                 elif current_sub_tab.objectName() == "newTab_textualTab":
-                    tex_table_view = self.book_main_window.mainTabWidget.currentWidget().findChild(QtWidgets.QTableView, "textualTableView")
+                    tex_table_view = self.book_main_window.mainTabWidget.currentWidget().tex_table_view
                     tex_table_view.model().insertFilingIntoTable(current_cik, current_period)
         except Exception as err:
-            view_logger.error("{0}:BookFilingTreeView.insertFilingIntoTable():{1}".format(str(datetime.datetime.now()), str(err)))
+            view_logger.error("BookFilingTreeView.insertFilingIntoTable():{0}".format(str(err)))
 
         return
 
@@ -1634,7 +1685,7 @@ class BookEntityTreeView(QtWidgets.QTreeView):
     """
 
     def __init__(self, book_main_window):
-        view_logger.info("{0}:Initializing BookEntityTreeView".format(str(datetime.datetime.now())))
+        view_logger.info("Initializing BookEntityTreeView")
         QtWidgets.QTreeView.__init__(self)
         self.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
         self.setDragEnabled(True)
@@ -1648,7 +1699,7 @@ class BookEntityTreeView(QtWidgets.QTreeView):
         try:
             self.book_main_window.filing_tree_view.refresh(selection.model().itemFromIndex(selection).data())
         except Exception as err:
-            view_logger.error("{0}:BookEntityTreeView.updateFilingTreeView():{1}".format(str(datetime.datetime.now()), str(err)))
+            view_logger.error("BookEntityTreeView.updateFilingTreeView():{0}".format(str(err)))
 
         return
 
@@ -1661,7 +1712,7 @@ class BookEntityTreeView(QtWidgets.QTreeView):
                 selection.model().itemFromIndex(selection).model().renameItem(selection.model().itemFromIndex(selection).data(), new_name)
                 self.refresh()
         except Exception as err:
-            view_logger.error("{0}:BookEntityTreeView.renameEntity():{1}".format(str(datetime.datetime.now()), str(err)))
+            view_logger.error("BookEntityTreeView.renameEntity():{0}".format(str(err)))
 
     def refresh(self):
         try:
@@ -1680,13 +1731,13 @@ class BookEntityTreeView(QtWidgets.QTreeView):
                         if sub_thing.parent_cik == thing.cik:
                             thing.children.append(sub_thing)
                     thing.setChildren()
-                for thang in self.entity_items:
-                    if thang.parent_cik == None:
-                        self.model().appendRow(thang)
+                top_entity_items = [thang for thang in self.entity_items if thang.parent_cik == None]
+                if top_entity_items:
+                    self.model().invisibleRootItem().appendRows(top_entity_items)
             else:
                 pass
         except Exception as err:
-            view_logger.error("{0}:BookEntityTreeView.refresh():{1}".format(str(datetime.datetime.now()), str(err)))
+            view_logger.error("BookEntityTreeView.refresh():{0}".format(str(err)))
 
         return
 
@@ -1706,7 +1757,7 @@ class BookStatusBar(QtWidgets.QStatusBar):
     """
 
     def __init__(self, ui):
-        view_logger.info("{0}:Initializing BookStatusBar".format(str(datetime.datetime.now())))
+        view_logger.info("Initializing BookStatusBar")
         QtWidgets.QStatusBar.__init__(self)
         self.ui = ui
 
@@ -1716,7 +1767,7 @@ class BookStatusBar(QtWidgets.QStatusBar):
             super().showMessage(message, timeout)
             # QtWidgets.QStatusBar.showMessage(message, timeout)
         except Exception as err:
-            view_logger.error("{0}:BookStatusBar.showMessage():{1}".format(str(datetime.datetime.now()), str(err)))
+            view_logger.error("BookStatusBar.showMessage():{0}".format(str(err)))
 
         return
 
@@ -1738,7 +1789,7 @@ class BookTableView(QtWidgets.QTableView):
     """
 
     def __init__(self, parental_frame, book_main_window, graphic = None):
-        view_logger.info("{0}:Initializing BookTableView".format(str(datetime.datetime.now())))
+        view_logger.info("Initializing BookTableView")
         QtWidgets.QTableView.__init__(self)
         self.parental_frame = parental_frame
         self.book_main_window = book_main_window
@@ -1750,7 +1801,7 @@ class BookTableView(QtWidgets.QTableView):
         try:
             self.graphic.refreshGraphic()
         except Exception as err:
-            view_logger.error("{0}:BookTableView.refreshGraphic():{1}".format(str(datetime.datetime.now()), str(err)))
+            view_logger.error("BookTableView.refreshGraphic():{0}".format(str(err)))
 
         return
 
@@ -1770,7 +1821,7 @@ class BookNumericalGraphic(QtCharts.QChartView):
     """
 
     def __init__(self, book_table_view):
-        view_logger.info("{0}:Initializing BookNumericalGraphic".format(str(datetime.datetime.now())))
+        view_logger.info("Initializing BookNumericalGraphic")
         QtCharts.QChartView.__init__(self, book_table_view)
         self.book_table_view = book_table_view
         self.setRenderHint(QPainter.Antialiasing)
@@ -1781,7 +1832,7 @@ class BookNumericalGraphic(QtCharts.QChartView):
             self.chart().refreshGraphic()
             self.repaint()
         except Exception as err:
-            view_logger.error("{0}:BookNumericalGraphic.refreshGraphic():{1}".format(str(datetime.datetime.now()), str(err)))
+            view_logger.error("BookNumericalGraphic.refreshGraphic():{0}".format(str(err)))
 
         return
 
@@ -1803,7 +1854,7 @@ class BookNumericalChart(QtCharts.QChart):
     """
 
     def __init__(self, book_table_view):
-        view_logger.info("{0}:Initializing BookNumericalChart".format(str(datetime.datetime.now())))
+        view_logger.info("Initializing BookNumericalChart")
         QtCharts.QChart.__init__(self)
         self.book_table_view = book_table_view
         self.chart_type = self.book_table_view.book_main_window.pref.general_num_graph_type
@@ -1976,7 +2027,7 @@ class BookNumericalChart(QtCharts.QChart):
                     self.setAnimationOptions(QtCharts.QChart.NoAnimation)
                     self.legend().setVisible(False)
         except Exception as err:
-            view_logger.error("{0}:BookNumericalChart.refreshGraphic():{1}".format(str(datetime.datetime.now()), str(err)))
+            view_logger.error("BookNumericalChart.refreshGraphic():{0}".format(str(err)))
 
         return
 
@@ -1996,7 +2047,7 @@ class BookTextualGraphic(QtWidgets.QTextEdit):
     items_viewed (bool type); value depends on whether user has selected table rows for graphing
     """
     def __init__(self, book_table_view):
-        view_logger.info("{0}:Initializing BookTextualGraphic".format(str(datetime.datetime.now())))
+        view_logger.info("Initializing BookTextualGraphic")
         QtWidgets.QTextEdit.__init__(self)
         self.setReadOnly(True)
         self.book_table_view = book_table_view
@@ -2016,11 +2067,11 @@ class BookTextualGraphic(QtWidgets.QTextEdit):
                 try:
                     self.html = BookFilingUtility.decodeHtml(self.html_string)
                 except Exception as err:
-                    view_logger.error("{0}:BookTextualGraphic.refreshGraphic() inner:{1}".format(str(datetime.datetime.now()), str(err)))
+                    view_logger.error("BookTextualGraphic.refreshGraphic() inner:{0}".format(str(err)))
             self.setHtml(self.html)
             self.update()
             self.show()
         except Exception as err:
-            view_logger.error("{0}:BookTextualGraphic.refreshGraphic() outer:{1}".format(str(datetime.datetime.now()), str(err)))
+            view_logger.error("BookTextualGraphic.refreshGraphic() outer:{0}".format(str(err)))
 
         return